@@ -0,0 +1,207 @@
+"""Benchmark: per-config render cost of the line-list writer and the templates.
+
+Usage:
+    python benchmarks/bench_render.py [configs]
+"""
+
+import gc
+import os
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+)
+
+import opp_ini as oi  # noqa: E402
+
+
+def legacy_render(simulation):
+    """Builds the lines of a configuration the way set_new_configuration did."""
+    config_name = oi.set_configuration_name(simulation)
+
+    # ----------- Topology parameters ----------- #
+    network_name = simulation.topology.get_network()
+    topology_name = simulation.topology.get_name()
+    channel_distance = simulation.topology.get_channel_distance()
+
+    # Switch parameters
+    architecture = simulation.switch.get_architecture()
+    voq = simulation.switch.get_voq()
+    arbiter = simulation.switch.get_arbiter()
+    routing = simulation.switch.get_routing()
+    queue_scheme = simulation.switch.get_queue_scheme()
+    num_queues = simulation.switch.get_num_queues()
+
+    # ----- Configuration ----- #
+    lines = [
+        "[General]\n",
+        f"# Configuration: {config_name}\n",
+        f"network = {network_name}\n",
+        "\n",
+        "#warmup-period=0.00025s\n",
+        "\n",
+        "cmdenv-status-frequency = 5s\n",
+        "sim-time-limit = 0.002000001s\n",
+        "cmdenv-interactive=true\n",
+        "#Net\n",
+        f'**.topology = "{topology_name}"\n',
+    ]
+
+    match simulation.topology.get_network():
+        case "RLFT":
+            arity = str(simulation.topology.get_arity())
+            stages = str(simulation.topology.get_stages())
+
+            lines.append(f"**.arity = ${{arity={arity}}}\n")
+            lines.append(f"**.numStages = ${{numStages={stages}}}\n")
+            lines.append(
+                "**.numNodes = ${numNodes = int(2*pow(${arity},${numStages}))}\n"
+            )
+            lines.append("\n")
+        case "Torus2D":
+            dim0 = str(simulation.topology.get_dim1())
+            dim1 = str(simulation.topology.get_dim2())
+            lines.append(f"**.nD0 = ${{nD0={dim0}}}\n")
+            lines.append(f"**.nD1 = ${{nD1={dim1}}}\n")
+            lines.append(f"**.nodesInEachDim = ${{{dim0}}} ${{{dim1}}}\n")
+            lines.append("**.numNodes = ${numNodes=${nD0}*${nD1}}\n")
+            lines.append("\n")
+
+    lines.append(f"**.channelDistance = {channel_distance}m\n")
+    lines.append("\n")
+    lines.append("#Routing and Arbitration\n")
+    lines.append(f'**.routingAlgorithm = "{routing}"\n')
+    lines.append('**.H[*].arbiter.typename = "Arbiter_TwoPhased"\n')
+    lines.append(f'**.SW[*].arbiter.typename = "{arbiter}"\n')
+    lines.append("**.requestProcessingTime = 6ns")
+    lines.append("\n")
+    lines.append("\n")
+    lines.append("#Logging\n")
+    lines.append("**.logInterval = 10us\n")
+    lines.append("\n")
+    lines.append(
+        "**.sysMng.**.result-recording-modes = default, +vector,+histogram\n"
+    )
+    lines.append(
+        "**.sys.app*-**.result-recording-modes = default, +vector,+histogram\n"
+    )
+    lines.append("\n")
+    lines.append(
+        "# Stats to record per node - we have to indicate the stat that we want to recollect\n"
+    )
+    lines.append("#**.H[127].throughput.\n")
+    lines.append("**.H[*].**.scalar-recording = false\n")
+    lines.append("**.SW[*].**.scalar-recording = false\n")
+    lines.append("**.param-recording = false\n")
+    lines.append("\n")
+    lines.append("# Queueing scheme\n")
+    lines.append(f'**.congestionControlTechnique = "{queue_scheme}"\n')
+    lines.append(f"**.numQueues = {num_queues}\n")
+    lines.append("\n")
+    lines.append("#Port Configurations\n")
+    lines.append("include ../TrafficConfigurations/PortPFC.ini\n")
+    lines.append("include ../TrafficConfigurations/originalPort.ini\n")
+    lines.append("\n")
+    lines.append("\n")
+    lines.append("# Port configuration for IQ switch\n")
+    lines.append(
+        "[Config portConfig] #Note that the config included extends from General and portConfig, change the next extend to test other technologies\n"
+    )
+    lines.append("#IB-NDR = IQ\n")
+    lines.append("#BXI3 = CIOQ\n")
+    lines.append(f"extends={architecture}	# CIOQ\n")
+    lines.append("\n")
+    lines.append("#Queuing schemes configurations\n")
+    lines.append("include ../TrafficConfigurations/indirect/schemes.ini\n")
+    lines.append("\n")
+    lines.append("#Traffic generation modes\n")
+    lines.append("include ../TrafficConfigurations/indirect/random.ini\n")
+    lines.append("include ../TrafficConfigurations/indirect/hotspot.ini\n")
+    lines.append("include ../TrafficConfigurations/indirect/victim.ini\n")
+    lines.append("include ../TrafficConfigurations/indirect/local.ini\n")
+    lines.append("include ../TrafficConfigurations/indirect/storage.ini\n")
+    lines.append("include ../TrafficConfigurations/indirect/ebb.ini\n")
+    lines.append("include ../TrafficConfigurations/indirect/ebb_hs.ini\n")
+    lines.append("include ../TrafficConfigurations/indirect/zipf1.ini\n")
+    lines.append("include ../TrafficConfigurations/indirect/sla3.ini\n")
+    lines.append("include ../TrafficConfigurations/indirect/ptrans.ini\n")
+    lines.append("include ../TrafficConfigurations/indirect/natRing.ini\n")
+    lines.append("include ../TrafficConfigurations/indirect/graph500.ini\n")
+    lines.append("\n")
+
+    return lines
+
+
+def make_simulations(count):
+    simulations = []
+    for idx in range(count):
+        simulation = oi.Simulation()
+        simulation.set_topo(oi.RLFT())
+        simulation.topology.set_nodes(2 + idx % 8, 2 + idx % 3)
+        simulation.set_sw(oi.IB_NDR())
+        simulation.switch.set_arbiter("WRR")
+        simulation.switch.set_queue_scheme("voqsw")
+        simulation.switch.set_num_queues(1 + idx % 8)
+        simulations.append(simulation)
+    return simulations
+
+
+def bench(label, function, simulations, repeat=3):
+    gc.collect()
+    gc.disable()
+    try:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for simulation in simulations:
+                function(simulation)
+            timings.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+    elapsed = min(timings)
+    print(
+        f"{label:<28} {elapsed:8.3f} s  "
+        f"{elapsed / len(simulations) * 1e6:8.2f} us/config"
+    )
+
+
+def write_legacy(simulation):
+    with open(simulation.root_dir + "/omnetpp.ini", "w") as file:
+        file.writelines(legacy_render(simulation))
+
+
+def write_template(simulation):
+    oi.write_chunks(
+        simulation.root_dir + "/omnetpp.ini",
+        oi.render_configuration(simulation),
+    )
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    simulations = make_simulations(min(count, 1000))
+    simulations = (simulations * (count // len(simulations) + 1))[:count]
+
+    sample = simulations[0]
+    # The templates also write the configuration hash
+    assert "".join(legacy_render(sample)).encode() == re.sub(
+        rb"# Hash: \w+\n", b"", b"".join(oi.render_configuration(sample))
+    )
+
+    print(f"Rendering {count} configurations")
+    bench("render: line list", legacy_render, simulations)
+    bench("render: templates", oi.render_configuration, simulations)
+
+    root_dir = tempfile.mkdtemp()
+    for simulation in simulations[:10000]:
+        simulation.root_dir = root_dir
+    print(f"Rendering and writing {min(count, 10000)} configurations")
+    bench("write: writelines", write_legacy, simulations[:10000])
+    bench("write: templates + writev", write_template, simulations[:10000])
+
+
+if __name__ == "__main__":
+    main()
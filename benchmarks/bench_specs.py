@@ -0,0 +1,84 @@
+"""Benchmark: memory and construction cost of Simulation and SimulationSpec.
+
+Usage:
+    python benchmarks/bench_specs.py [objects]
+"""
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+)
+
+import opp_ini as oi  # noqa: E402
+
+
+def make_simulation(index):
+    simulation = oi.Simulation()
+    topology = oi.RLFT()
+    topology.set_nodes(2 + index % 8, 2 + index % 3)
+    simulation.set_topo(topology)
+    switch = oi.IB_NDR()
+    switch.set_arbiter("WRR")
+    switch.set_queue_scheme("voqsw")
+    switch.set_num_queues(1 + index % 16)
+    simulation.set_sw(switch)
+    simulation.app.set_load(0, 100, 10)
+    return simulation
+
+
+def make_spec(index):
+    return oi.SimulationSpec(
+        oi.TopologySpec(
+            "RLFT",
+            "rlft",
+            5,
+            2 * (2 + index % 8) ** (2 + index % 3),
+            2 + index % 8,
+            2 + index % 3,
+        ),
+        oi.SwitchSpec("IB_NDR", "WRR", False, "voqsw", 1 + index % 16),
+        oi.ApplicationSpec(initial_load=0, final_load=100, steps=10),
+    )
+
+
+def bench(label, factory, count):
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        objects = [factory(index) for index in range(count)]
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        objects = [factory(index) for index in range(count)]
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        del objects
+        gc.collect()
+        teardown = time.perf_counter() - start
+    finally:
+        gc.enable()
+    print(
+        f"{label:<18} {elapsed / count * 1e6:8.2f} us/object  "
+        f"{size / count:8.0f} B/object  "
+        f"{teardown / count * 1e6:8.2f} us/object teardown"
+    )
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print(f"Building {count} simulations")
+    bench("Simulation", make_simulation, count)
+    bench("SimulationSpec", make_spec, count)
+    bench("Simulation.freeze", lambda i: make_simulation(i).freeze(), count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5962 @@
+"""opp_ini - Tools for managing the OMNet++ configuration configuration file."""
+
+__version__ = "0.1.0"
+
+import functools
+import hashlib
+import itertools
+import json
+import math
+import operator
+import os
+import re
+import shutil
+import threading
+import time
+import zlib
+
+# Data structures
+from array import array
+from collections import OrderedDict
+from enum import Enum
+from typing import NamedTuple
+
+# Concurrency
+from concurrent.futures import ProcessPoolExecutor
+
+# Appearance
+# from pprint import pprint
+
+# Optional
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# ----- Constants ----- #
+BACKUP_DIR = ".backups"
+# SAURON_ROOT = os.environ["SAURON_ROOT"]
+
+try:
+    SAURON_ROOT = os.environ["SAURON_ROOT"]
+except KeyError:
+    SAURON_ROOT = None
+    if __name__ == "__main__":
+        raise RuntimeError("SAURON_ROOT is required to run this program.")
+
+
+# ----- Classes ----- #
+
+
+# Base
+
+
+class Simulation:
+    """A class representing a simulation.
+
+    This class provides functionality to add/remove configuration parameters in the omnetpp.ini file.
+    It holds instances of interconnection network elements (topology, switch, application).
+
+    Attributes:
+        root_dir (str): Path to the root of the simulation within the SAURON file system.
+        topology (Topology): Topology to be simulated.
+        switch (Switch): Switch to be simulated.
+        app (Application): Application to be simulated.
+    """
+
+    def __init__(self):
+        """Initializes the Simulation with default values."""
+        self.root_dir = ""
+        self.topology = Topology()
+        self.switch = Switch()
+        self.app = Application()
+
+    # ----- Setters ----- #
+
+    def set_root_dir(self, topology_name: str):
+        """
+        Sets the root directory of the simulation.
+
+        Args:
+            topology_name (str): The name of the topology to be simulated.
+        """
+        self.root_dir = SAURON_ROOT + "/simulations/" + topology_name
+
+    def set_topo(self, topo: "Topology"):
+        """
+        Sets the topology.
+
+        Args:
+            topo (Topology): The object containing topology parameters.
+        """
+        self.topology = topo
+
+    def set_sw(self, sw: "Switch"):
+        """
+        Sets the switch.
+
+        Args:
+            sw (Switch): The object containing switch parameters.
+        """
+        self.switch = sw
+
+    def set_app(self, app: "Application"):
+        """
+        Sets the application.
+
+        Args:
+            app (Application): The object containing application parameters.
+        """
+        self.app = app
+
+    ###########
+    # Getters
+    ###########
+    def get_root_dir(self) -> str:
+        """
+        Gets the root directory of the simulation.
+
+        Returns:
+            str: The name of the root directory of the simulation.
+        """
+        return self.root_dir
+
+    def freeze(self) -> "SimulationSpec":
+        """
+        Takes an immutable, hashable snapshot of the simulation.
+
+        Returns:
+            SimulationSpec: The snapshot.
+        """
+        return SimulationSpec.from_simulation(self)
+
+
+class Topology:
+    """A class representing a topology in a simulation.
+
+    This class provides functionality to add/remove topology parameters.
+
+    Attributes:
+        name (str): Name of the topology.
+        network (str): Name of the simulation folder the omnetpp_ini file is located.
+        channel_distance (int): Distance of the channels in the topology.
+        nodes (int): The number of nodes that the topology contains.
+    """
+
+    def __init__(self):
+        """Initializes the topology with default values."""
+        self.name = "rlft"
+        self.network = "RLFT"
+        self.channel_distance = 5
+        self.nodes = 0
+
+    ###########
+    # Setters
+    ###########
+    def set_channel_distance(self, distance: int):
+        """
+        Sets the distance of the channels.
+
+        Args:
+            distance (int): The distance in meters.
+        """
+        self.channel_distance = distance
+
+    ###########
+    # Getters
+    ###########
+    def get_name(self) -> str:
+        """
+        Gets the name of the topology.
+
+        Returns:
+            str: The name of the topology.
+        """
+        return self.name
+
+    def get_channel_distance(self) -> int:
+        """
+        Gets the distance of the channels.
+
+        Returns:
+            int: The distance of the channels.
+        """
+        return self.channel_distance
+
+    def get_network(self) -> str:
+        """
+        Gets the name of the network.
+
+        Returns:
+            str: The name of the network.
+        """
+        return self.network
+
+    def get_nodes(self) -> int:
+        """
+        Gets the number of nodes.
+
+        Returns:
+            int: The number of nodes.
+        """
+        return self.nodes
+
+
+class Switch:
+    """A class representing a switch in a simulation.
+
+    This class provides functionality to add/remove switch parameters.
+
+    Attributes:
+        architecture (str): Architecture of the switch.
+        arbiter (str): Arbiter used by the switch.
+        voq (bool): Whether the switch uses VOQs or not.
+        queue_scheme (str): Queue scheme used in the switch.
+        bubble (bool): Whether the switch uses bubble or not.
+        request_processing_time (int): Time it takes the switch to process requests.
+    """
+
+    # Class attributes
+    def __init__(self):
+        """Initializes the switch with default values."""
+        self.architecture = "IB_DDR"
+        self.arbiter = "Arbiter_TwoPhased"
+        self.voq = False
+        self.queue_scheme = "1q"
+        self.num_queues = 1
+        self.routing = "xy"
+        self.bubble = False
+        self.request_processing_time = 6  # in nanoseconds
+
+    # ----- Setters ----- #
+
+    def set_architecture(self, architecture: str):
+        """
+        Sets the architecture of the switch.
+
+        Args:
+            architecture (str): Architecture of the switch
+        """
+        self.architecture = architecture
+
+    def set_arbiter(self, arbiter: str):
+        """
+        Sets the arbiter of the switch.
+
+        Args:
+            architecture (str): Architecture of the switch.
+        """
+        self.arbiter = arbiter
+
+    def set_voq(self, voq: bool):
+        """
+        Sets if VOQs are active.
+
+        Args:
+            voq (bool): True if active, False if inactive.
+        """
+        self.voq = voq
+
+    def set_queue_scheme(self, queue_scheme: str):
+        """
+        Sets queueing scheme.
+
+        Args:
+            queue_scheme (str): Queue scheme.
+        """
+        self.queue_scheme = queue_scheme
+
+    def set_num_queues(self, num_queues: int):
+        """
+        Sets the number of queues of the queueing scheme.
+
+        Args:
+            num_queues (str): Number of queues.
+        """
+        self.num_queues = num_queues
+
+    def set_routing(self, routing: str):
+        """
+        Sets the routing algorithm of the switch.
+
+        Args:
+            routing (str): Routing algorithm.
+        """
+        self.routing = routing
+
+    def set_bubble(self, bubble: bool):
+        """
+        Sets the bubbles.
+
+        Args:
+            bubble (bool): True if active, False if inactive.
+        """
+        self.bubble = bubble
+
+    def set_request_processing_time(self, request_processing_time: int):
+        """
+        Sets the request processing time.
+
+        Args:
+            request_processing_time (int): Time it takes the switch to process each request.
+        """
+        self.request_processing_time = request_processing_time
+
+    # ----- Getters ----- #
+
+    def get_architecture(self) -> str:
+        """
+        Gets the name of the switch architecture.
+
+        Returns:
+            str: Name of the switch architecture.
+        """
+        return self.architecture
+
+    def get_arbiter(self) -> str:
+        """
+        Gets the name of the switch arbiter.
+
+        Returns:
+            str: Name of the switch arbiter.
+        """
+        return self.arbiter
+
+    def get_voq(self) -> bool:
+        """
+        Checks if VOQs are active.
+
+        Returns:
+            bool: True if active, False if inactive.
+        """
+        return self.voq
+
+    def get_queue_scheme(self) -> str:
+        """
+        Gets the queue scheme.
+
+        Returns:
+            str: Name of the switch queue scheme.
+        """
+        return self.queue_scheme
+
+    def get_num_queues(self) -> int:
+        """
+        Gets the number of queues used by the queue scheme.
+
+        Returns:
+            int: Number of queues in the queue scheme.
+        """
+        return self.num_queues
+
+    def get_routing(self) -> str:
+        """
+        Gets the name of the routing algorithm used by the switch.
+
+        Returns:
+            str: Name of the switch routing algorithm.
+        """
+        return self.routing
+
+    def get_bubble(self) -> bool:
+        """
+        Checks if bubble is active.
+
+        Returns:
+            bool: True if active, False if inactive.
+        """
+        return self.bubble
+
+    def get_request_processing_time(self) -> int:
+        """
+        Gets the request processing time of the switch.
+
+        Returns:
+            int: Time it takes the switch to process a request.
+        """
+        return self.request_processing_time
+
+
+class Application:
+    """A class representing an application in a simulation.
+
+    This class provides functionality to add/remove application parameters.
+
+    Attributes:
+        name (str): Name of the application.
+        message_size (int): Size of the message.
+        initial_load (int): Initial load of the simulation, if steps is greater than one.
+        final_load (int): Final load of he simulation, if steps is greater than one.
+        steps (int): Number of steps performed during the simulations, with increasing load.
+        file_name (str): Type of application.
+    """
+
+    def __init__(self):
+        """Initializes the application with default values."""
+        self.name = "Application"
+        self.message_size = 0
+        self.initial_load = 0
+        self.final_load = 0
+        self.steps = 0
+        self.file_name = "R"
+
+    # ----- Setters ----- #
+
+    def set_message_size(self, msg_size: int):
+        """
+        Sets the size of the messages sent by the application.
+
+        Args:
+            msg_size (int): Size of the message.
+        """
+        self.message_size = msg_size
+
+    def set_load(self, initial=0, final=100, steps=0):
+        """
+        Sets the loads of the application.
+
+        Args:
+            initial (int): Initial load.
+            final (int): Final load.
+            steps (int): Number of steps.
+        """
+        self.initial_load = initial
+        self.final_load = final
+        self.steps = steps
+
+    def set_filename(self, filename: str):
+        """
+        Sets the type of application.
+
+        Args:
+            filename (str): Type of application.
+        """
+        self.file_name = filename
+
+    # ----- Getters ----- #
+
+    def get_name(self) -> str:
+        """
+        Gets the name of the application.
+
+        Returns:
+            str: Name of the application.
+        """
+        return self.name
+
+    def get_msg_size(self) -> int:
+        """
+        Gets the size of the message sent by the application.
+
+        Returns:
+            str: Message size of the application.
+        """
+        return self.message_size
+
+    def get_initial_load(self) -> int:
+        """
+        Gets the initial load of the simulation.
+
+        Returns:
+            int: Initial load.
+        """
+        return self.initial_load
+
+    def get_final_load(self) -> int:
+        """
+        Gets the final load of the simulation.
+
+        Returns:
+            int: Final load.
+        """
+        return self.final_load
+
+    def get_steps(self) -> int:
+        """
+        Gets the steps that will be perform during the simulation.
+
+        Returns:
+            int: Steps to be performed during the simulation.
+        """
+        return self.steps
+
+    def get_filename(self) -> str:
+        """
+        Gets the type of application.
+
+        Returns:
+            str: Type of application.
+        """
+        return self.file_name
+
+
+# Derived from Topology
+
+
+class RLFT(Topology):
+    """A class representing a RLFT topology.
+
+    This class provides functionality to add/remove RLFT-specific parameters.
+
+    Attributes:
+        name (str): Name of the topology.
+        network (str): Name of the simulation folder the omnetpp_ini file is located.
+        channel_distance (int): Distance of the channels in the topology.
+        arity (int): Half of the number of ports of the switch.
+        stages (int): Number of staes of the network.
+        nodes (int): The number of nodes that the topology contains.
+    """
+
+    def __init__(self, parent=None):
+        """Initializes the RLFT topology with default values."""
+        super().__init__()
+        self.parent = parent
+        self.name = "rlft"
+        self.network = "RLFT"
+        self.arity = 0
+        self.stages = 0
+        self.nodes = 0
+
+    # ----- Setters ----- #
+
+    def set_arity(self, arity: int):
+        """
+        Sets the arity of the RLFT network.
+
+        Args:
+            arity (int): Arity of the network.
+        """
+        self.arity = arity
+        self.set_nodes(self.arity, self.stages)
+
+    def set_stages(self, stages: int):
+        """
+        Sets the number of stages of the RLFT network.
+
+        Args:
+            stages (int): Number of stages of the network.
+        """
+        self.stages = stages
+        self.set_nodes(self.arity, self.stages)
+
+    def set_nodes(self, arity: int, stages: int):
+        """
+        Sets the number of nodes of the RLFT network.
+
+        Args:
+            arity (int): Arity of the network.
+            stages (int): Number of stages of the network.
+        """
+        self.arity = arity
+        self.stages = stages
+        self.nodes = 2 * (pow(arity, stages))
+
+    # ----- Getters ----- #
+
+    def get_arity(self) -> int:
+        """
+        Gets the arity of the RLFT network.
+
+        Returns:
+            int: Arity of the network.
+        """
+        return self.arity
+
+    def get_stages(self) -> int:
+        """
+        Gets the number of stages of the RLFT network.
+
+        Returns:
+            int: Number of stages of the network.
+        """
+        return self.stages
+
+    def get_nodes(self) -> int:
+        """
+        Gets the number of nodes of the RLFT network.
+
+        Returns:
+            int: Number of nodes of the network.
+        """
+        return self.nodes
+
+
+class Torus(Topology):
+    """A class representing a Torus topology.
+
+    This class provides functionality to add/remove Torus-specific parameters.
+
+    Attributes:
+        name (str): Name of the topology.
+        dimensions (int): The number of dimensions that the topology contains.
+    """
+
+    def __init__(self, parent=None):
+        """Initializes the Torus topology with default values"""
+        super().__init__()
+        self.parent = parent
+        self.name = "torus"
+        self.dimensions = 0
+
+    def get_dimensions(self) -> int:
+        """
+        Gets the number of dimensions of the torus network.
+
+        Returns:
+            int: Number of dimensions of the torus.
+        """
+        return self.dimensions
+
+
+class Torus2D(Torus):
+    """A class representing a Torus2D topology.
+
+    This class provides functionality to add/remove Torus2D-specific parameters.
+
+    Attributes:
+        network (str): Network name.
+        dim1 (int): Size of dimension 1.
+        dim2 (int): Size of dimension 2.
+    """
+
+    def __init__(self, parent=None):
+        """Initializes the torus2D network with default values."""
+        super().__init__()
+        self.parent = parent
+        self.network = "Torus2D"
+        self.dim1 = 0
+        self.dim2 = 0
+
+    # ----- Setters ----- #
+
+    def set_dim1(self, dim1: int):
+        """
+        Sets the size of dimension 1 of the Torus2D network.
+
+        Args:
+            dim1 (int): Size of the dimension 1.
+        """
+        self.dim1 = dim1
+        self.set_nodes(self.dim1, self.dim2)
+
+    def set_dim2(self, dim2: int):
+        """
+        Sets the size of dimension 2 of the Torus2D network.
+
+        Args:
+            dim2 (int): Size of the dimension 2.
+        """
+        self.dim2 = dim2
+        self.set_nodes(self.dim1, self.dim2)
+
+    def set_nodes(self, dim1: int, dim2: int):
+        """
+        Sets the number of nodes of the Torus2D network.
+
+        Args:
+            dim1 (int): Size of the dimension 1.
+            dim2 (int): Size of the dimension 2.
+        """
+        self.nodes = dim1 * dim2
+
+    # ----- Getters ----- #
+
+    def get_dim1(self) -> int:
+        """
+        Gets the size of dimension 1 of the Torus2D network.
+
+        Returns:
+            int: Size of dimension 1 of the Torus2D.
+        """
+        return self.dim1
+
+    def get_dim2(self) -> int:
+        """
+        Gets the size of dimension 2 of the Torus2D network.
+
+        Returns:
+            int: Size of dimension 2 of the Torus2D.
+        """
+        return self.dim2
+
+    def get_nodes(self) -> int:
+        """
+        Gets the number of nodes of the Torus2D network.
+
+        Returns:
+            int: Size of dimension 1 of the Torus2D.
+        """
+        return self.nodes
+
+
+# Derived from Switch
+
+
+class IB_NDR(Switch):
+    """A class representing an IB_NDR switch in a simulation.
+
+    This class provides functionality to add/remove IB_NDR switch parameters.
+
+    Attributes:
+        architecture (str): Architecture of the switch.
+    """
+
+    def __init__(self, parent=None):
+        """Initializes the IB_NDR switch with default values."""
+        super().__init__()
+        self.parent = parent
+        self.architecture = "IB_NDR"
+
+
+class BXI3(Switch):
+    """A class representing an IB_NDR switch in a simulation.
+
+    This class provides functionality to add/remove IB_NDR switch parameters.
+
+    Attributes:
+        architecture (str): Architecture of the switch.
+    """
+
+    def __init__(self, parent=None):
+        """Initializes the BXI3 switch with default values."""
+        super().__init__()
+        self.parent = parent
+        self.architecture = "BXI3"
+
+
+# Derived from Application
+class Synthetic(Application):
+    """
+    This class represents a synthetic application
+    It has attributes and methods common to every synthetic application
+    It is derived from a generic application
+    It is the base class of other more specific synthetic applications
+
+    :param Application: the parent application class
+    """
+
+    def __init__(self, parent=None):
+        super().__init__()
+        self.parent = parent
+        self.name = "SyntheticApplication"
+
+
+# Value types
+
+
+class TopologySpec(NamedTuple):
+    """An immutable, hashable snapshot of a Topology.
+
+    Attributes:
+        network (str): Name of the network, e.g. ``RLFT`` or ``Torus2D``.
+        name (str): Name of the topology.
+        channel_distance (int): Distance of the channels in the topology.
+        nodes (int): The number of nodes that the topology contains.
+        arity (int): Arity of a RLFT network, 0 otherwise.
+        stages (int): Number of stages of a RLFT network, 0 otherwise.
+        dim1 (int): Size of dimension 1 of a Torus2D network, 0 otherwise.
+        dim2 (int): Size of dimension 2 of a Torus2D network, 0 otherwise.
+    """
+
+    network: str = "RLFT"
+    name: str = "rlft"
+    channel_distance: int = 5
+    nodes: int = 0
+    arity: int = 0
+    stages: int = 0
+    dim1: int = 0
+    dim2: int = 0
+
+    @classmethod
+    def from_topology(cls, topology: "Topology") -> "TopologySpec":
+        """
+        Takes a snapshot of a topology.
+
+        Args:
+            topology (Topology): The topology.
+
+        Returns:
+            TopologySpec: The snapshot.
+        """
+        return cls(
+            topology.network,
+            topology.name,
+            topology.channel_distance,
+            topology.nodes,
+            getattr(topology, "arity", 0),
+            getattr(topology, "stages", 0),
+            getattr(topology, "dim1", 0),
+            getattr(topology, "dim2", 0),
+        )
+
+    def to_topology(self) -> "Topology":
+        """
+        Builds a mutable topology with the same parameters.
+
+        Returns:
+            Topology: A RLFT, a Torus2D or a generic Topology.
+        """
+        if self.network == "RLFT":
+            topology = RLFT()
+            topology.set_nodes(self.arity, self.stages)
+        elif self.network == "Torus2D":
+            topology = Torus2D()
+            topology.dim1 = self.dim1
+            topology.dim2 = self.dim2
+        else:
+            topology = Topology()
+            topology.network = self.network
+        topology.name = self.name
+        topology.channel_distance = self.channel_distance
+        topology.nodes = self.nodes
+        return topology
+
+    def get_name(self) -> str:
+        """Gets the name of the topology."""
+        return self.name
+
+    def get_network(self) -> str:
+        """Gets the name of the network."""
+        return self.network
+
+    def get_channel_distance(self) -> int:
+        """Gets the distance of the channels."""
+        return self.channel_distance
+
+    def get_nodes(self) -> int:
+        """Gets the number of nodes."""
+        return self.nodes
+
+    def get_arity(self) -> int:
+        """Gets the arity of the RLFT network."""
+        return self.arity
+
+    def get_stages(self) -> int:
+        """Gets the number of stages of the RLFT network."""
+        return self.stages
+
+    def get_dim1(self) -> int:
+        """Gets the size of dimension 1 of the Torus2D network."""
+        return self.dim1
+
+    def get_dim2(self) -> int:
+        """Gets the size of dimension 2 of the Torus2D network."""
+        return self.dim2
+
+
+class SwitchSpec(NamedTuple):
+    """An immutable, hashable snapshot of a Switch.
+
+    Attributes:
+        architecture (str): Architecture of the switch.
+        arbiter (str): Arbiter used by the switch.
+        voq (bool): Whether the switch uses VOQs or not.
+        queue_scheme (str): Queue scheme used in the switch.
+        num_queues (int): Number of queues of the queue scheme.
+        routing (str): Routing algorithm.
+        bubble (bool): Whether the switch uses bubble or not.
+        request_processing_time (int): Time it takes the switch to process requests.
+    """
+
+    architecture: str = "IB_DDR"
+    arbiter: str = "Arbiter_TwoPhased"
+    voq: bool = False
+    queue_scheme: str = "1q"
+    num_queues: int = 1
+    routing: str = "xy"
+    bubble: bool = False
+    request_processing_time: int = 6
+
+    @classmethod
+    def from_switch(cls, switch: "Switch") -> "SwitchSpec":
+        """
+        Takes a snapshot of a switch.
+
+        Args:
+            switch (Switch): The switch.
+
+        Returns:
+            SwitchSpec: The snapshot.
+        """
+        return cls(
+            switch.architecture,
+            switch.arbiter,
+            switch.voq,
+            switch.queue_scheme,
+            switch.num_queues,
+            switch.routing,
+            switch.bubble,
+            switch.request_processing_time,
+        )
+
+    def to_switch(self) -> "Switch":
+        """
+        Builds a mutable switch with the same parameters.
+
+        Returns:
+            Switch: An IB_NDR, a BXI3 or a generic Switch.
+        """
+        if self.architecture == "IB_NDR":
+            switch = IB_NDR()
+        elif self.architecture == "BXI3":
+            switch = BXI3()
+        else:
+            switch = Switch()
+            switch.set_architecture(self.architecture)
+        switch.arbiter = self.arbiter
+        switch.voq = self.voq
+        switch.queue_scheme = self.queue_scheme
+        switch.num_queues = self.num_queues
+        switch.routing = self.routing
+        switch.bubble = self.bubble
+        switch.request_processing_time = self.request_processing_time
+        return switch
+
+    def get_architecture(self) -> str:
+        """Gets the architecture of the switch."""
+        return self.architecture
+
+    def get_arbiter(self) -> str:
+        """Gets the arbiter of the switch."""
+        return self.arbiter
+
+    def get_voq(self) -> bool:
+        """Gets whether the switch uses VOQs."""
+        return self.voq
+
+    def get_queue_scheme(self) -> str:
+        """Gets the queue scheme of the switch."""
+        return self.queue_scheme
+
+    def get_num_queues(self) -> int:
+        """Gets the number of queues of the switch."""
+        return self.num_queues
+
+    def get_routing(self) -> str:
+        """Gets the routing algorithm of the switch."""
+        return self.routing
+
+    def get_bubble(self) -> bool:
+        """Gets whether the switch uses bubble."""
+        return self.bubble
+
+    def get_request_processing_time(self) -> int:
+        """Gets the request processing time of the switch."""
+        return self.request_processing_time
+
+
+class ApplicationSpec(NamedTuple):
+    """An immutable, hashable snapshot of an Application.
+
+    Attributes:
+        name (str): Name of the application.
+        message_size (int): Size of the message.
+        initial_load (int): Initial load of the simulation.
+        final_load (int): Final load of the simulation.
+        steps (int): Number of loads simulated, from initial_load to
+            final_load.
+        file_name (str): Type of application.
+    """
+
+    name: str = "Application"
+    message_size: int = 0
+    initial_load: int = 0
+    final_load: int = 0
+    steps: int = 0
+    file_name: str = "R"
+
+    @classmethod
+    def from_application(cls, app: "Application") -> "ApplicationSpec":
+        """
+        Takes a snapshot of an application.
+
+        Args:
+            app (Application): The application.
+
+        Returns:
+            ApplicationSpec: The snapshot.
+        """
+        return cls(
+            app.name,
+            app.message_size,
+            app.initial_load,
+            app.final_load,
+            app.steps,
+            app.file_name,
+        )
+
+    def to_application(self) -> "Application":
+        """
+        Builds a mutable application with the same parameters.
+
+        Returns:
+            Application: The application.
+        """
+        app = (
+            Synthetic()
+            if self.name == "SyntheticApplication"
+            else (Application())
+        )
+        app.name = self.name
+        app.set_message_size(self.message_size)
+        app.set_load(self.initial_load, self.final_load, self.steps)
+        app.set_filename(self.file_name)
+        return app
+
+    def get_name(self) -> str:
+        """Gets the name of the application."""
+        return self.name
+
+    def get_msg_size(self) -> int:
+        """Gets the size of the messages."""
+        return self.message_size
+
+    def get_initial_load(self) -> int:
+        """Gets the initial load."""
+        return self.initial_load
+
+    def get_final_load(self) -> int:
+        """Gets the final load."""
+        return self.final_load
+
+    def get_steps(self) -> int:
+        """Gets the number of loads simulated."""
+        return self.steps
+
+    def get_filename(self) -> str:
+        """Gets the type of application."""
+        return self.file_name
+
+
+class SimulationSpec(NamedTuple):
+    """An immutable, hashable snapshot of a Simulation.
+
+    Specs compare and hash by value, so they can key memoization tables,
+    and the functions that read a Simulation (naming, rendering, hashing)
+    accept them as well.
+
+    Attributes:
+        topology (TopologySpec): Topology to be simulated.
+        switch (SwitchSpec): Switch to be simulated.
+        app (ApplicationSpec): Application to be simulated.
+        root_dir (str): Path to the root of the simulation.
+    """
+
+    topology: TopologySpec = TopologySpec()
+    switch: SwitchSpec = SwitchSpec()
+    app: ApplicationSpec = ApplicationSpec()
+    root_dir: str = ""
+
+    @classmethod
+    def from_simulation(cls, simulation: "Simulation") -> "SimulationSpec":
+        """
+        Takes a snapshot of a simulation.
+
+        Args:
+            simulation (Simulation): The simulation.
+
+        Returns:
+            SimulationSpec: The snapshot.
+        """
+        if isinstance(simulation, SimulationSpec):
+            return simulation
+        return cls(
+            TopologySpec.from_topology(simulation.topology),
+            SwitchSpec.from_switch(simulation.switch),
+            ApplicationSpec.from_application(simulation.app),
+            simulation.root_dir,
+        )
+
+    def to_simulation(self) -> "Simulation":
+        """
+        Builds a mutable simulation with the same parameters.
+
+        Returns:
+            Simulation: The simulation.
+        """
+        simulation = Simulation()
+        simulation.root_dir = self.root_dir
+        simulation.set_topo(self.topology.to_topology())
+        simulation.set_sw(self.switch.to_switch())
+        simulation.set_app(self.app.to_application())
+        return simulation
+
+    def get_root_dir(self) -> str:
+        """Gets the root directory of the simulation."""
+        return self.root_dir
+
+
+# Enum
+
+
+class Topologies(Enum):
+    DragonflyAbsolute = 1
+    DragonflyCircular = 2
+    DragonflyHammingGraph = 3
+    DragonflyPalmTree = 4
+    FatXaryXtree = 5
+    Hypercube = 6
+    KNSXary2direct1indirect = 7
+    KNSXary2directXindirect = 8
+    KNSXary3direct1indirect = 9
+    Megafly_topgen = 10
+    Mesh2D = 11
+    Mesh3D = 12
+    Mesh4D = 13
+    NHosts1Switch = 14
+    NHosts2Switches = 15
+    PGFT = 16
+    PGFT_Cell = 17
+    RLFT = 18
+    RLFT_tables = 19
+    ShuffleXstageXexchange = 20
+    SlimFly = 21
+    Torus2D = 22
+    Torus3D = 23
+    Torus3D_Energy = 24
+
+
+class SwArchs(Enum):
+    # Input Queue (IQ)
+    IB_QDR = 1
+    IB_DDR = 2
+    IB_EDR = 3
+    IB_NDR = 4
+    # Combined Input-Output Queue (CIOQ)
+    PORT_PFC = 5
+    BXI3 = 6
+    BXI3_JESUS = 7
+
+
+class SwArbiters(Enum):
+    # Input Queue (IQ)
+    Aging = 1
+    WRR = 2
+    RR = 3
+
+
+class Applications(Enum):
+    S = 1  # Synthetic
+
+
+class CongestionTechniques(Enum):
+    oneq = 1
+    voqnet = 2
+    voqsw = 3
+    obqa = 4
+    flow2sl = 5
+    dbbm = 6
+    bbq = 7
+    vftree = 8
+    xflow2sl = 9
+
+
+class RoutingAlgorithms(Enum):
+    destro = 1
+
+
+# Parsing
+
+
+class IniEntry:
+    """A class representing a ``key = value`` line of an omnetpp.ini file.
+
+    Attributes:
+        key (str): Key of the entry, e.g. ``**.routingAlgorithm``.
+        value (str): Value of the entry, without the trailing comment.
+        comment (str): Trailing comment of the entry, without the ``#``.
+        section (str): Name of the section the entry belongs to.
+        path (str): Path of the file the entry was read from.
+        lineno (int): Line number (1-based) of the entry.
+        end_lineno (int): Last line number of the entry (continuation lines).
+        value_span (tuple): Start and end columns of the value in the line.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        value: str,
+        comment: str = "",
+        section: str = "General",
+        path: str = "",
+        lineno: int = 0,
+        end_lineno: int = 0,
+        value_span: tuple = None,
+    ):
+        """Initializes the entry."""
+        self.key = key
+        self.value = value
+        self.comment = comment
+        self.section = section
+        self.path = path
+        self.lineno = lineno
+        self.end_lineno = end_lineno or lineno
+        self.value_span = value_span
+
+    def __repr__(self) -> str:
+        return (
+            f"IniEntry({self.key!r}, {self.value!r}, section={self.section!r})"
+        )
+
+
+class IniInclude:
+    """A class representing an ``include`` directive of an omnetpp.ini file.
+
+    Attributes:
+        target (str): Path of the included file, as written in the file.
+        section (str): Name of the section the directive appears in.
+        path (str): Path of the file containing the directive.
+        lineno (int): Line number (1-based) of the directive.
+    """
+
+    def __init__(
+        self, target: str, section: str = "General", path: str = "", lineno=0
+    ):
+        """Initializes the include directive."""
+        self.target = target
+        self.section = section
+        self.path = path
+        self.lineno = lineno
+
+    def __repr__(self) -> str:
+        return f"IniInclude({self.target!r}, section={self.section!r})"
+
+
+class IniSection:
+    """A class representing a section (``[General]`` or ``[Config X]``).
+
+    Attributes:
+        name (str): Name of the section (``General`` or the config name).
+        lineno (int): Line number of the heading, 0 for an implicit General.
+        entries (list): Entries of the section, in file order.
+        includes (list): Include directives of the section, in file order.
+        keys (dict): First entry of each key, for O(1) lookups.
+    """
+
+    def __init__(self, name: str, lineno: int = 0):
+        """Initializes an empty section."""
+        self.name = name
+        self.lineno = lineno
+        self.entries = []
+        self.includes = []
+        self.keys = {}
+
+    def add_entry(self, entry: IniEntry):
+        """
+        Adds an entry to the section.
+
+        Args:
+            entry (IniEntry): The entry to be added.
+        """
+        self.entries.append(entry)
+        self.keys.setdefault(entry.key, entry)
+
+    def get_entry(self, key: str) -> IniEntry:
+        """
+        Gets the first entry of a key.
+
+        Args:
+            key (str): The key, exactly as written in the file.
+
+        Returns:
+            IniEntry: The entry, or None if the key is not in the section.
+        """
+        return self.keys.get(key)
+
+    def get_value(self, key: str) -> str:
+        """
+        Gets the value of the first entry of a key.
+
+        Args:
+            key (str): The key, exactly as written in the file.
+
+        Returns:
+            str: The value, or None if the key is not in the section.
+        """
+        entry = self.keys.get(key)
+        return entry.value if entry is not None else None
+
+    def get_extends(self) -> list:
+        """
+        Gets the names of the sections this section extends.
+
+        Returns:
+            list: Names listed in the ``extends`` key, in order.
+        """
+        value = self.get_value("extends")
+        if not value:
+            return []
+        return [name.strip() for name in value.split(",") if name.strip()]
+
+
+class EffectiveConfig:
+    """A class representing the flattened parameters of a configuration.
+
+    Attributes:
+        name (str): Name of the configuration.
+        linearization (list): Sections looked up, from the configuration
+            itself down to ``General``.
+        entries (list): Entries of those sections, in lookup order.
+        keys (dict): First entry of each key, for O(1) lookups.
+    """
+
+    def __init__(self, name: str, linearization: list, sections: dict):
+        """Initializes the flattened table of a configuration."""
+        self.name = name
+        self.linearization = linearization
+        self.entries = []
+        self.keys = {}
+        self._matcher = None
+        self._runs = None
+        for section_name in linearization:
+            for entry in sections[section_name].entries:
+                if entry.key == "extends":
+                    continue
+                self.entries.append(entry)
+                self.keys.setdefault(entry.key, entry)
+
+    def __repr__(self) -> str:
+        return f"EffectiveConfig({self.name!r}, {self.linearization})"
+
+    def get_entry(self, key: str) -> IniEntry:
+        """
+        Gets the entry that takes effect for a key.
+
+        Args:
+            key (str): The key, exactly as written in the file.
+
+        Returns:
+            IniEntry: The entry, or None if no section defines the key.
+        """
+        return self.keys.get(key)
+
+    def get_value(self, key: str) -> str:
+        """
+        Gets the value that takes effect for a key.
+
+        Args:
+            key (str): The key, exactly as written in the file.
+
+        Returns:
+            str: The value, or None if no section defines the key.
+        """
+        entry = self.keys.get(key)
+        return entry.value if entry is not None else None
+
+    def get_params(self) -> dict:
+        """
+        Gets the value that takes effect for every key.
+
+        Returns:
+            dict: Values by key, in lookup order.
+        """
+        return {key: entry.value for key, entry in self.keys.items()}
+
+    def get_matcher(self) -> "ParameterMatcher":
+        """
+        Gets the compiled patterns of the configuration.
+
+        Returns:
+            ParameterMatcher: The patterns, compiled on first use.
+        """
+        if self._matcher is None:
+            self._matcher = ParameterMatcher(self.entries)
+        return self._matcher
+
+    def get_runs(self) -> "RunSpace":
+        """
+        Gets the runs the configuration produces.
+
+        Returns:
+            RunSpace: The runs, built on first use.
+        """
+        if self._runs is None:
+            self._runs = build_run_space(self)
+        return self._runs
+
+    def match(self, path: str) -> IniEntry:
+        """
+        Gets the entry whose pattern takes effect for a parameter.
+
+        Args:
+            path (str): Full path of the parameter.
+
+        Returns:
+            IniEntry: The first matching entry, or None.
+        """
+        return self.get_matcher().match(path)
+
+
+class ParameterMatcher:
+    """A class representing the compiled patterns of a configuration.
+
+    Every key is compiled once into one alternation of a single regular
+    expression, in lookup order, so a module path is matched against all
+    patterns in one pass and the first matching pattern wins, as in OMNeT++.
+    When no pattern can tell module indices apart, results are memoized per
+    path with its indices erased, so bulk queries over ``SW[0]`` ...
+    ``SW[65535]`` only run the expression once.
+
+    Attributes:
+        entries (list): Entries whose keys are matched, in lookup order.
+    """
+
+    def __init__(self, entries: list):
+        """Compiles the keys of the entries."""
+        self.entries = list(entries)
+        self._regex = None
+        if self.entries:
+            self._regex = re.compile(
+                "|".join(
+                    f"(?P<p{idx}>{_pattern_regex(entry.key)})"
+                    for idx, entry in enumerate(self.entries)
+                ),
+                re.DOTALL,
+            )
+        self._index_insensitive = all(
+            _is_index_insensitive(entry.key) for entry in self.entries
+        )
+        self._memo = {}
+
+    def match(self, path: str) -> IniEntry:
+        """
+        Gets the first entry whose key matches a path.
+
+        Args:
+            path (str): Full path of a parameter, e.g. ``Net.SW[17].arbiter.typename``.
+
+        Returns:
+            IniEntry: The entry, or None if no key matches.
+        """
+        if self._regex is None:
+            return None
+        if self._index_insensitive:
+            path = _INDEX_RE.sub("[0]", path)
+            if path in self._memo:
+                return self._memo[path]
+
+        found = self._regex.fullmatch(path)
+        entry = self.entries[int(found.lastgroup[1:])] if found else None
+        if self._index_insensitive:
+            self._memo[path] = entry
+        return entry
+
+    def match_all(self, paths) -> list:
+        """
+        Gets the first matching entry of many paths.
+
+        Args:
+            paths (iterable): Full paths of parameters.
+
+        Returns:
+            list: The entry of each path, None where no key matches.
+        """
+        return [self.match(path) for path in paths]
+
+
+class OppIniDocument:
+    """A class representing a tokenized omnetpp.ini file.
+
+    The file is read and tokenized once; every lookup afterwards is answered
+    from the indexes built here.
+
+    Attributes:
+        path (str): Path of the file.
+        size (int): Size of the file in bytes.
+        lines (list): Lines of the file, with their line endings.
+        offsets (list): Byte offset where each line starts; the last item is
+            the size of the file.
+        sections (dict): Sections by name, in file order.
+        entries (list): Every entry of the file, in file order.
+        includes (list): Every include directive of the file, in file order.
+        comments (list): ``(lineno, text)`` of every comment, in file order.
+        headings (list): ``(lineno, section)`` of every section heading.
+        blocks (list): ``(section, first_lineno, last_lineno)`` of every
+            section heading block, in file order.
+        errors (list): ``(lineno, line)`` of the lines that could not be parsed.
+        files (list): Real paths of the files the document was built from.
+        missing (list): Included files that could not be found.
+    """
+
+    def __init__(self, path: str = ""):
+        """Initializes an empty document."""
+        self.path = path
+        self.size = 0
+        self.lines = []
+        self.offsets = [0]
+        self.sections = {}
+        self.entries = []
+        self.includes = []
+        self.comments = []
+        self.headings = []
+        self.blocks = []
+        self.errors = []
+        self.files = [path] if path else []
+        self.missing = []
+        self._first = {}
+        self._comment_fields = {}
+        self._effective = {}
+
+    def __repr__(self) -> str:
+        return f"OppIniDocument({self.path!r}, sections={list(self.sections)})"
+
+    # ----- Constructors ----- #
+
+    @classmethod
+    def from_file(cls, path: str) -> "OppIniDocument":
+        """
+        Reads and tokenizes an omnetpp.ini file.
+
+        Args:
+            path (str): Path of the file.
+
+        Returns:
+            OppIniDocument: The tokenized file.
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        return cls.parse(data, path)
+
+    @classmethod
+    def parse(cls, data, path: str = "") -> "OppIniDocument":
+        """
+        Tokenizes the contents of an omnetpp.ini file.
+
+        Args:
+            data (bytes | str): Contents of the file.
+            path (str): Path the contents were read from.
+
+        Returns:
+            OppIniDocument: The tokenized contents.
+        """
+        if isinstance(data, str):
+            data = data.encode()
+
+        doc = cls(path)
+        doc.size = len(data)
+
+        offset = 0
+        for raw in data.splitlines(keepends=True):
+            doc.lines.append(raw.decode("utf-8", errors="replace"))
+            offset += len(raw)
+            doc.offsets.append(offset)
+
+        section = doc._open_section("General", 0)
+        block_start = 1
+        lineno = 0
+        while lineno < len(doc.lines):
+            first = lineno
+            line = doc.lines[lineno].rstrip("\r\n")
+            # Join continuation lines
+            while line.endswith("\\") and lineno + 1 < len(doc.lines):
+                lineno += 1
+                line = line[:-1] + doc.lines[lineno].rstrip("\r\n")
+            lineno += 1
+
+            code, comment = _split_comment(line)
+            if comment is not None:
+                doc._add_comment(first + 1, comment)
+            stripped = code.strip()
+
+            if not stripped:
+                continue
+
+            if stripped.startswith("[") and stripped.endswith("]"):
+                if first >= block_start:
+                    doc.blocks.append((section.name, block_start, first))
+                block_start = first + 1
+                section = doc._open_section(
+                    _section_name(stripped[1:-1]), first + 1
+                )
+                doc.headings.append((first + 1, section.name))
+            elif stripped.startswith("include") and stripped[7:8].isspace():
+                include = IniInclude(
+                    stripped[8:].strip(), section.name, path, first + 1
+                )
+                section.includes.append(include)
+                doc.includes.append(include)
+            elif "=" in stripped:
+                equals = code.index("=")
+                value = code[equals + 1 :]
+                start = equals + 1 + (len(value) - len(value.lstrip()))
+                span = (start, start + len(value.strip()))
+                entry = IniEntry(
+                    code[:equals].strip(),
+                    value.strip(),
+                    (comment or "").strip(),
+                    section.name,
+                    path,
+                    first + 1,
+                    lineno,
+                    span if first + 1 == lineno else None,
+                )
+                section.add_entry(entry)
+                doc.entries.append(entry)
+                doc._first.setdefault(entry.key, entry)
+            else:
+                doc.errors.append((first + 1, line))
+
+        doc.blocks.append((section.name, block_start, len(doc.lines)))
+        return doc
+
+    def _open_section(self, name: str, lineno: int) -> IniSection:
+        section = self.sections.get(name)
+        if section is None:
+            section = IniSection(name, lineno)
+            self.sections[name] = section
+        elif section.lineno == 0:
+            section.lineno = lineno
+        return section
+
+    def _add_comment(self, lineno: int, text: str):
+        self.comments.append((lineno, text))
+        label, colon, value = text.partition(":")
+        if colon and label.strip():
+            self._comment_fields.setdefault(label.strip(), value.strip())
+
+    # ----- Getters ----- #
+
+    def get_section(self, name: str) -> IniSection:
+        """
+        Gets a section by name.
+
+        Args:
+            name (str): ``General`` or the name of a configuration.
+
+        Returns:
+            IniSection: The section, or None if it does not exist.
+        """
+        return self.sections.get(name)
+
+    def get_configs(self) -> list:
+        """
+        Gets the names of the ``[Config X]`` sections.
+
+        Returns:
+            list: Configuration names, in file order.
+        """
+        return [name for name in self.sections if name != "General"]
+
+    def get_entry(self, key: str, section: str = None) -> IniEntry:
+        """
+        Gets the first entry of a key.
+
+        Args:
+            key (str): The key, exactly as written in the file.
+            section (str): Section to look in. The whole file if None.
+
+        Returns:
+            IniEntry: The entry, or None if it was not found.
+        """
+        if section is None:
+            return self._first.get(key)
+        found = self.sections.get(section)
+        return found.get_entry(key) if found is not None else None
+
+    def get_value(self, key: str, section: str = None) -> str:
+        """
+        Gets the value of the first entry of a key.
+
+        Args:
+            key (str): The key, exactly as written in the file.
+            section (str): Section to look in. The whole file if None.
+
+        Returns:
+            str: The value, or None if it was not found.
+        """
+        entry = self.get_entry(key, section)
+        return entry.value if entry is not None else None
+
+    def get_comment_field(self, label: str) -> str:
+        """
+        Gets the value of the first ``# label: value`` comment.
+
+        Args:
+            label (str): The label of the comment, e.g. ``Configuration``.
+
+        Returns:
+            str: The value, or None if no such comment exists.
+        """
+        return self._comment_fields.get(label)
+
+    def get_linearization(self, name: str) -> list:
+        """
+        Gets the sections a configuration looks parameters up in.
+
+        The order follows OMNeT++: the C3 linearization of the ``extends``
+        graph, with ``General`` as the last fallback.
+
+        Args:
+            name (str): ``General`` or the name of a configuration.
+
+        Returns:
+            list: Section names, from the configuration down to ``General``.
+
+        Raises:
+            ValueError: If a configuration is unknown or extends itself.
+        """
+        linearization = self._linearize(name, ())
+        if name != "General" and "General" in self.sections:
+            linearization.append("General")
+        return linearization
+
+    def get_effective(self, name: str) -> EffectiveConfig:
+        """
+        Gets the flattened parameter table of a configuration.
+
+        Tables are computed once per document; since a document is replaced
+        whenever its files change, a stale table is never returned.
+
+        Args:
+            name (str): ``General`` or the name of a configuration.
+
+        Returns:
+            EffectiveConfig: The flattened parameters of the configuration.
+        """
+        effective = self._effective.get(name)
+        if effective is None:
+            effective = EffectiveConfig(
+                name, self.get_linearization(name), self.sections
+            )
+            self._effective[name] = effective
+        return effective
+
+    def effective_value(self, config_name: str, path: str) -> str:
+        """
+        Gets the value a parameter takes in a configuration.
+
+        Args:
+            config_name (str): ``General`` or the name of a configuration.
+            path (str): Full path of the parameter, e.g.
+                ``Net.SW[17].arbiter.typename``.
+
+        Returns:
+            str: The value of the first matching pattern, or None.
+        """
+        entry = self.get_effective(config_name).match(path)
+        return entry.value if entry is not None else None
+
+    def effective_values(self, config_name: str, paths) -> list:
+        """
+        Gets the values many parameters take in a configuration.
+
+        Args:
+            config_name (str): ``General`` or the name of a configuration.
+            paths (iterable): Full paths of the parameters.
+
+        Returns:
+            list: The value of each parameter, None where no pattern matches.
+        """
+        matcher = self.get_effective(config_name).get_matcher()
+        return [
+            entry.value if entry is not None else None
+            for entry in matcher.match_all(paths)
+        ]
+
+    def _linearize(self, name: str, stack: tuple) -> list:
+        if name in stack:
+            chain = " -> ".join(stack + (name,))
+            raise ValueError(f"Configuration extends itself: {chain}")
+        section = self.sections.get(name)
+        if section is None:
+            raise ValueError(f"Configuration {name} not found")
+
+        bases = [base for base in section.get_extends() if base != "General"]
+        if name == "General" or not bases:
+            return [name]
+
+        stack = stack + (name,)
+        sequences = [self._linearize(base, stack) for base in bases]
+        sequences.append(list(bases))
+        linearization = [name]
+        while any(sequences):
+            for sequence in sequences:
+                head = sequence[0] if sequence else None
+                if head is not None and not any(
+                    head in other[1:] for other in sequences
+                ):
+                    break
+            else:
+                raise ValueError(
+                    f"Inconsistent extends hierarchy for configuration {name}"
+                )
+            linearization.append(head)
+            sequences = [
+                other[1:] if other and other[0] == head else other
+                for other in sequences
+            ]
+            sequences = [other for other in sequences if other]
+        return linearization
+
+
+class ParseCache:
+    """A class representing a process-wide cache of parsed omnetpp.ini files.
+
+    Documents are keyed on the real path of the file and are only reused
+    while the (st_mtime_ns, st_size, st_ino) signature of the file is
+    unchanged. The least recently used documents are evicted when either
+    limit is exceeded. Cached documents are shared and must not be modified.
+
+    Attributes:
+        max_entries (int): Maximum number of cached documents.
+        max_bytes (int): Maximum total size, in file bytes, of the cached documents.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that had to parse the file.
+    """
+
+    def __init__(self, max_entries: int = 512, max_bytes: int = 64 << 20):
+        """Initializes an empty cache."""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    # ----- Setters ----- #
+
+    def configure(self, max_entries: int = None, max_bytes: int = None):
+        """
+        Sets the limits of the cache, evicting documents if needed.
+
+        Args:
+            max_entries (int): Maximum number of cached documents.
+            max_bytes (int): Maximum total size of the cached documents.
+        """
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self._evict()
+
+    def invalidate(self, path: str):
+        """
+        Drops the cached document of a file.
+
+        Args:
+            path (str): Path of the file.
+        """
+        with self._lock:
+            cached = self._entries.pop(os.path.realpath(path), None)
+            if cached is not None:
+                self._bytes -= cached[1].size
+
+    def clear(self):
+        """Drops every cached document and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    # ----- Getters ----- #
+
+    def load(self, path: str) -> OppIniDocument:
+        """
+        Gets the parsed document of a file, parsing it only if it changed.
+
+        Args:
+            path (str): Path of the file.
+
+        Returns:
+            OppIniDocument: The tokenized file.
+        """
+        return self._load(os.path.realpath(path))[1]
+
+    def get_signature(self, path: str) -> tuple:
+        """
+        Gets the signature a cached document was parsed with.
+
+        Args:
+            path (str): Path of the file.
+
+        Returns:
+            tuple: (st_mtime_ns, st_size, st_ino), or None if not cached.
+        """
+        with self._lock:
+            cached = self._entries.get(os.path.realpath(path))
+        return cached[0] if cached is not None else None
+
+    def get_stats(self) -> dict:
+        """
+        Gets the counters of the cache.
+
+        Returns:
+            dict: Hits, misses, number of entries and cached bytes.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def _load(self, realpath: str) -> tuple:
+        stat = os.stat(realpath)
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+        with self._lock:
+            cached = self._entries.get(realpath)
+            if cached is not None and cached[0] == signature:
+                self._entries.move_to_end(realpath)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        document = OppIniDocument.from_file(realpath)
+
+        with self._lock:
+            previous = self._entries.pop(realpath, None)
+            if previous is not None:
+                self._bytes -= previous[1].size
+            self._entries[realpath] = (signature, document)
+            self._bytes += document.size
+            self._evict()
+        return signature, document
+
+    def _evict(self):
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or self._bytes > self.max_bytes
+        ):
+            _, (_, document) = self._entries.popitem(last=False)
+            self._bytes -= document.size
+
+
+PARSE_CACHE = ParseCache()
+
+
+class IncludeGraph:
+    """A class representing the include graph of omnetpp.ini files.
+
+    Every file is parsed once through the parse cache, and the expansion of
+    every file (its entries with its includes inlined) is memoized, so files
+    shared by many simulations, such as the TrafficConfigurations tree, are
+    only expanded once per process. Lines of an included file that come
+    before any section heading belong to the section of the include line.
+
+    Attributes:
+        cache (ParseCache): Cache used to parse the files.
+    """
+
+    def __init__(self, cache: ParseCache = None):
+        """Initializes an empty include graph."""
+        self.cache = cache if cache is not None else PARSE_CACHE
+        self._expansions = {}
+        self._views = {}
+        self._lock = threading.Lock()
+
+    def clear(self):
+        """Drops every memoized expansion and merged document."""
+        with self._lock:
+            self._expansions.clear()
+            self._views.clear()
+
+    # ----- Getters ----- #
+
+    def get_includes(self, path: str) -> list:
+        """
+        Gets the files directly included by a file.
+
+        Args:
+            path (str): Path of the file.
+
+        Returns:
+            list: Real paths of the included files, in file order.
+        """
+        realpath = os.path.realpath(path)
+        document = self.cache.load(realpath)
+        return [
+            _include_path(realpath, inc.target) for inc in document.includes
+        ]
+
+    def get_closure(self, path: str) -> list:
+        """
+        Gets every file a file depends on, including itself.
+
+        Args:
+            path (str): Path of the file.
+
+        Returns:
+            list: Real paths of the existing files, in include order.
+
+        Raises:
+            ValueError: If the includes form a cycle.
+        """
+        return list(self.load(path).files)
+
+    def load(self, path: str) -> OppIniDocument:
+        """
+        Gets the merged document of a file and everything it includes.
+
+        Args:
+            path (str): Path of the root file.
+
+        Returns:
+            OppIniDocument: A document with the includes inlined. It has no
+            lines; entries keep the path and line number they come from.
+
+        Raises:
+            ValueError: If the includes form a cycle.
+        """
+        realpath = os.path.realpath(path)
+        key, events, missing = self._expand(realpath, ())
+
+        with self._lock:
+            cached = self._views.get(realpath)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        root = self.cache.load(realpath)
+        view = OppIniDocument(realpath)
+        view.files = [file for file, signature in key if signature is not None]
+        view.missing = list(missing)
+        view.comments = root.comments
+        view._comment_fields = root._comment_fields
+        view.size = sum(self.cache.load(file).size for file in view.files)
+
+        for section_name, item in events:
+            section = view._open_section(section_name or "General", 0)
+            if isinstance(item, IniInclude):
+                section.includes.append(item)
+                view.includes.append(item)
+            elif item is not None:
+                section.add_entry(item)
+                view.entries.append(item)
+                view._first.setdefault(item.key, item)
+
+        with self._lock:
+            self._views[realpath] = (key, view)
+        return view
+
+    def _expand(self, realpath: str, stack: tuple) -> tuple:
+        if realpath in stack:
+            chain = " -> ".join(stack[stack.index(realpath) :] + (realpath,))
+            raise ValueError(f"Include cycle detected: {chain}")
+
+        try:
+            signature, document = self.cache._load(realpath)
+        except FileNotFoundError:
+            return ((realpath, None),), (), (realpath,)
+
+        stack = stack + (realpath,)
+        children = {}
+        key = [(realpath, signature)]
+        missing = []
+        for include in document.includes:
+            child = _include_path(realpath, include.target)
+            if child not in children:
+                children[child] = self._expand(child, stack)
+                key.extend(children[child][0])
+                missing.extend(children[child][2])
+        key = tuple(key)
+
+        with self._lock:
+            cached = self._expansions.get(realpath)
+        if cached is not None and cached[0] == key:
+            return cached
+
+        items = [(lineno, 0, name) for lineno, name in document.headings]
+        items += [(entry.lineno, 1, entry) for entry in document.entries]
+        items += [(inc.lineno, 1, inc) for inc in document.includes]
+        items.sort(key=lambda item: (item[0], item[1]))
+
+        events = []
+        current = None
+        for _, _, item in items:
+            if isinstance(item, str):
+                current = item
+                events.append((current, None))
+            elif isinstance(item, IniEntry):
+                events.append((current, _in_section(item, current)))
+            else:
+                events.append((current, item))
+                child = _include_path(realpath, item.target)
+                for section_name, child_item in children[child][1]:
+                    if section_name is None:
+                        section_name = current
+                        child_item = _in_section(child_item, current)
+                    events.append((section_name, child_item))
+
+        expansion = (key, tuple(events), tuple(dict.fromkeys(missing)))
+        with self._lock:
+            self._expansions[realpath] = expansion
+        return expansion
+
+
+INCLUDE_GRAPH = IncludeGraph()
+
+
+# Parameter studies
+
+
+class IterationVariable:
+    """A class representing an iteration variable (``${name=values}``).
+
+    Attributes:
+        name (str): Name of the variable; ``$0``, ``$1``... if unnamed.
+        items (list): Literal values (str) and ranges (``(low, high, step)``
+            tuples of numbers), in order.
+        parallel (str): Variable iterated in lockstep with (``! name``).
+        count (int): Number of values of the variable.
+    """
+
+    def __init__(self, name: str, items: list, parallel: str = None):
+        """Initializes the variable."""
+        self.name = name
+        self.items = items
+        self.parallel = parallel
+        self.count = sum(_item_count(item) for item in items)
+
+    def __repr__(self) -> str:
+        return f"IterationVariable({self.name!r}, count={self.count})"
+
+    def get_value(self, idx: int) -> str:
+        """
+        Gets a value of the variable without expanding the ranges.
+
+        Args:
+            idx (int): Position of the value, from 0 to count - 1.
+
+        Returns:
+            str: The value, with references to other variables unresolved.
+        """
+        if not 0 <= idx < self.count:
+            raise IndexError(
+                f"Iteration variable {self.name} has no value {idx}"
+            )
+        for item in self.items:
+            count = _item_count(item)
+            if idx < count:
+                if isinstance(item, str):
+                    return item
+                low, _, step = item
+                return _format_number(low + idx * step)
+            idx -= count
+
+    def get_values(self) -> list:
+        """
+        Gets every value of the variable.
+
+        Returns:
+            list: The values, in iteration order.
+        """
+        return [self.get_value(idx) for idx in range(self.count)]
+
+
+class RunSpace:
+    """A class representing the runs a configuration produces.
+
+    Runs are never materialized: the number of runs is computed in closed
+    form, runs are yielded lazily and any run can be decoded from its run
+    number. The first iteration variable is the outermost loop and the
+    repetition is the innermost one. With a ``constraint`` the runs that
+    satisfy it have to be found by scanning, which is done once, lazily.
+
+    Attributes:
+        config_name (str): Name of the configuration.
+        variables (list): Iteration variables, in order of appearance.
+        constraint (str): Value of the ``constraint`` option, or None.
+        repeat (int): Value of the ``repeat`` option.
+    """
+
+    def __init__(
+        self,
+        config_name: str,
+        variables: list,
+        constraint: str = None,
+        repeat: int = 1,
+    ):
+        """Initializes the run space."""
+        self.config_name = config_name
+        self.variables = variables
+        self.constraint = constraint
+        self.repeat = repeat
+        self._by_name = {var.name: var for var in variables}
+        self._loops = [var for var in variables if var.parallel is None]
+        self._constraint = (
+            parse_ned_expression(constraint) if constraint else None
+        )
+        self._valid = None
+
+        for var in variables:
+            if var.parallel is not None:
+                leader = self._by_name.get(var.parallel)
+                if leader is None:
+                    raise ValueError(
+                        f"Iteration variable {var.name} is parallel to "
+                        f"unknown variable {var.parallel}"
+                    )
+                if leader.count != var.count:
+                    raise ValueError(
+                        f"Iteration variables {var.name} and {leader.name} "
+                        "do not have the same number of values"
+                    )
+
+    def __len__(self) -> int:
+        if self._constraint is None:
+            return self.count_combinations()
+        return len(self._get_valid())
+
+    def __iter__(self):
+        run_number = 0
+        for combination in range(self.count_combinations()):
+            run = self._decode(combination)
+            if self._satisfies(run):
+                run["runnumber"] = run_number
+                run_number += 1
+                yield run
+
+    def __getitem__(self, run_number: int) -> dict:
+        return self.get_run(run_number)
+
+    def count_combinations(self) -> int:
+        """
+        Counts the runs before applying the constraint.
+
+        Returns:
+            int: Product of the number of values of every loop and repeat.
+        """
+        count = self.repeat
+        for var in self._loops:
+            count *= var.count
+        return count
+
+    def get_run(self, run_number: int) -> dict:
+        """
+        Gets the iteration variables of a run.
+
+        Args:
+            run_number (int): The run number, as given to ``opp_run -r``.
+
+        Returns:
+            dict: Value of every iteration variable, plus ``configname``,
+            ``runnumber`` and ``repetition``.
+        """
+        if run_number < 0:
+            run_number += len(self)
+        if self._constraint is None:
+            if not 0 <= run_number < self.count_combinations():
+                raise IndexError(f"Run {run_number} does not exist")
+            combination = run_number
+        else:
+            combination = self._get_valid()[run_number]
+        run = self._decode(combination)
+        run["runnumber"] = run_number
+        return run
+
+    def evaluate(self) -> dict:
+        """
+        Evaluates every iteration variable for every run at once.
+
+        Values are decoded from the run numbers with array arithmetic, and
+        derived variables and the constraint are evaluated as compiled NED
+        expressions over whole columns, so no per-run Python code is run.
+
+        Returns:
+            dict: A NumPy array per iteration variable, plus ``repetition``
+            and ``runnumber``, with one item per run that satisfies the
+            constraint. Values that are not NED expressions are kept as
+            strings.
+        """
+        if np is None:
+            raise ImportError("numpy is required to evaluate sweeps")
+
+        total = self.count_combinations()
+        rest, repetition = np.divmod(
+            np.arange(total, dtype=np.int64), self.repeat
+        )
+        positions = {}
+        for var in reversed(self._loops):
+            rest, positions[var.name] = np.divmod(rest, var.count)
+
+        columns = {"configname": self.config_name, "repetition": repetition}
+
+        def column(name, stack=()):
+            if name in columns:
+                return columns[name]
+            if name in stack or name not in self._by_name:
+                raise ValueError(f"Cannot evaluate iteration variable {name}")
+            var = self._by_name[name]
+            values = [_vector_value(text) for text in var.get_values()]
+            for value in values:
+                if isinstance(value, NedExpression):
+                    for needed in value.variables:
+                        column(needed, stack + (name,))
+
+            position = positions[var.parallel or var.name]
+            if not any(isinstance(value, NedExpression) for value in values):
+                columns[name] = np.asarray(values)[position]
+            else:
+                stacked = np.stack(
+                    [
+                        np.broadcast_to(
+                            (
+                                value.evaluate(columns)
+                                if isinstance(value, NedExpression)
+                                else value
+                            ),
+                            total,
+                        )
+                        for value in values
+                    ]
+                )
+                columns[name] = stacked[position, np.arange(total)]
+            return columns[name]
+
+        for var in self.variables:
+            column(var.name)
+
+        if self.constraint:
+            expression = compile_ned_expression(self.constraint)
+            for needed in expression.variables:
+                column(needed)
+            mask = np.broadcast_to(expression.evaluate(columns), total)
+            mask = mask.astype(bool)
+        else:
+            mask = np.ones(total, dtype=bool)
+
+        sweep = {name: columns[name][mask] for name in self._by_name}
+        sweep["repetition"] = repetition[mask]
+        sweep["runnumber"] = np.arange(int(mask.sum()), dtype=np.int64)
+        return sweep
+
+    def _get_valid(self) -> array:
+        if self._valid is None:
+            valid = array("q")
+            for combination in range(self.count_combinations()):
+                if self._satisfies(self._decode(combination)):
+                    valid.append(combination)
+            self._valid = valid
+        return self._valid
+
+    def _decode(self, combination: int) -> dict:
+        combination, repetition = divmod(combination, self.repeat)
+        positions = {}
+        for var in reversed(self._loops):
+            combination, positions[var.name] = divmod(combination, var.count)
+
+        run = {"configname": self.config_name}
+        for var in self.variables:
+            position = positions[var.parallel or var.name]
+            run[var.name] = var.get_value(position)
+        run["repetition"] = str(repetition)
+        for var in self.variables:
+            run[var.name] = _substitute_variables(run[var.name], run)
+        return run
+
+    def _satisfies(self, run: dict) -> bool:
+        if self._constraint is None:
+            return True
+        env = {name: _ned_literal(value) for name, value in run.items()}
+        return bool(evaluate_ned_expression(self._constraint, env))
+
+
+class SweepRecord(NamedTuple):
+    """A point of a sweep streamed by iter_sweep.
+
+    Attributes:
+        index (int): Position of the point in the full Cartesian product.
+            Pass ``index + 1`` as the start of iter_sweep to resume after
+            it.
+        point (dict): Axis values of the point.
+        spec (SimulationSpec): The simulation of the point.
+    """
+
+    index: int
+    point: dict
+    spec: "SimulationSpec"
+
+
+class SweepResult:
+    """A class representing a configuration written by generate_sweep.
+
+    Attributes:
+        index (int): Position of the point in the sweep (see
+            SweepRecord.index), or its row in the SimulationBatch.
+        point (dict): Axis values of the point.
+        path (str): Path of the omnetpp.ini file written.
+        config_name (str): Configuration of the file to run (see
+            get_run_configuration).
+        seconds (float): Time it took to render and write the file.
+        written (bool): False if the file was already up to date.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        point: dict,
+        path: str,
+        config_name: str,
+        seconds: float,
+        written: bool = True,
+    ):
+        """Initializes the result."""
+        self.index = index
+        self.point = point
+        self.path = path
+        self.config_name = config_name
+        self.seconds = seconds
+        self.written = written
+
+    def __repr__(self) -> str:
+        return f"SweepResult({self.index}, {self.path!r}, {self.seconds:.6f}s)"
+
+
+class SimulationBatch:
+    """A class representing sweep points stored column-wise.
+
+    Numeric axes are ``array('d')`` columns, NaN where a point leaves the
+    axis unset. String axes are categorical: an ``array('i')`` of codes,
+    -1 where unset, into a list of categories. ``load`` is split into the
+    load_initial, load_final and load_steps columns. Simulation objects
+    are only built when a point is materialized.
+
+    With NumPy, masks, sorting and selection run over zero-copy views of
+    the columns; without it they fall back to plain loops.
+
+    Attributes:
+        root_dir (str): Root directory of the materialized simulations.
+    """
+
+    CATEGORICAL = (
+        "network",
+        "architecture",
+        "arbiter",
+        "queue_scheme",
+        "routing",
+        "filename",
+    )
+    NUMERIC = (
+        "arity",
+        "stages",
+        "dim1",
+        "dim2",
+        "channel_distance",
+        "num_queues",
+        "voq",
+        "bubble",
+        "request_processing_time",
+        "load_initial",
+        "load_final",
+        "load_steps",
+        "message_size",
+    )
+    COLUMNS = CATEGORICAL + NUMERIC
+
+    _OPERATORS = {
+        "=": operator.eq,
+        "!=": operator.ne,
+        "<": operator.lt,
+        "<=": operator.le,
+        ">": operator.gt,
+        ">=": operator.ge,
+    }
+
+    def __init__(self, root_dir: str = ""):
+        """Initializes an empty batch."""
+        self.root_dir = root_dir
+        self._columns = {name: array("i") for name in self.CATEGORICAL}
+        self._columns.update({name: array("d") for name in self.NUMERIC})
+        self._categories = {name: [] for name in self.CATEGORICAL}
+        self._codes = {name: {} for name in self.CATEGORICAL}
+        self._length = 0
+
+    @classmethod
+    def from_points(cls, points, root_dir: str = "") -> "SimulationBatch":
+        """
+        Builds a batch from sweep points.
+
+        Args:
+            points (iterable): Dicts of values by axis name (see SWEEP_AXES).
+            root_dir (str): Root directory of the simulations.
+
+        Returns:
+            SimulationBatch: The batch.
+        """
+        batch = cls(root_dir)
+        for point in points:
+            batch.append(point)
+        return batch
+
+    @classmethod
+    def from_spec(cls, spec: dict, root_dir: str = "") -> "SimulationBatch":
+        """
+        Builds a batch from the Cartesian product of a sweep spec.
+
+        The points are in the same order as iter_sweep_points, but the
+        columns are built by repeating each axis, without a dict per point.
+
+        Args:
+            spec (dict): Values by axis name (see iter_sweep_points).
+            root_dir (str): Root directory of the simulations.
+
+        Returns:
+            SimulationBatch: The batch.
+        """
+        axes = []
+        for axis, values in spec.items():
+            if axis not in SWEEP_AXES:
+                raise ValueError(f"Unknown sweep axes: {axis}")
+            if isinstance(values, list) or (
+                isinstance(values, tuple) and axis != "load"
+            ):
+                axes.append((axis, list(values)))
+            else:
+                axes.append((axis, [values]))
+
+        batch = cls(root_dir)
+        batch._length = math.prod(len(values) for _, values in axes)
+        outer = 1
+        inner = batch._length
+        for axis, values in axes:
+            inner //= len(values) or 1
+            for name, items in batch._encode_axis(axis, values):
+                batch._columns[name] = _repeat_tile(items, inner, outer)
+            outer *= len(values)
+        for name in cls.CATEGORICAL:
+            if not batch._columns[name]:
+                batch._columns[name] = array("i", [-1]) * batch._length
+        for name in cls.NUMERIC:
+            if not batch._columns[name]:
+                batch._columns[name] = array("d", [math.nan]) * batch._length
+        return batch
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield self.get_simulation(index)
+
+    def __getitem__(self, index: int) -> "Simulation":
+        return self.get_simulation(index)
+
+    # ----- Setters ----- #
+
+    def append(self, point: dict):
+        """
+        Adds a sweep point.
+
+        Args:
+            point (dict): Values by axis name (see SWEEP_AXES).
+
+        Raises:
+            ValueError: If the point has unknown axes.
+        """
+        unknown = set(point) - set(SWEEP_AXES)
+        if unknown:
+            raise ValueError(
+                f"Unknown sweep axes: {', '.join(sorted(unknown))}"
+            )
+        row = {}
+        for axis, value in point.items():
+            for name, items in self._encode_axis(axis, [value]):
+                row[name] = items[0]
+        for name in self.CATEGORICAL:
+            self._columns[name].append(row.get(name, -1))
+        for name in self.NUMERIC:
+            self._columns[name].append(row.get(name, math.nan))
+        self._length += 1
+
+    # ----- Getters ----- #
+
+    def get_categories(self, name: str) -> list:
+        """
+        Gets the categories of a string axis.
+
+        Args:
+            name (str): The axis.
+
+        Returns:
+            list: The values the codes refer to.
+        """
+        return list(self._categories[name])
+
+    def get_codes(self, name: str):
+        """
+        Gets the codes of a string axis.
+
+        Args:
+            name (str): The axis.
+
+        Returns:
+            ndarray | array: A code per point, -1 where unset. A read-only
+            view if NumPy is available.
+        """
+        return self._view(name)
+
+    def get_column(self, name: str):
+        """
+        Gets the values of an axis.
+
+        Args:
+            name (str): The axis, or a column of ``load``.
+
+        Returns:
+            ndarray | list: A value per point, NaN or None where unset.
+        """
+        if name not in self.CATEGORICAL:
+            return self._view(name)
+        categories = self._categories[name] + [None]
+        if np is not None:
+            return np.array(categories, dtype=object)[self._view(name)]
+        return [categories[code] for code in self._columns[name]]
+
+    def get_mask(self, name: str, op: str, value):
+        """
+        Compares an axis with a value for every point.
+
+        Args:
+            name (str): The axis, or a column of ``load``.
+            op (str): One of ``=, !=, <, <=, >, >=, in``. String axes only
+                support ``=``, ``!=`` and ``in``.
+            value: The value, or a collection of values for ``in``.
+
+        Returns:
+            ndarray | list: A bool per point, False where unset.
+        """
+        if name in self.CATEGORICAL:
+            if op not in ("=", "!=", "in"):
+                raise ValueError(f"Operator {op} is not supported for {name}")
+            values = value if op == "in" else [value]
+            codes = [
+                self._codes[name][item]
+                for item in values
+                if item in self._codes[name]
+            ]
+            column = self._view(name)
+            if np is not None:
+                mask = np.isin(column, codes)
+                if op == "!=":
+                    return ~mask & (column >= 0)
+                return mask
+            codes = set(codes)
+            if op == "!=":
+                return [code >= 0 and code not in codes for code in column]
+            return [code in codes for code in column]
+
+        column = self._view(name)
+        if op == "in":
+            if np is not None:
+                return np.isin(column, list(value))
+            value = set(value)
+            return [item in value for item in column]
+        compare = self._OPERATORS.get(op)
+        if compare is None:
+            raise ValueError(f"Unknown operator {op}")
+        if np is not None:
+            with np.errstate(invalid="ignore"):
+                return compare(column, value) & ~np.isnan(column)
+        return [item == item and compare(item, value) for item in column]
+
+    def get_point(self, index: int) -> dict:
+        """
+        Gets a sweep point.
+
+        Args:
+            index (int): Position of the point.
+
+        Returns:
+            dict: Values by axis name, as accepted by build_simulation.
+        """
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(f"Point {index} does not exist")
+        point = {}
+        for name in self.CATEGORICAL:
+            code = self._columns[name][index]
+            if code >= 0:
+                point[name] = self._categories[name][code]
+        for name in self.NUMERIC:
+            value = self._columns[name][index]
+            if value == value:
+                point[name] = int(value) if value.is_integer() else value
+        if "load_initial" in point:
+            point["load"] = (
+                point.pop("load_initial"),
+                point.pop("load_final"),
+                point.pop("load_steps"),
+            )
+        for name in ("voq", "bubble"):
+            if name in point:
+                point[name] = bool(point[name])
+        return point
+
+    def iter_points(self):
+        """
+        Yields the sweep points, in order.
+
+        Yields:
+            dict: Values by axis name (see get_point).
+        """
+        for index in range(self._length):
+            yield self.get_point(index)
+
+    def get_simulation(self, index: int) -> "Simulation":
+        """
+        Builds the simulation of a point.
+
+        Args:
+            index (int): Position of the point.
+
+        Returns:
+            Simulation: The simulation, rooted at root_dir.
+        """
+        return build_simulation(self.get_point(index), self.root_dir)
+
+    def get_config_names(self) -> list:
+        """
+        Gets the configuration name of every point.
+
+        Names are computed once per distinct combination of the axes they
+        depend on, with set_configuration_name.
+
+        Returns:
+            list: A name per point.
+        """
+        keys = (
+            "network",
+            "arity",
+            "stages",
+            "dim1",
+            "dim2",
+            "architecture",
+            "arbiter",
+            "queue_scheme",
+            "num_queues",
+        )
+        rows = zip(*(self._columns[key] for key in keys))
+        names = {}
+        result = []
+        for index, row in enumerate(rows):
+            # NaN never equals itself, so unset values are keyed as None
+            row = tuple(value if value == value else None for value in row)
+            name = names.get(row)
+            if name is None:
+                name = set_configuration_name(self.get_simulation(index))
+                names[row] = name
+            result.append(name)
+        return result
+
+    # ----- Selection ----- #
+
+    def filter(self, mask) -> "SimulationBatch":
+        """
+        Gets the points where a mask is true.
+
+        Args:
+            mask (ndarray | list): A bool per point (see get_mask).
+
+        Returns:
+            SimulationBatch: A new batch with the selected points.
+        """
+        if np is not None:
+            return self.take(np.flatnonzero(np.asarray(mask, dtype=bool)))
+        return self.take([index for index, keep in enumerate(mask) if keep])
+
+    def sort(self, by, reverse: bool = False) -> "SimulationBatch":
+        """
+        Gets the points sorted by one or more axes.
+
+        String axes sort by value; unset values sort last.
+
+        Args:
+            by (str | tuple): The axis, or axes, most significant first.
+            reverse (bool): Whether to sort in descending order.
+
+        Returns:
+            SimulationBatch: A new batch with the points sorted.
+        """
+        names = by if isinstance(by, tuple) else (by,)
+        keys = [self._sort_key(name) for name in names]
+        if np is not None:
+            order = np.lexsort(keys[::-1])
+            if reverse:
+                order = order[::-1]
+            return self.take(order)
+        order = sorted(
+            range(self._length),
+            key=lambda index: tuple(key[index] for key in keys),
+            reverse=reverse,
+        )
+        return self.take(order)
+
+    def take(self, indices) -> "SimulationBatch":
+        """
+        Gets some points, in the given order.
+
+        Args:
+            indices (ndarray | list): Positions of the points.
+
+        Returns:
+            SimulationBatch: A new batch sharing the categories.
+        """
+        batch = SimulationBatch(self.root_dir)
+        batch._categories = {k: list(v) for k, v in self._categories.items()}
+        batch._codes = {k: dict(v) for k, v in self._codes.items()}
+        for name, column in self._columns.items():
+            if np is not None:
+                taken = self._view(name)[np.asarray(indices, dtype=np.intp)]
+                batch._columns[name] = array(column.typecode, taken.tobytes())
+            else:
+                batch._columns[name] = array(
+                    column.typecode, (column[index] for index in indices)
+                )
+        batch._length = len(batch._columns["network"])
+        return batch
+
+    def _sort_key(self, name: str):
+        if name not in self.CATEGORICAL:
+            column = self._view(name)
+            if np is not None:
+                return np.where(np.isnan(column), np.inf, column)
+            return [math.inf if item != item else item for item in column]
+        # Rank the codes by category value, unset last
+        ranks = {
+            code: rank
+            for rank, code in enumerate(
+                sorted(
+                    range(len(self._categories[name])),
+                    key=lambda code: str(self._categories[name][code]),
+                )
+            )
+        }
+        ranks[-1] = len(ranks)
+        if np is not None:
+            lookup = np.array(
+                [ranks[code] for code in range(-1, len(ranks) - 1)],
+                dtype=np.int64,
+            )
+            return lookup[self._view(name) + 1]
+        return [ranks[code] for code in self._columns[name]]
+
+    def _view(self, name: str):
+        column = self._columns[name]
+        if np is None:
+            return column
+        dtype = np.int32 if column.typecode == "i" else np.float64
+        view = (
+            np.frombuffer(column, dtype=dtype)
+            if column
+            else np.empty(0, dtype=dtype)
+        )
+        view.flags.writeable = False
+        return view
+
+    def _encode_axis(self, axis: str, values: list) -> list:
+        if axis == "load":
+            loads = [tuple(load) for load in values]
+            return [
+                (f"load_{part}", array("d", (load[i] for load in loads)))
+                for i, part in enumerate(("initial", "final", "steps"))
+            ]
+        if axis in self.CATEGORICAL:
+            codes = self._codes[axis]
+            for value in values:
+                if value not in codes:
+                    codes[value] = len(codes)
+                    self._categories[axis].append(value)
+            return [(axis, array("i", (codes[value] for value in values)))]
+        return [(axis, array("d", (float(value) for value in values)))]
+
+
+class NedExpression:
+    """A class representing a NED expression compiled for whole sweeps.
+
+    The syntax tree is compiled once into NumPy operations, so a derived
+    iteration variable or a constraint is evaluated for every run of a
+    sweep in one vectorized pass instead of once per run.
+
+    Attributes:
+        text (str): The expression.
+        tree (tuple): The syntax tree of the expression.
+        variables (set): Names of the variables the expression refers to.
+    """
+
+    def __init__(self, text: str):
+        """Parses and compiles the expression."""
+        if np is None:
+            raise ImportError("numpy is required to compile NED expressions")
+        self.text = text
+        self.tree = parse_ned_expression(text)
+        self.variables = _ned_variables(self.tree)
+        self._function = _compile_ned(self.tree)
+
+    def __repr__(self) -> str:
+        return f"NedExpression({self.text!r})"
+
+    def evaluate(self, env: dict):
+        """
+        Evaluates the expression.
+
+        Args:
+            env (dict): Values of the variables by name, as scalars or as
+                NumPy arrays of the same length.
+
+        Returns:
+            The value of the expression; an array if any variable is one.
+        """
+        return self._function(env)
+
+
+# Templates
+
+
+class ConfigTemplate:
+    """A class representing a precompiled omnetpp.ini template.
+
+    The static text of the template is encoded once into immutable byte
+    chunks; rendering only encodes the ``@field@`` values and slots them in
+    between. The rendered bytes of the most recent field values are kept,
+    since sweeps render the same switch and topology blocks over and over.
+
+    Attributes:
+        fields (tuple): Names of the placeholders, in order.
+        max_cached (int): Maximum number of rendered texts kept.
+        digest (str): SHA-256 of the template text.
+        includes (tuple): Targets of the include directives, in order.
+    """
+
+    def __init__(self, text: str, max_cached: int = 1024):
+        """Compiles the template."""
+        parts = _TEMPLATE_FIELD_RE.split(text)
+        self.fields = tuple(parts[1::2])
+        self.max_cached = max_cached
+        self._chunks = [part.encode() for part in parts]
+        self._slots = range(1, len(parts), 2)
+        self._values = None
+        if self.fields:
+            # The first field is repeated so that one field still gives a tuple
+            self._values = operator.itemgetter(*self.fields, *self.fields[:1])
+        self._rendered = {}
+        self.digest = hashlib.sha256(b"\0".join(self._chunks)).hexdigest()
+        self.includes = tuple(
+            include.target for include in OppIniDocument.parse(text).includes
+        )
+
+    def render(self, fields: dict) -> list:
+        """
+        Renders the template.
+
+        Args:
+            fields (dict): Value of every placeholder, by name.
+
+        Returns:
+            list: The byte chunks of the rendered text. The list is new,
+            but the chunks are shared and immutable.
+        """
+        if not self.fields:
+            return self._chunks.copy()
+
+        values = self._values(fields)
+        rendered = self._rendered.get(values)
+        if rendered is None:
+            chunks = self._chunks.copy()
+            for slot, value in zip(self._slots, values):
+                chunks[slot] = str(value).encode()
+            rendered = b"".join(chunks)
+            if len(self._rendered) >= self.max_cached:
+                self._rendered.clear()
+            self._rendered[values] = rendered
+        return [rendered]
+
+
+# Storage
+
+
+class ConfigStore:
+    """A class representing the ``[Config X]`` sections of an omnetpp.ini file.
+
+    The store keeps the byte range of every section, so inserting,
+    replacing or deleting a configuration only rewrites that range and
+    the tail of the file, leaving the rest of the file untouched.
+
+    Attributes:
+        opp_file (str): Path of the omnetpp.ini file.
+    """
+
+    def __init__(self, opp_file: str):
+        """Initializes the store of an existing omnetpp.ini file."""
+        self.opp_file = opp_file
+        self._spans = {}
+        self._size = 0
+        self._signature = None
+        self._load()
+
+    # ----- Getters ----- #
+
+    def get_names(self) -> list:
+        """
+        Gets the names of the configurations.
+
+        Returns:
+            list: Configuration names, in file order.
+        """
+        self._refresh()
+        return [name for name in self._spans if name != "General"]
+
+    def get_span(self, name: str) -> tuple:
+        """
+        Gets the byte range of a section.
+
+        Args:
+            name (str): ``General`` or the name of a configuration.
+
+        Returns:
+            tuple: Start and end offsets, or None if it does not exist.
+        """
+        self._refresh()
+        span = self._spans.get(name)
+        return tuple(span) if span is not None else None
+
+    def get(self, name: str) -> bytes:
+        """
+        Gets the text of a section, heading included.
+
+        Args:
+            name (str): ``General`` or the name of a configuration.
+
+        Returns:
+            bytes: The text, or None if the section does not exist.
+        """
+        span = self.get_span(name)
+        if span is None:
+            return None
+        with open(self.opp_file, "rb") as file:
+            file.seek(span[0])
+            return file.read(span[1] - span[0])
+
+    # ----- Setters ----- #
+
+    def insert(self, name: str, text: bytes):
+        """
+        Appends a configuration at the end of the file.
+
+        Args:
+            name (str): Name of the configuration.
+            text (bytes): Text of the section, heading included.
+
+        Raises:
+            ValueError: If the configuration already exists.
+        """
+        self._refresh()
+        if name in self._spans:
+            raise ValueError(f"Configuration {name} already exists")
+
+        with open(self.opp_file, "r+b") as file:
+            prefix = b""
+            if self._size:
+                file.seek(self._size - 1)
+                if file.read(1) != b"\n":
+                    prefix = b"\n"
+            file.seek(self._size)
+            file.write(prefix + text)
+        start = self._size + len(prefix)
+        self._spans[name] = [start, start + len(text)]
+        self._written(start + len(text))
+
+    def replace(self, name: str, text: bytes):
+        """
+        Replaces a configuration, rewriting only it and the tail of the file.
+
+        Args:
+            name (str): Name of the configuration.
+            text (bytes): New text of the section, heading included.
+
+        Raises:
+            KeyError: If the configuration does not exist.
+        """
+        self._rewrite(name, text)
+
+    def put(self, name: str, text: bytes):
+        """
+        Replaces a configuration, or appends it if it does not exist.
+
+        Args:
+            name (str): Name of the configuration.
+            text (bytes): Text of the section, heading included.
+        """
+        self._refresh()
+        if name in self._spans:
+            self._rewrite(name, text)
+        else:
+            self.insert(name, text)
+
+    def delete(self, name: str):
+        """
+        Deletes a configuration, rewriting only the tail of the file.
+
+        Args:
+            name (str): Name of the configuration.
+
+        Raises:
+            KeyError: If the configuration does not exist.
+        """
+        self._rewrite(name, None)
+
+    def _rewrite(self, name: str, text: bytes):
+        self._refresh()
+        if name not in self._spans:
+            raise KeyError(f"Configuration {name} not found")
+        start, end = self._spans[name]
+        text = text or b""
+
+        with open(self.opp_file, "r+b") as file:
+            file.seek(end)
+            tail = file.read()
+            file.seek(start)
+            file.write(text + tail)
+            file.truncate()
+
+        delta = len(text) - (end - start)
+        for span in self._spans.values():
+            if span[0] >= end:
+                span[0] += delta
+                span[1] += delta
+        if text:
+            self._spans[name] = [start, start + len(text)]
+        else:
+            del self._spans[name]
+        self._written(self._size + delta)
+
+    def _written(self, size: int):
+        PARSE_CACHE.invalidate(self.opp_file)
+        self._size = size
+        self._signature = _file_signature(self.opp_file)
+
+    def _refresh(self):
+        if _file_signature(self.opp_file) != self._signature:
+            self._load()
+
+    def _load(self):
+        self._signature = _file_signature(self.opp_file)
+        document = OppIniDocument.from_file(self.opp_file)
+        self._size = document.size
+        self._spans = {}
+        headings = document.headings
+        for idx, (lineno, name) in enumerate(headings):
+            if name in self._spans:
+                raise ValueError(
+                    f"Section {name} appears more than once in {self.opp_file}"
+                )
+            end = document.size
+            if idx + 1 < len(headings):
+                end = document.offsets[headings[idx + 1][0] - 1]
+            self._spans[name] = [document.offsets[lineno - 1], end]
+
+
+# Backups
+
+
+class BackupVersion:
+    """A class representing a version kept by a BackupStore.
+
+    Attributes:
+        version (int): Number of the version, from 1.
+        digest (str): SHA-256 of the contents.
+        size (int): Size of the contents in bytes.
+        created (float): Time the version was saved (seconds since epoch).
+        label (str): Free-form label, e.g. the configuration name.
+    """
+
+    def __init__(
+        self,
+        version: int,
+        digest: str,
+        size: int,
+        created: float,
+        label: str = "",
+    ):
+        """Initializes the version."""
+        self.version = version
+        self.digest = digest
+        self.size = size
+        self.created = created
+        self.label = label
+
+    def __repr__(self) -> str:
+        return f"BackupVersion({self.version}, {self.label!r}, {self.digest[:12]})"
+
+
+class _FileLock:
+    """An exclusive ``flock`` on a lock file, a no-op without fcntl."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def __enter__(self) -> "_FileLock":
+        self._file = open(self.path, "a")
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc_info):
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        self._file.close()
+        self._file = None
+
+
+class BackupStore:
+    """A class representing the backup history of a simulation folder.
+
+    Contents are stored once per SHA-256 digest as zlib-compressed blobs
+    under ``<root_dir>/.backups/objects``, and ``manifest.jsonl`` lists the
+    versions, one JSON object per line. Saving appends one line; restoring
+    reads one blob.
+
+    Version numbers never repeat: the manifest keeps the last number
+    handed out even after the versions are pruned, and saving and pruning
+    hold a lock on ``.backups/lock``, re-reading the manifest under it, so
+    stores open in other processes do not hand out the same number.
+
+    Attributes:
+        root_dir (str): The simulation folder.
+        backup_dir (str): The folder holding the manifest and blobs.
+        level (int): zlib compression level.
+    """
+
+    def __init__(self, root_dir: str, level: int = 6):
+        """Initializes the store, reading its manifest if it exists."""
+        self.root_dir = root_dir
+        self.backup_dir = os.path.join(root_dir, BACKUP_DIR)
+        self.level = level
+        self._versions = OrderedDict()
+        self._last = 0
+        self._load()
+
+    # ----- Getters ----- #
+
+    def get_versions(self) -> list:
+        """
+        Gets the versions kept.
+
+        Returns:
+            list: BackupVersion objects, oldest first.
+        """
+        return list(self._versions.values())
+
+    def get_version(self, version: int = None) -> BackupVersion:
+        """
+        Gets a version.
+
+        Args:
+            version (int): Number of the version, the latest if None.
+
+        Returns:
+            BackupVersion: The version.
+
+        Raises:
+            KeyError: If the version does not exist.
+        """
+        if version is None:
+            if not self._versions:
+                raise KeyError("No backups found")
+            version = next(reversed(self._versions))
+        if version not in self._versions:
+            raise KeyError(f"Backup version {version} not found")
+        return self._versions[version]
+
+    def read(self, version: int = None) -> bytes:
+        """
+        Gets the contents of a version.
+
+        Args:
+            version (int): Number of the version, the latest if None.
+
+        Returns:
+            bytes: The contents.
+        """
+        with open(
+            self._blob_path(self.get_version(version).digest), "rb"
+        ) as f:
+            return zlib.decompress(f.read())
+
+    # ----- Setters ----- #
+
+    def save(self, path: str, label: str = "") -> BackupVersion:
+        """
+        Saves the contents of a file as a new version.
+
+        Nothing is stored if the contents match the latest version, and
+        the blob is shared if they match any older one.
+
+        Args:
+            path (str): Path of the file.
+            label (str): Label of the version.
+
+        Returns:
+            BackupVersion: The version holding the contents.
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        digest = hashlib.sha256(data).hexdigest()
+
+        os.makedirs(self.backup_dir, exist_ok=True)
+        with self._lock():
+            self._load()
+            if self._versions:
+                latest = self._versions[next(reversed(self._versions))]
+                if latest.digest == digest:
+                    return latest
+
+            blob = self._blob_path(digest)
+            if not os.path.exists(blob):
+                os.makedirs(os.path.dirname(blob), exist_ok=True)
+                write_chunks_atomic(blob, [zlib.compress(data, self.level)])
+
+            number = self._last + 1
+            version = BackupVersion(
+                number, digest, len(data), time.time(), label
+            )
+            with open(self._manifest_path(), "a") as file:
+                file.write(json.dumps(vars(version)) + "\n")
+            self._versions[number] = version
+            self._last = number
+        return version
+
+    def restore(self, version: int = None, path: str = None) -> BackupVersion:
+        """
+        Writes a version back.
+
+        Args:
+            version (int): Number of the version, the latest if None.
+            path (str): Destination, the omnetpp.ini file if None.
+
+        Returns:
+            BackupVersion: The version restored.
+        """
+        entry = self.get_version(version)
+        path = path or os.path.join(self.root_dir, "omnetpp.ini")
+        write_chunks_atomic(path, [self.read(entry.version)])
+        return entry
+
+    def prune(self, max_age: float = None, max_count: int = None) -> int:
+        """
+        Deletes old versions, and the blobs no version uses any more.
+
+        Args:
+            max_age (float): Versions older than this (seconds) are deleted.
+            max_count (int): Only the latest max_count versions are kept.
+
+        Returns:
+            int: Number of versions deleted.
+        """
+        if not os.path.isdir(self.backup_dir):
+            return 0
+        with self._lock():
+            self._load()
+            versions = self.get_versions()
+            keep = versions
+            if max_age is not None:
+                oldest = time.time() - max_age
+                keep = [entry for entry in keep if entry.created >= oldest]
+            if max_count is not None:
+                keep = keep[len(keep) - max_count :] if max_count > 0 else []
+            if len(keep) == len(versions):
+                return 0
+
+            lines = [{"last_version": self._last}]
+            lines.extend(vars(entry) for entry in keep)
+            write_chunks_atomic(
+                self._manifest_path(),
+                [(json.dumps(line) + "\n").encode() for line in lines],
+            )
+            self._versions = OrderedDict(
+                (entry.version, entry) for entry in keep
+            )
+
+            used = {entry.digest for entry in keep}
+            for entry in versions:
+                if entry.digest not in used:
+                    used.add(entry.digest)
+                    blob = self._blob_path(entry.digest)
+                    try:
+                        os.unlink(blob)
+                    except FileNotFoundError:
+                        pass
+                    try:
+                        os.rmdir(os.path.dirname(blob))
+                    except OSError:
+                        pass
+        return len(versions) - len(keep)
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.backup_dir, "objects", digest[:2], digest[2:])
+
+    def _manifest_path(self) -> str:
+        return os.path.join(self.backup_dir, "manifest.jsonl")
+
+    def _lock(self) -> _FileLock:
+        return _FileLock(os.path.join(self.backup_dir, "lock"))
+
+    def _load(self):
+        loaded = self._versions
+        self._versions = OrderedDict()
+        self._last = 0
+        if not os.path.exists(self._manifest_path()):
+            return
+        with open(self._manifest_path()) as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if "last_version" in record:
+                    self._last = max(self._last, record["last_version"])
+                    continue
+                entry = loaded.get(record["version"])
+                if entry is None or entry.digest != record["digest"]:
+                    entry = BackupVersion(**record)
+                self._versions[entry.version] = entry
+                self._last = max(self._last, entry.version)
+
+
+class Snapshot:
+    """A class representing a snapshot of a simulation folder.
+
+    Attributes:
+        snapshot_id (str): Name of the snapshot folder.
+        path (str): Path of the snapshot folder.
+        created (float): Time the snapshot was taken (seconds since epoch).
+        label (str): Free-form label.
+        files (dict): ``[size, mtime_ns]`` of every file, by relative path.
+        stats (dict): Number of files ``linked``, ``cloned``, ``copied``
+            and ``symlinked``
+            when the snapshot was taken.
+    """
+
+    def __init__(
+        self,
+        snapshot_id: str,
+        path: str,
+        created: float,
+        label: str = "",
+        files: dict = None,
+        stats: dict = None,
+    ):
+        """Initializes the snapshot."""
+        self.snapshot_id = snapshot_id
+        self.path = path
+        self.created = created
+        self.label = label
+        self.files = files or {}
+        self.stats = stats or {}
+
+    def __repr__(self) -> str:
+        return f"Snapshot({self.snapshot_id!r}, {len(self.files)} files)"
+
+
+def _split_comment(line: str) -> tuple:
+    """Splits a line into its code and its comment (None if there is none)."""
+    quoted = False
+    escaped = False
+    for idx, char in enumerate(line):
+        if escaped:
+            escaped = False
+        elif char == "\\" and quoted:
+            escaped = True
+        elif char == '"':
+            quoted = not quoted
+        elif char == "#" and not quoted:
+            return line[:idx], line[idx + 1 :]
+    return line, None
+
+
+def _section_name(heading: str) -> str:
+    """Gets the section name from the text between the brackets of a heading."""
+    heading = heading.strip()
+    if heading.startswith("Config ") or heading.startswith("Config\t"):
+        return heading[7:].strip()
+    return heading
+
+
+_INDEX_RE = re.compile(r"\[\d+\]")
+_RANGE_RE = re.compile(r"^\s*(\d*)\s*\.\.\s*(\d*)\s*$")
+
+
+def _pattern_regex(pattern: str) -> str:
+    """Translates an OMNeT++ wildcard pattern into a regular expression."""
+    regex = []
+    idx = 0
+    while idx < len(pattern):
+        char = pattern[idx]
+        close = -1
+        if char in "{[":
+            close = pattern.find("}" if char == "{" else "]", idx)
+        body = pattern[idx + 1 : close] if close != -1 else ""
+
+        if char == "\\" and idx + 1 < len(pattern):
+            regex.append(re.escape(pattern[idx + 1]))
+            idx += 2
+            continue
+        elif pattern.startswith("**", idx):
+            regex.append(".*")
+            idx += 2
+            continue
+        elif char == "*":
+            regex.append("[^.]*")
+        elif char == "?":
+            regex.append("[^.]")
+        elif close != -1 and _RANGE_RE.match(body):
+            low, high = _RANGE_RE.match(body).groups()
+            number = r"(?<!\d)" + _range_regex(low, high) + r"(?!\d)"
+            regex.append(number if char == "{" else rf"\[{number}\]")
+            idx = close + 1
+            continue
+        elif char == "{" and close != -1:
+            negated = body.startswith("^")
+            chars = "".join(
+                "-" if c == "-" else re.escape(c)
+                for c in (body[1:] if negated else body)
+            )
+            regex.append(f"[{'^' if negated else ''}{chars}]")
+            idx = close + 1
+            continue
+        else:
+            regex.append(re.escape(char))
+        idx += 1
+    return "".join(regex)
+
+
+def _range_regex(low: str, high: str) -> str:
+    """Builds a regular expression matching the integers of a range."""
+    low = int(low) if low else 0
+    if not high:
+        digits = len(str(low))
+        tail = rf"[1-9]\d{{{digits},}}"
+        return f"(?:{_range_regex(str(low), '9' * digits)}|{tail})"
+
+    high = int(high)
+    parts = []
+    while low <= high:
+        top = min(high, 10 ** len(str(low)) - 1)
+        parts.append(_same_length_range(str(low), str(top)))
+        low = top + 1
+    return "(?:" + "|".join(parts) + ")" if parts else "(?!)"
+
+
+def _same_length_range(low: str, high: str) -> str:
+    """Builds a regular expression for a range of same-length numbers."""
+    if low == high:
+        return low
+    if len(low) == 1:
+        return f"[{low}-{high}]"
+    if low[0] == high[0]:
+        return low[0] + _same_length_range(low[1:], high[1:])
+
+    rest = len(low) - 1
+    parts = []
+    first, last = low[0], high[0]
+    if low[1:] != "0" * rest:
+        parts.append(low[0] + _same_length_range(low[1:], "9" * rest))
+        first = chr(ord(first) + 1)
+    tail = None
+    if high[1:] != "9" * rest:
+        tail = high[0] + _same_length_range("0" * rest, high[1:])
+        last = chr(ord(last) - 1)
+    if first <= last:
+        parts.append(f"[{first}-{last}]" + rf"\d{{{rest}}}")
+    if tail is not None:
+        parts.append(tail)
+    return "(?:" + "|".join(parts) + ")"
+
+
+def _is_index_insensitive(pattern: str) -> bool:
+    """Checks if a pattern matches every module index in the same way."""
+    return not any(char.isdigit() or char in "?{\\" for char in pattern)
+
+
+def compile_ned_expression(text: str) -> NedExpression:
+    """
+    Compiles a NED expression for vectorized evaluation.
+
+    Args:
+        text (str): The expression, e.g. ``int(2*pow(${arity},${numStages}))``.
+
+    Returns:
+        NedExpression: The compiled expression.
+    """
+    return NedExpression(text)
+
+
+def _vector_value(text: str):
+    """Gets an iteration value as a constant or as a compiled expression."""
+    try:
+        expression = NedExpression(text)
+    except ValueError:
+        return text
+    if expression.tree[0] == "const":
+        return expression.tree[1]
+    return expression
+
+
+def _ned_variables(node: tuple) -> set:
+    """Gets the names of the variables a syntax tree refers to."""
+    if node[0] == "var":
+        return {node[1]}
+    if node[0] == "const":
+        return set()
+    children = node[2] if node[0] == "call" else node[1:]
+    names = set()
+    for child in children:
+        if isinstance(child, tuple):
+            names |= _ned_variables(child)
+    return names
+
+
+def _compile_ned(node: tuple):
+    """Compiles a syntax tree into a function of the variable values."""
+    kind = node[0]
+    if kind == "const":
+        value = node[1]
+        return lambda env: value
+    if kind == "var":
+        name = node[1]
+
+        def variable(env):
+            if name not in env:
+                raise ValueError(f"Unknown variable {name} in expression")
+            return env[name]
+
+        return variable
+    if kind == "call":
+        function = _NED_VECTOR_FUNCTIONS[node[1]]
+        args = [_compile_ned(arg) for arg in node[2]]
+        return lambda env: function(*(arg(env) for arg in args))
+    if kind == "cond":
+        test, if_true, if_false = (_compile_ned(part) for part in node[1:])
+        return lambda env: np.where(test(env), if_true(env), if_false(env))
+    if kind == "unary":
+        operand = _compile_ned(node[2])
+        function = {
+            "!": np.logical_not,
+            "-": np.negative,
+            "+": np.positive,
+        }[node[1]]
+        return lambda env: function(operand(env))
+
+    function = _NED_VECTOR_OPERATORS[node[1]]
+    left, right = _compile_ned(node[2]), _compile_ned(node[3])
+    return lambda env: function(left(env), right(env))
+
+
+def _ned_int(value):
+    """Truncates numbers toward zero, as NED's int() does."""
+    return np.trunc(value).astype(np.int64)
+
+
+def _ned_pow(base, exponent):
+    """Raises a number to a power, as a double like NED's pow()."""
+    return np.power(np.asarray(base, dtype=np.float64), exponent)
+
+
+if np is not None:
+    _NED_VECTOR_FUNCTIONS = {
+        "int": _ned_int,
+        "double": lambda x: np.asarray(x, dtype=np.float64),
+        "pow": _ned_pow,
+        "sqrt": np.sqrt,
+        "exp": np.exp,
+        "log": np.log,
+        "log10": np.log10,
+        "floor": np.floor,
+        "ceil": np.ceil,
+        "fabs": np.fabs,
+        "fmod": np.fmod,
+        "hypot": np.hypot,
+        "min": np.minimum,
+        "max": np.maximum,
+        "sin": np.sin,
+        "cos": np.cos,
+        "tan": np.tan,
+    }
+    _NED_VECTOR_OPERATORS = {
+        "||": np.logical_or,
+        "##": np.logical_xor,
+        "&&": np.logical_and,
+        "==": np.equal,
+        "!=": np.not_equal,
+        "<": np.less,
+        "<=": np.less_equal,
+        ">": np.greater,
+        ">=": np.greater_equal,
+        "+": np.add,
+        "-": np.subtract,
+        "*": np.multiply,
+        "/": np.true_divide,
+        "%": np.mod,
+        "^": _ned_pow,
+    }
+
+
+_ITERATION_NAME_RE = re.compile(
+    r"^\s*([A-Za-z_]\w*)\s*=(?!=)\s*(.*?)\s*$", re.S
+)
+_ITERATION_PARALLEL_RE = re.compile(r"^(.*?)\s*!\s*([A-Za-z_]\w*)\s*$", re.S)
+_ITERATION_RANGE_RE = re.compile(
+    r"^(.+?)\s*\.\.\s*(.+?)(?:\s+step\s+(.+))?$", re.S
+)
+_IDENTIFIER_RE = re.compile(r"^\s*([A-Za-z_]\w*)\s*$")
+_REFERENCE_RE = re.compile(r"\$\{\s*([A-Za-z_]\w*)\s*\}")
+_NED_TOKEN_RE = re.compile(
+    r"""\s*(?:
+    (?P<num>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?) |
+    (?P<str>"(?:[^"\\]|\\.)*") |
+    (?P<var>\$\{\s*[A-Za-z_]\w*\s*\}|\$[A-Za-z_]\w*) |
+    (?P<name>[A-Za-z_]\w*) |
+    (?P<op>&&|\|\||\#\#|==|!=|<=|>=|[-+*/%^<>!?:(),])
+    )""",
+    re.X,
+)
+_NED_BINARY = {
+    "||": 1,
+    "##": 2,
+    "&&": 3,
+    "==": 4,
+    "!=": 4,
+    "<": 5,
+    "<=": 5,
+    ">": 5,
+    ">=": 5,
+    "+": 6,
+    "-": 6,
+    "*": 7,
+    "/": 7,
+    "%": 7,
+}
+_NED_FUNCTIONS = {
+    "int": lambda x: int(x),
+    "double": float,
+    "pow": math.pow,
+    "sqrt": math.sqrt,
+    "exp": math.exp,
+    "log": math.log,
+    "log10": math.log10,
+    "floor": math.floor,
+    "ceil": math.ceil,
+    "fabs": math.fabs,
+    "fmod": math.fmod,
+    "hypot": math.hypot,
+    "min": min,
+    "max": max,
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+}
+
+
+def _find_iterations(text: str) -> list:
+    """Gets the bodies of the top-level ``${...}`` blocks of a value."""
+    bodies = []
+    idx = text.find("${")
+    while idx != -1:
+        depth = 0
+        for end in range(idx + 1, len(text)):
+            if text[end] == "{":
+                depth += 1
+            elif text[end] == "}":
+                depth -= 1
+                if depth == 0:
+                    bodies.append(text[idx + 2 : end])
+                    break
+        else:
+            raise ValueError(f"Unterminated iteration in {text!r}")
+        idx = text.find("${", end + 1)
+    return bodies
+
+
+def _split_top_level(text: str, separator: str = ",") -> list:
+    """Splits a text on a separator outside quotes, parentheses and braces."""
+    parts = []
+    depth = 0
+    quoted = False
+    start = 0
+    for idx, char in enumerate(text):
+        if char == '"' and (idx == 0 or text[idx - 1] != "\\"):
+            quoted = not quoted
+        elif quoted:
+            continue
+        elif char in "({[":
+            depth += 1
+        elif char in ")}]":
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(text[start:idx])
+            start = idx + 1
+    parts.append(text[start:])
+    return parts
+
+
+def _parse_iteration(body: str, name: str) -> IterationVariable:
+    """Parses the body of a ``${...}`` block that defines a variable."""
+    named = _ITERATION_NAME_RE.match(body)
+    if named:
+        name, body = named.groups()
+
+    parallel = None
+    lockstep = _ITERATION_PARALLEL_RE.match(body)
+    if lockstep and not lockstep.group(1).rstrip().endswith(("=", "!")):
+        body, parallel = lockstep.groups()
+
+    items = []
+    for item in _split_top_level(body):
+        item = item.strip()
+        found = _ITERATION_RANGE_RE.match(item)
+        if found and not item.startswith('"'):
+            try:
+                low, high, step = (
+                    _ned_number(part) if part is not None else 1
+                    for part in found.groups()
+                )
+            except ValueError:
+                raise ValueError(
+                    f"Range {item!r} of iteration variable {name} must be "
+                    "made of numbers"
+                ) from None
+            if step == 0:
+                raise ValueError(f"Range {item!r} has a zero step")
+            items.append((low, high, step))
+        else:
+            items.append(item)
+    return IterationVariable(name, items, parallel)
+
+
+def _item_count(item) -> int:
+    """Counts the values of a literal or a range of an iteration variable."""
+    if isinstance(item, str):
+        return 1
+    low, high, step = item
+    if (high - low) * step < 0:
+        return 0
+    return int(math.floor((high - low) / step + 1e-9)) + 1
+
+
+def _format_number(value) -> str:
+    """Formats a number the way it is written in an omnetpp.ini file."""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if isinstance(value, int):
+        return str(value)
+    return f"{value:.12g}"
+
+
+def _ned_number(text: str):
+    """Parses a NED number literal, keeping integers as int."""
+    text = text.strip()
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _ned_literal(value):
+    """Converts the text of an iteration value to a NED value."""
+    if not isinstance(value, str):
+        return value
+    text = value.strip()
+    if text in ("true", "false"):
+        return text == "true"
+    if len(text) >= 2 and text[0] == text[-1] == '"':
+        return text[1:-1]
+    try:
+        return _ned_number(text)
+    except ValueError:
+        pass
+    try:
+        return evaluate_ned_expression(text, {})
+    except (ValueError, TypeError, ArithmeticError):
+        return text
+
+
+def _substitute_variables(text: str, run: dict, depth: int = 0) -> str:
+    """Replaces the ``${name}`` references of a value with their values."""
+    if "${" not in text:
+        return text
+    if depth > len(run):
+        raise ValueError(f"Circular iteration variable reference in {text!r}")
+
+    def replace(found):
+        name = found.group(1)
+        if name not in run:
+            raise ValueError(f"Unknown iteration variable {name}")
+        return _substitute_variables(run[name], run, depth + 1)
+
+    return _REFERENCE_RE.sub(replace, text)
+
+
+def _repeat_tile(items: array, inner: int, outer: int) -> array:
+    """Repeats every item inner times, and the result outer times."""
+    if np is not None and items:
+        dtype = np.int32 if items.typecode == "i" else np.float64
+        values = np.frombuffer(items, dtype=dtype)
+        return array(
+            items.typecode, np.tile(np.repeat(values, inner), outer).tobytes()
+        )
+    return array(
+        items.typecode,
+        (item for _ in range(outer) for item in items for _ in range(inner)),
+    )
+
+
+def build_run_space(effective: EffectiveConfig) -> RunSpace:
+    """
+    Collects the iteration variables of a configuration.
+
+    Args:
+        effective (EffectiveConfig): The flattened parameters of the configuration.
+
+    Returns:
+        RunSpace: The runs the configuration produces.
+    """
+    bodies = []
+    for key, entry in effective.keys.items():
+        if key in ("constraint", "repeat"):
+            continue
+        bodies.extend(_find_iterations(entry.value))
+
+    variables = []
+    names = set()
+    for body in bodies:
+        if _IDENTIFIER_RE.match(body):
+            continue
+        var = _parse_iteration(body, f"${len(variables)}")
+        if var.name not in names:
+            names.add(var.name)
+            variables.append(var)
+
+    repeat = effective.get_value("repeat")
+    return RunSpace(
+        effective.name,
+        variables,
+        effective.get_value("constraint"),
+        int(repeat) if repeat else 1,
+    )
+
+
+def parse_ned_expression(text: str) -> tuple:
+    """
+    Parses a NED expression, as used by ``constraint`` and iteration values.
+
+    Args:
+        text (str): The expression.
+
+    Returns:
+        tuple: The syntax tree of the expression.
+
+    Raises:
+        ValueError: If the expression cannot be parsed.
+    """
+    tokens = []
+    idx = 0
+    text = text.strip()
+    while idx < len(text):
+        found = _NED_TOKEN_RE.match(text, idx)
+        if found is None or found.end() == idx:
+            raise ValueError(f"Invalid expression {text!r} at {idx}")
+        kind = found.lastgroup
+        tokens.append((kind, found.group(kind)))
+        idx = found.end()
+        while idx < len(text) and text[idx].isspace():
+            idx += 1
+    tokens.append(("end", None))
+
+    position = [0]
+
+    def peek():
+        return tokens[position[0]]
+
+    def take(expected=None):
+        token = tokens[position[0]]
+        if expected is not None and token[1] != expected:
+            raise ValueError(f"Expected {expected!r} in expression {text!r}")
+        position[0] += 1
+        return token
+
+    def expression(min_precedence=0):
+        node = unary()
+        while True:
+            kind, op = peek()
+            precedence = _NED_BINARY.get(op) if kind == "op" else None
+            if precedence is None or precedence < min_precedence:
+                break
+            take()
+            node = ("binary", op, node, expression(precedence + 1))
+        if min_precedence == 0 and peek() == ("op", "?"):
+            take()
+            if_true = expression()
+            take(":")
+            node = ("cond", node, if_true, expression())
+        return node
+
+    def unary():
+        kind, op = peek()
+        if kind == "op" and op in ("-", "+", "!"):
+            take()
+            return ("unary", op, unary())
+        base = primary()
+        if peek() == ("op", "^"):
+            take()
+            return ("binary", "^", base, unary())
+        return base
+
+    def primary():
+        kind, value = take()
+        if kind == "num":
+            return ("const", _ned_number(value))
+        if kind == "str":
+            return ("const", value[1:-1])
+        if kind == "var":
+            return ("var", value.strip("${} \t"))
+        if kind == "name":
+            if value in ("true", "false"):
+                return ("const", value == "true")
+            if peek() == ("op", "("):
+                take()
+                args = []
+                if peek() != ("op", ")"):
+                    args.append(expression())
+                    while peek() == ("op", ","):
+                        take()
+                        args.append(expression())
+                take(")")
+                if value not in _NED_FUNCTIONS:
+                    raise ValueError(f"Unknown function {value}()")
+                return ("call", value, tuple(args))
+            return ("var", value)
+        if (kind, value) == ("op", "("):
+            node = expression()
+            take(")")
+            return node
+        raise ValueError(f"Unexpected {value!r} in expression {text!r}")
+
+    node = expression()
+    if peek()[0] != "end":
+        raise ValueError(f"Unexpected {peek()[1]!r} in expression {text!r}")
+    return node
+
+
+def evaluate_ned_expression(node, env: dict):
+    """
+    Evaluates a NED expression for one set of variable values.
+
+    Args:
+        node (tuple | str): A syntax tree from parse_ned_expression, or the
+            text of an expression.
+        env (dict): Values of the variables by name.
+
+    Returns:
+        The value of the expression.
+    """
+    if isinstance(node, str):
+        node = parse_ned_expression(node)
+
+    kind = node[0]
+    if kind == "const":
+        return node[1]
+    if kind == "var":
+        if node[1] not in env:
+            raise ValueError(f"Unknown variable {node[1]} in expression")
+        return env[node[1]]
+    if kind == "call":
+        args = [evaluate_ned_expression(arg, env) for arg in node[2]]
+        return _NED_FUNCTIONS[node[1]](*args)
+    if kind == "cond":
+        branch = node[2] if evaluate_ned_expression(node[1], env) else node[3]
+        return evaluate_ned_expression(branch, env)
+    if kind == "unary":
+        value = evaluate_ned_expression(node[2], env)
+        if node[1] == "!":
+            return not value
+        return -value if node[1] == "-" else value
+
+    op, left = node[1], evaluate_ned_expression(node[2], env)
+    if op == "&&":
+        return bool(left) and bool(evaluate_ned_expression(node[3], env))
+    if op == "||":
+        return bool(left) or bool(evaluate_ned_expression(node[3], env))
+    right = evaluate_ned_expression(node[3], env)
+    if op == "^":
+        return math.pow(left, right)
+    if op == "##":
+        return bool(left) != bool(right)
+    return _NED_OPERATORS[op](left, right)
+
+
+_NED_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "%": operator.mod,
+}
+
+
+def _file_signature(path: str) -> tuple:
+    """Gets the (st_mtime_ns, st_size, st_ino) signature of a file."""
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+_FILE_DIGESTS = {}
+
+
+def _file_digest(path: str) -> str:
+    """Gets the SHA-256 of a file, cached until the file changes."""
+    signature = _file_signature(path)
+    cached = _FILE_DIGESTS.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    with open(path, "rb") as file:
+        digest = hashlib.sha256(file.read()).hexdigest()
+    _FILE_DIGESTS[path] = (signature, digest)
+    return digest
+
+
+_INCLUDE_DIGESTS = {}
+
+
+def _include_digests(path: str) -> list:
+    """Gets the digests of an included file and everything it includes."""
+    cached = _INCLUDE_DIGESTS.get(path)
+    if cached is not None:
+        files, missing, digests = cached
+        try:
+            if all(_file_signature(f) == s for f, s in files) and not any(
+                os.path.exists(f) for f in missing
+            ):
+                return digests
+        except FileNotFoundError:
+            pass
+    if not os.path.exists(path):
+        return None
+
+    document = INCLUDE_GRAPH.load(path)
+    files = tuple((f, _file_signature(f)) for f in document.files)
+    digests = [_file_digest(f) for f, _ in files]
+    _INCLUDE_DIGESTS[path] = (files, tuple(document.missing), digests)
+    return digests
+
+
+def _include_path(including_file: str, target: str) -> str:
+    """Resolves an include target relative to the file that includes it."""
+    target = target.strip().strip('"')
+    return os.path.realpath(
+        os.path.join(os.path.dirname(including_file), target)
+    )
+
+
+def _in_section(entry, section: str):
+    """Gets the entry as it appears in a section, copying it if needed."""
+    if not isinstance(entry, IniEntry) or entry.section == (
+        section or "General"
+    ):
+        return entry
+    return IniEntry(
+        entry.key,
+        entry.value,
+        entry.comment,
+        section or "General",
+        entry.path,
+        entry.lineno,
+        entry.end_lineno,
+        entry.value_span,
+    )
+
+
+# ----- Methods ----- #
+
+
+def list_topologies(topologies):
+    for topology in Topologies:
+        topologies.append(topology.name)
+
+
+def list_switch_architectures(sw_archs):
+    for sw_arch in SwArchs:
+        sw_archs.append(sw_arch.name)
+
+
+def list_switch_arbiters(sw_arbiters):
+    for sw_arb in SwArbiters:
+        sw_arbiters.append(sw_arb.name)
+
+
+def list_switch_queue_schemes(sw_queue_schemes):
+    for sw_queue in CongestionTechniques:
+        sw_queue_schemes.append(sw_queue.name)
+
+
+def list_switch_routing_algorithms(sw_routing_algorithms):
+    for sw_algorithm in RoutingAlgorithms:
+        sw_routing_algorithms.append(sw_algorithm.name)
+
+
+def list_applications(apps):
+    for app in Applications:
+        apps.append(app.name)
+
+
+def list_congestion_control_technique(apps):
+    for congestion in CongestionTechniques:
+        apps.append(congestion.name)
+
+
+# def check_configuration(simulation, config_name="[Config"):
+#     """
+#     It checks if there is a configuration defined in the omnetpp.ini file
+#
+#     :param simulation: the simulation folder to be checked
+#     :param config_name: the name of the configuration to be checked. The default value checks if there is any configuration
+#     :returns: True if the configuration was found. Prints "Not Found" otherwise
+#     """
+#
+#     opp_file = simulation.get_root_dir() + "/omnetpp.ini"
+#
+#     # Open the file and search for the target line
+#     with open(opp_file, "r") as file:
+#         for line_number, line in enumerate(file, start=1):
+#             if config_name in line:
+#                 return True
+#         else:
+#             print("Not Found")
+
+
+def load_document(opp_file: str) -> OppIniDocument:
+    """
+    Reads and tokenizes an omnetpp.ini file, unless it is already cached.
+
+    Args:
+        opp_file (str): Path of the omnetpp.ini file.
+
+    Returns:
+        OppIniDocument: The tokenized file, shared through PARSE_CACHE.
+    """
+    return PARSE_CACHE.load(opp_file)
+
+
+def get_document(simulation) -> OppIniDocument:
+    """
+    Reads and tokenizes the omnetpp.ini file of a simulation.
+
+    Args:
+        simulation (Simulation): the simulation folder to be read.
+
+    Returns:
+        OppIniDocument: The tokenized omnetpp.ini file.
+    """
+    return load_document(
+        os.path.join(simulation.get_root_dir(), "omnetpp.ini")
+    )
+
+
+def load_merged_document(opp_file: str) -> OppIniDocument:
+    """
+    Reads an omnetpp.ini file and every file it includes, recursively.
+
+    Args:
+        opp_file (str): Path of the omnetpp.ini file.
+
+    Returns:
+        OppIniDocument: The merged document, shared through INCLUDE_GRAPH.
+
+    Raises:
+        ValueError: If the includes form a cycle.
+    """
+    return INCLUDE_GRAPH.load(opp_file)
+
+
+def get_merged_document(simulation) -> OppIniDocument:
+    """
+    Reads the omnetpp.ini file of a simulation and every file it includes.
+
+    Args:
+        simulation (Simulation): the simulation folder to be read.
+
+    Returns:
+        OppIniDocument: The merged document.
+    """
+    return load_merged_document(
+        os.path.join(simulation.get_root_dir(), "omnetpp.ini")
+    )
+
+
+def check_configuration(simulation) -> str:
+    """
+    It returns the name of the configuration from omnetpp.ini.
+
+    Args:
+        simulation (Simulation): the simulation folder to be checked.
+
+    Returns:
+        str: the name of the configuration.
+    """
+    try:
+        document = get_document(simulation)
+    except FileNotFoundError as FE:
+        return f"Error: File {FE.filename} not found"
+
+    config_name = document.get_comment_field("Configuration")
+    if config_name is None:
+        return "Nothing Found"
+    return config_name
+
+
+# ----- Getters ----- #
+
+
+def get_configuration(simulation) -> str:
+    """
+    It retrieves the first configuration within the omnetpp.ini file.
+
+    Args:
+        simulation (Simulation): the simulation folder to be checked.
+
+    Returns:
+        str: The first configuration found in the omnetpp.ini file. Prints "Nothing Found" if no configurations where found
+    """
+    try:
+        document = get_document(simulation)
+    except FileNotFoundError as FE:
+        return f"Error: File {FE.filename} not found"
+
+    configs = document.get_configs()
+    if not configs:
+        return "Nothing Found"
+    return configs[0]
+
+
+def get_run_configuration(simulation) -> str:
+    """
+    Gets the configuration of the omnetpp.ini file a simulation is run with.
+
+    Sections written by add_new_configuration are named after
+    set_configuration_name. set_new_configuration only leaves that name
+    in the ``# Configuration:`` comment, so the first configuration of the
+    file is run instead.
+
+    Args:
+        simulation (Simulation): The simulation, already written.
+
+    Returns:
+        str: The set_configuration_name section if the file has it, the
+        first configuration otherwise, or General if there is none.
+
+    Raises:
+        FileNotFoundError: If the omnetpp.ini file does not exist.
+    """
+    document = get_document(simulation)
+    config_name = set_configuration_name(simulation)
+    if document.get_section(config_name) is not None:
+        return config_name
+    configs = document.get_configs()
+    return configs[0] if configs else "General"
+
+
+def get_configurations(simulation):
+    """
+    It retrieves all the configurations within the omnetpp.ini file
+
+    :param simulation: the simulation folder to be checked
+    :returns: A list of the configurations located in the omnetpp.ini file. Prints "Nothing Found" if no configurations where found
+    """
+    configs = get_document(simulation).get_configs()
+    if not configs:
+        print("Nothing Found")
+
+    return configs
+
+
+def simulation_hash(simulation) -> str:
+    """
+    Gets the content hash of the configuration of a simulation.
+
+    The hash covers the topology, switch and application parameters, the
+    template the file is rendered from and the contents of every file it
+    includes, so equal hashes mean equal configurations. It does not
+    depend on the root directory of the simulation, so it can key result
+    caches across folders.
+
+    Args:
+        simulation (Simulation): The simulation.
+
+    Returns:
+        str: The SHA-256 hex digest.
+    """
+    template = CONFIGURATION_TEMPLATES.get(
+        simulation.topology.get_network(), CONFIGURATION_TEMPLATES[None]
+    )
+    root_dir = simulation.get_root_dir()
+    includes = {
+        target: _include_digests(os.path.join(root_dir, target.strip('"')))
+        for target in template.includes
+    }
+
+    spec = SimulationSpec.from_simulation(simulation)
+    canonical = {
+        "topology": spec.topology._asdict(),
+        "switch": spec.switch._asdict(),
+        "app": spec.app._asdict(),
+        "template": template.digest,
+        "includes": includes,
+    }
+    text = json.dumps(
+        canonical, sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def get_configuration_hash(simulation) -> str:
+    """
+    Gets the hash stored in the omnetpp.ini file of a simulation.
+
+    Args:
+        simulation (Simulation): The simulation folder to be checked.
+
+    Returns:
+        str: The ``# Hash:`` value, or None if the file has none.
+    """
+    return get_document(simulation).get_comment_field("Hash")
+
+
+def get_effective_hash(simulation, config_name: str) -> str:
+    """
+    Gets the content hash of the parameters a configuration runs with.
+
+    Unlike simulation_hash, it is computed from the omnetpp.ini file on
+    disk: the parameters that take effect in the configuration and the
+    contents of every file it includes. Comments in the omnetpp.ini file
+    itself do not change it.
+
+    Args:
+        simulation (Simulation): The simulation folder to be checked.
+        config_name (str): ``General`` or the name of a configuration.
+
+    Returns:
+        str: The SHA-256 hex digest.
+    """
+    path = os.path.join(simulation.get_root_dir(), "omnetpp.ini")
+    effective = get_merged_document(simulation).get_effective(config_name)
+    canonical = {
+        "config": config_name,
+        "params": effective.get_params(),
+        "includes": (_include_digests(path) or [])[1:],
+    }
+    text = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def get_config_inputs(simulation, config_name: str) -> dict:
+    """
+    Gets the files the runs of a configuration depend on.
+
+    These are the omnetpp.ini file, the files that define the sections the
+    configuration looks up (see OppIniDocument.get_linearization) and the
+    included files that are missing, which would change the runs if they
+    appeared. Files that only define other configurations are left out.
+
+    Args:
+        simulation (Simulation): The simulation folder to be checked.
+        config_name (str): ``General`` or the name of a configuration.
+
+    Returns:
+        dict: SHA-256 of every file by real path, None if it is missing.
+    """
+    path = os.path.realpath(
+        os.path.join(simulation.get_root_dir(), "omnetpp.ini")
+    )
+    document = get_merged_document(simulation)
+    files = {path}
+    for section_name in document.get_linearization(config_name):
+        for entry in document.sections[section_name].entries:
+            if entry.path:
+                files.add(os.path.realpath(entry.path))
+    inputs = {file: _file_digest(file) for file in sorted(files)}
+    for missing in document.missing:
+        inputs[os.path.realpath(missing)] = None
+    return inputs
+
+
+def get_switch_architecture(simulation):
+    """
+    It retrieves the current switch architecture in use
+
+    :param simulation: the simulation folder to be checked
+    :returns: a string with the current switch architecture being used
+    """
+    section = get_merged_document(simulation).get_section("portConfig")
+    if section is None:
+        return None
+
+    extends = section.get_extends()
+    return extends[0] if extends else None
+
+
+def get_switch_routing(simulation):
+    """
+    It retrieves the current switch routing algorithm in use
+
+    :param simulation: the simulation folder to be checked
+    :returns: a string with the current switch routing algorithm being used
+    """
+    return get_merged_document(simulation).get_value("**.routingAlgorithm")
+
+
+def get_switch_arbiter(simulation):
+    """
+    It retrieves the current switch arbiter in use
+
+    :param simulation: the simulation folder to be checked
+    :returns: a string with the current switch arbiter being used
+    """
+    return get_merged_document(simulation).get_value(
+        "**.SW[*].arbiter.typename"
+    )
+
+
+def get_switch_request_processing_time(simulation):
+    """
+    It retrieves the current switch request processing time in use
+
+    :param simulation: the simulation folder to be checked
+    :returns: a string with the current switch request processing time
+    """
+    return get_merged_document(simulation).get_value(
+        "**.requestProcessingTime"
+    )
+
+
+def get_config_linearization(simulation, config_name: str) -> list:
+    """
+    It retrieves the sections a configuration inherits parameters from
+
+    Args:
+        simulation (Simulation): the simulation folder to be checked.
+        config_name (str): ``General`` or the name of a configuration.
+
+    Returns:
+        list: Section names, from the configuration down to ``General``.
+    """
+    document = get_merged_document(simulation)
+    return document.get_effective(config_name).linearization
+
+
+def get_effective_parameters(simulation, config_name: str) -> dict:
+    """
+    It retrieves the parameters that take effect in a configuration
+
+    Args:
+        simulation (Simulation): the simulation folder to be checked.
+        config_name (str): ``General`` or the name of a configuration.
+
+    Returns:
+        dict: Values by key, following the ``extends`` chain and ``General``.
+    """
+    document = get_merged_document(simulation)
+    return document.get_effective(config_name).get_params()
+
+
+def effective_value(simulation, config_name: str, path: str) -> str:
+    """
+    It retrieves the value a parameter takes in a configuration
+
+    Args:
+        simulation (Simulation): the simulation folder to be checked.
+        config_name (str): ``General`` or the name of a configuration.
+        path (str): Full path of the parameter, e.g. ``Net.SW[17].arbiter.typename``.
+
+    Returns:
+        str: The value of the first matching pattern, or None.
+    """
+    document = get_merged_document(simulation)
+    return document.effective_value(config_name, path)
+
+
+def enumerate_runs(simulation, config_name: str) -> RunSpace:
+    """
+    It retrieves the runs a configuration produces, without expanding them
+
+    Args:
+        simulation (Simulation): the simulation folder to be checked.
+        config_name (str): ``General`` or the name of a configuration.
+
+    Returns:
+        RunSpace: The runs. Iterate it to get them lazily, index it by run
+        number for random access, or use len() to count them.
+    """
+    document = get_merged_document(simulation)
+    return document.get_effective(config_name).get_runs()
+
+
+def count_runs(simulation, config_name: str) -> int:
+    """
+    It counts the runs a configuration produces
+
+    Args:
+        simulation (Simulation): the simulation folder to be checked.
+        config_name (str): ``General`` or the name of a configuration.
+
+    Returns:
+        int: The number of runs.
+    """
+    return len(enumerate_runs(simulation, config_name))
+
+
+def evaluate_sweep(simulation, config_name: str) -> dict:
+    """
+    It evaluates the iteration variables of every run of a configuration
+
+    Args:
+        simulation (Simulation): the simulation folder to be checked.
+        config_name (str): ``General`` or the name of a configuration.
+
+    Returns:
+        dict: A NumPy array per iteration variable, one item per run.
+    """
+    return enumerate_runs(simulation, config_name).evaluate()
+
+
+# ----- Templates ----- #
+
+
+_TEMPLATE_FIELD_RE = re.compile(r"@(\w+)@")
+
+DEFAULT_TEMPLATE = ConfigTemplate(
+    "[General]\n"
+    "network = @network_name@\n"
+    "\n"
+    "#warmup-period=0.00025s\n"
+    "\n"
+    "cmdenv-status-frequency = 5s\n"
+    "sim-time-limit = 0.002000001s\n"
+    "cmdenv-interactive=true\n"
+    "#Net\n"
+    '**.topology = "topology_name"\n'
+    "#**.arity = ${arity=2}\n"
+    "#**.numStages = ${numStages=3}\n"
+    "#**.numNodes = ${numNodes = int(2*pow(${arity},${numStages}))}\n"
+    "**.channelDistance = @channel_distance@m\n"
+    "\n"
+    "#Routing and Arbitration\n"
+    '**.routingAlgorithm = "destro"\n'
+    '**.H[*].arbiter.typename = "Arbiter_TwoPhased"\n'
+    '#**.SW[*].arbiter.typename = "Arbiter_TwoPhased"\n'
+    "**.requestProcessingTime = 6ns"
+    "\n"
+    "\n"
+    "#Logging\n"
+    "**.logInterval = 10us\n"
+    "\n"
+    "**.sysMng.**.result-recording-modes = default, +vector,+histogram\n"
+    "**.sys.app*-**.result-recording-modes = default, +vector,+histogram\n"
+    "\n"
+    "# Stats to record per node - we have to indicate the stat that we want to recollect\n"
+    "#**.H[127].throughput.\n"
+    "**.H[*].**.scalar-recording = false\n"
+    "**.SW[*].**.scalar-recording = false\n"
+    "**.param-recording = false\n"
+    "\n"
+    "#Port Configurations\n"
+    "include ../TrafficConfigurations/PortPFC.ini\n"
+    "include ../TrafficConfigurations/originalPort.ini\n"
+    "\n"
+    "\n"
+    "# Port configuration for IQ switch\n"
+    "[Config portConfig] #Note that the config included extends from General and portConfig, change the next extend to test other technologies\n"
+    "#extends=IB-NDR  # IQ\n"
+    "extends=bxi3	# CIOQ\n"
+    "\n"
+    "#Queuing schemes configurations\n"
+    "include ../TrafficConfigurations/indirect/schemes.ini\n"
+    "\n"
+    "#Traffic generation modes\n"
+    "include ../TrafficConfigurations/indirect/random.ini\n"
+    "include ../TrafficConfigurations/indirect/hotspot.ini\n"
+    "include ../TrafficConfigurations/indirect/victim.ini\n"
+    "include ../TrafficConfigurations/indirect/local.ini\n"
+    "include ../TrafficConfigurations/indirect/storage.ini\n"
+    "include ../TrafficConfigurations/indirect/ebb.ini\n"
+    "include ../TrafficConfigurations/indirect/ebb_hs.ini\n"
+    "include ../TrafficConfigurations/indirect/zipf1.ini\n"
+    "include ../TrafficConfigurations/indirect/sla3.ini\n"
+    "include ../TrafficConfigurations/indirect/ptrans.ini\n"
+    "include ../TrafficConfigurations/indirect/natRing.ini\n"
+    "include ../TrafficConfigurations/indirect/graph500.ini\n"
+    "\n"
+)
+
+_HEADER_TEXT = (
+    "[General]\n"
+    "# Configuration: @config_name@\n"
+    "# Hash: @hash@\n"
+    "network = @network_name@\n"
+    "\n"
+    "#warmup-period=0.00025s\n"
+    "\n"
+    "cmdenv-status-frequency = 5s\n"
+    "sim-time-limit = 0.002000001s\n"
+    "cmdenv-interactive=true\n"
+    "#Net\n"
+    '**.topology = "@topology_name@"\n'
+)
+
+_RLFT_TEXT = (
+    "**.arity = ${arity=@arity@}\n"
+    "**.numStages = ${numStages=@stages@}\n"
+    "**.numNodes = ${numNodes = int(2*pow(${arity},${numStages}))}\n"
+    "\n"
+)
+
+_TORUS2D_TEXT = (
+    "**.nD0 = ${nD0=@dim0@}\n"
+    "**.nD1 = ${nD1=@dim1@}\n"
+    "**.nodesInEachDim = ${@dim0@} ${@dim1@}\n"
+    "**.numNodes = ${numNodes=${nD0}*${nD1}}\n"
+    "\n"
+)
+
+_BODY_TEXT = (
+    "**.channelDistance = @channel_distance@m\n"
+    "\n"
+    "#Routing and Arbitration\n"
+    '**.routingAlgorithm = "@routing@"\n'
+    '**.H[*].arbiter.typename = "Arbiter_TwoPhased"\n'
+    '**.SW[*].arbiter.typename = "@arbiter@"\n'
+    "**.requestProcessingTime = 6ns"
+    "\n"
+    "\n"
+    "#Logging\n"
+    "**.logInterval = 10us\n"
+    "\n"
+    "**.sysMng.**.result-recording-modes = default, +vector,+histogram\n"
+    "**.sys.app*-**.result-recording-modes = default, +vector,+histogram\n"
+    "\n"
+    "# Stats to record per node - we have to indicate the stat that we want to recollect\n"
+    "#**.H[127].throughput.\n"
+    "**.H[*].**.scalar-recording = false\n"
+    "**.SW[*].**.scalar-recording = false\n"
+    "**.param-recording = false\n"
+    "\n"
+    "# Queueing scheme\n"
+    '**.congestionControlTechnique = "@queue_scheme@"\n'
+    "**.numQueues = @num_queues@\n"
+    "\n"
+    "#Port Configurations\n"
+    "include ../TrafficConfigurations/PortPFC.ini\n"
+    "include ../TrafficConfigurations/originalPort.ini\n"
+    "\n"
+    "\n"
+    "# Port configuration for IQ switch\n"
+    "[Config portConfig] #Note that the config included extends from General and portConfig, change the next extend to test other technologies\n"
+    "#IB-NDR = IQ\n"
+    "#BXI3 = CIOQ\n"
+    "extends=@architecture@	# CIOQ\n"
+    "\n"
+    "#Queuing schemes configurations\n"
+    "include ../TrafficConfigurations/indirect/schemes.ini\n"
+    "\n"
+    "#Traffic generation modes\n"
+    "include ../TrafficConfigurations/indirect/random.ini\n"
+    "include ../TrafficConfigurations/indirect/hotspot.ini\n"
+    "include ../TrafficConfigurations/indirect/victim.ini\n"
+    "include ../TrafficConfigurations/indirect/local.ini\n"
+    "include ../TrafficConfigurations/indirect/storage.ini\n"
+    "include ../TrafficConfigurations/indirect/ebb.ini\n"
+    "include ../TrafficConfigurations/indirect/ebb_hs.ini\n"
+    "include ../TrafficConfigurations/indirect/zipf1.ini\n"
+    "include ../TrafficConfigurations/indirect/sla3.ini\n"
+    "include ../TrafficConfigurations/indirect/ptrans.ini\n"
+    "include ../TrafficConfigurations/indirect/natRing.ini\n"
+    "include ../TrafficConfigurations/indirect/graph500.ini\n"
+    "\n"
+)
+
+
+CONFIGURATION_TEMPLATES = {
+    network: ConfigTemplate(_HEADER_TEXT + text + _BODY_TEXT)
+    for network, text in (
+        ("RLFT", _RLFT_TEXT),
+        ("Torus2D", _TORUS2D_TEXT),
+        (None, ""),
+    )
+}
+
+_SECTION_HEADER_TEXT = (
+    "[Config @config_name@]\n"
+    "extends=@extends@\n"
+    "\n"
+    "# Network\n"
+    '**.topology = "@topology_name@"\n'
+)
+
+_SECTION_BODY_TEXT = (
+    "**.channelDistance = @channel_distance@m\n"
+    "\n"
+    "# Switch\n"
+    '**.routingAlgorithm = "@routing@"\n'
+    '**.SW[*].arbiter.typename = "@arbiter@"\n'
+    "\n"
+    "# Applications\n"
+    "**.app[*].load = ${load=@load@}\n"
+    "\n"
+    "# Queueing scheme\n"
+    '**.congestionControlTechnique = "@queue_scheme@"\n'
+    "**.numQueues = @num_queues@\n"
+    "\n"
+)
+
+SECTION_TEMPLATES = {
+    network: ConfigTemplate(_SECTION_HEADER_TEXT + text + _SECTION_BODY_TEXT)
+    for network, text in (
+        ("RLFT", _RLFT_TEXT),
+        ("Torus2D", _TORUS2D_TEXT),
+        (None, ""),
+    )
+}
+
+
+def write_chunks(opp_file: str, chunks: list):
+    """
+    Writes byte chunks to a file with a single ``writev`` system call.
+
+    Args:
+        opp_file (str): Path of the file, replaced if it exists.
+        chunks (list): The byte chunks, in order.
+    """
+    fd = os.open(opp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        if hasattr(os, "writev"):
+            written = os.writev(fd, chunks)
+        else:
+            written = 0
+        data = b""
+        if written < sum(len(chunk) for chunk in chunks):
+            data = b"".join(chunks)[written:]
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+    PARSE_CACHE.invalidate(opp_file)
+
+
+def write_chunks_atomic(opp_file: str, chunks: list):
+    """
+    Writes byte chunks to a temporary file and renames it over a file.
+
+    Readers see either the old or the new contents, never a partial
+    write. The mode of an existing file is kept.
+
+    Args:
+        opp_file (str): Path of the file, replaced if it exists.
+        chunks (list): The byte chunks, in order.
+    """
+    tmp_file = f"{opp_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        write_chunks(tmp_file, chunks)
+        if os.path.exists(opp_file):
+            shutil.copymode(opp_file, tmp_file)
+        os.replace(tmp_file, opp_file)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.unlink(tmp_file)
+        raise
+    PARSE_CACHE.invalidate(opp_file)
+
+
+def render_configuration(simulation, config_hash: str = None) -> list:
+    """
+    Renders the omnetpp.ini file of a simulation.
+
+    Args:
+        simulation (Simulation): The simulation to be rendered.
+        config_hash (str): Its simulation_hash, computed if None.
+
+    Returns:
+        list: The byte chunks of the file.
+    """
+    topology = simulation.topology
+    switch = simulation.switch
+    fields = {
+        "config_name": set_configuration_name(simulation),
+        "hash": config_hash or simulation_hash(simulation),
+        "network_name": topology.get_network(),
+        "topology_name": topology.get_name(),
+        "channel_distance": topology.get_channel_distance(),
+        "routing": switch.get_routing(),
+        "arbiter": switch.get_arbiter(),
+        "queue_scheme": switch.get_queue_scheme(),
+        "num_queues": switch.get_num_queues(),
+        "architecture": switch.get_architecture(),
+    }
+
+    match fields["network_name"]:
+        case "RLFT":
+            fields["arity"] = topology.get_arity()
+            fields["stages"] = topology.get_stages()
+            return CONFIGURATION_TEMPLATES["RLFT"].render(fields)
+        case "Torus2D":
+            fields["dim0"] = topology.get_dim1()
+            fields["dim1"] = topology.get_dim2()
+            return CONFIGURATION_TEMPLATES["Torus2D"].render(fields)
+    return CONFIGURATION_TEMPLATES[None].render(fields)
+
+
+def render_load(app) -> str:
+    """
+    Renders the loads of an application as an iteration variable body.
+
+    Args:
+        app (Application): The application.
+
+    Returns:
+        str: The initial load if there are fewer than two steps, else an
+        ``initial..final step s`` range of that many loads.
+    """
+    initial = app.get_initial_load()
+    final = app.get_final_load()
+    steps = app.get_steps()
+    if steps < 2:
+        return str(initial)
+    step = (final - initial) / (steps - 1)
+    if step == int(step):
+        step = int(step)
+    return f"{initial}..{final} step {step}"
+
+
+def get_section_extends(document, architecture: str) -> str:
+    """
+    Gets the ``extends`` value of a new configuration section.
+
+    Sections inherit the traffic configurations of the file through
+    portConfig. If portConfig does not already extend the switch
+    architecture, the architecture is listed first so that it takes
+    precedence over the one portConfig extends.
+
+    Args:
+        document (OppIniDocument): The omnetpp.ini file, or None.
+        architecture (str): Name of the switch architecture.
+
+    Returns:
+        str: The value.
+    """
+    pending = ["portConfig"]
+    seen = set()
+    while document is not None and pending:
+        name = pending.pop()
+        if name == architecture:
+            return "portConfig"
+        section = document.get_section(name)
+        if name in seen or section is None:
+            continue
+        seen.add(name)
+        pending.extend(section.get_extends())
+    return f"{architecture}, portConfig"
+
+
+def render_section(simulation, extends: str = None) -> list:
+    """
+    Renders the ``[Config X]`` section of a simulation.
+
+    Args:
+        simulation (Simulation): The simulation to be rendered.
+        extends (str): The ``extends`` value of the section, the switch
+            architecture and portConfig if None (see get_section_extends).
+
+    Returns:
+        list: The byte chunks of the section.
+    """
+    topology = simulation.topology
+    switch = simulation.switch
+    app = simulation.app
+    fields = {
+        "config_name": set_configuration_name(simulation),
+        "extends": extends
+        or get_section_extends(None, switch.get_architecture()),
+        "topology_name": topology.get_name(),
+        "channel_distance": topology.get_channel_distance(),
+        "routing": switch.get_routing(),
+        "arbiter": switch.get_arbiter(),
+        "load": render_load(app),
+        "queue_scheme": switch.get_queue_scheme(),
+        "num_queues": switch.get_num_queues(),
+    }
+
+    match topology.get_network():
+        case "RLFT":
+            fields["arity"] = topology.get_arity()
+            fields["stages"] = topology.get_stages()
+            return SECTION_TEMPLATES["RLFT"].render(fields)
+        case "Torus2D":
+            fields["dim0"] = topology.get_dim1()
+            fields["dim1"] = topology.get_dim2()
+            return SECTION_TEMPLATES["Torus2D"].render(fields)
+    return SECTION_TEMPLATES[None].render(fields)
+
+
+# ----- Setters ----- #
+
+
+def set_default_configuration(simulation, topology):
+    """
+    It writes a default omnetpp.ini file
+
+    :param simulation: the simulation folder where to write the file
+    """
+
+    opp_file = simulation.get_root_dir() + "/omnetpp.ini"
+    chunks = DEFAULT_TEMPLATE.render(
+        {
+            "network_name": topology.get_network(),
+            "channel_distance": topology.get_channel_distance(),
+        }
+    )
+
+    # Check if the file exists
+    if os.path.exists(opp_file):
+        # Create a backup
+        version = BackupStore(simulation.get_root_dir()).save(opp_file)
+        print(f"Backup created: version {version.version}")
+
+    # Write the default file
+    write_chunks(opp_file, chunks)
+
+    print(f"File {opp_file} written successfully")
+
+
+def set_new_configuration(simulation) -> bool:
+    """
+    It adds a new configuration in the omnetpp.ini file.
+
+    Nothing is written, and no backup is made, if the file already holds
+    exactly the configuration that would be written.
+
+    Args:
+        simulation (Simulation): The simulation folder where the omnetpp.ini file is located.
+
+    Returns:
+        bool: True if the file was written.
+    """
+
+    opp_file = simulation.get_root_dir() + "/omnetpp.ini"
+    chunks = render_configuration(simulation)
+
+    # Check if the file exists
+    if os.path.exists(opp_file):
+        if os.path.getsize(opp_file) == sum(len(chunk) for chunk in chunks):
+            with open(opp_file, "rb") as file:
+                if file.read() == b"".join(chunks):
+                    return False
+        backup_configuration(simulation)
+
+    # Write the new configuration
+    write_chunks(opp_file, chunks)
+    return True
+
+
+def add_new_configuration(
+    simulation, topology=None, switch=None, application=None
+) -> str:
+    """
+    Adds a new configuration section to the omnetpp.ini file.
+
+    Unlike set_new_configuration, the other configurations of the file
+    are kept. A configuration with the same name is replaced in place,
+    and a default file is written first if there is none.
+
+    Args:
+        simulation (Simulation): The simulation folder where the omnetpp.ini file is located.
+        topology (Topology): Topology to be simulated, if not already set.
+        switch (Switch): Switch to be simulated, if not already set.
+        application (Application): Application to be simulated, if not already set.
+
+    Returns:
+        str: The name of the configuration.
+    """
+    if topology is not None:
+        simulation.set_topo(topology)
+    if switch is not None:
+        simulation.set_sw(switch)
+    if application is not None:
+        simulation.set_app(application)
+
+    opp_file = simulation.get_root_dir() + "/omnetpp.ini"
+    config_name = set_configuration_name(simulation)
+
+    if not os.path.exists(opp_file):
+        set_default_configuration(simulation, simulation.topology)
+
+    extends = get_section_extends(
+        get_merged_document(simulation),
+        simulation.switch.get_architecture(),
+    )
+    section = b"".join(render_section(simulation, extends))
+    ConfigStore(opp_file).put(config_name, section)
+    return config_name
+
+
+def delete_configuration(simulation, config_name: str):
+    """
+    Deletes a configuration section from the omnetpp.ini file.
+
+    Args:
+        simulation (Simulation): The simulation folder where the omnetpp.ini file is located.
+        config_name (str): The name of the configuration.
+
+    Raises:
+        KeyError: If the configuration does not exist.
+    """
+    opp_file = simulation.get_root_dir() + "/omnetpp.ini"
+    ConfigStore(opp_file).delete(config_name)
+
+
+def patch_parameter(simulation, section: str, key: str, value) -> bool:
+    """
+    Changes the value of a single parameter in the omnetpp.ini file.
+
+    Args:
+        simulation (Simulation): The simulation folder where the omnetpp.ini file is located.
+        section (str): ``General`` or the name of a configuration.
+        key (str): The key, exactly as written in the file.
+        value: The new value.
+
+    Returns:
+        bool: True if the file changed.
+    """
+    return patch_many(simulation, [(section, key, value)])
+
+
+def patch_many(simulation, patches) -> bool:
+    """
+    Changes the values of several parameters in the omnetpp.ini file.
+
+    Only the lines of the patched keys are rewritten: comments, ordering
+    and whitespace are kept, except the ``# Hash:`` line, which no longer
+    describes the file and is dropped. The file is read once and, if
+    anything changed, replaced atomically once. Keys that are not in
+    their section are added after its last entry.
+
+    Args:
+        simulation (Simulation): The simulation folder where the omnetpp.ini file is located.
+        patches (iterable): ``(section, key, value)`` tuples.
+
+    Returns:
+        bool: True if the file changed.
+
+    Raises:
+        KeyError: If a section does not exist.
+    """
+    opp_file = simulation.get_root_dir() + "/omnetpp.ini"
+    with open(opp_file, "rb") as file:
+        data = file.read()
+    document = OppIniDocument.parse(data, opp_file)
+
+    replaced = {}
+    inserted = {}
+    for section_name, key, value in patches:
+        section = document.get_section(section_name)
+        if section is None:
+            raise KeyError(f"Section {section_name} not found in {opp_file}")
+        value = str(value)
+        entry = section.get_entry(key)
+
+        if entry is None:
+            after = section.entries[-1].end_lineno if section.entries else 0
+            after = max(after, section.lineno)
+            inserted.setdefault(after, {})[key] = f"{key} = {value}\n"
+        elif entry.value != value:
+            if entry.value_span is not None:
+                line = document.lines[entry.lineno - 1]
+                start, end = entry.value_span
+                replaced[entry.lineno] = line[:start] + value + line[end:]
+            else:
+                replaced[entry.lineno] = f"{key} = {value}\n"
+                for lineno in range(entry.lineno + 1, entry.end_lineno + 1):
+                    replaced[lineno] = ""
+
+    if not replaced and not inserted:
+        return False
+
+    for lineno, text in document.comments:
+        label, colon, _ = text.partition(":")
+        if colon and label.strip() == "Hash":
+            if document.lines[lineno - 1].lstrip().startswith(("#", ";")):
+                replaced.setdefault(lineno, "")
+            break
+
+    chunks = []
+    offsets = document.offsets
+    start = 0
+    for lineno in sorted(replaced.keys() | inserted.keys()):
+        if lineno in replaced:
+            chunks.append(data[start : offsets[lineno - 1]])
+            chunks.append(replaced[lineno].encode())
+        else:
+            chunks.append(data[start : offsets[lineno]])
+        if lineno in inserted:
+            if chunks[-1] and not chunks[-1].endswith(b"\n"):
+                chunks.append(b"\n")
+            chunks.extend(line.encode() for line in inserted[lineno].values())
+        start = offsets[lineno]
+    chunks.append(data[start:])
+
+    write_chunks_atomic(opp_file, chunks)
+    return True
+
+
+def set_configuration_name(simulation) -> str:
+    """
+    Sets the name of the configuration file.
+
+    Args:
+        - simulation (Simulation): the simulation that contains the fields of the configuration file.
+
+    Returns:
+        - str: the name of the configuration.
+    """
+    configuration = ""
+
+    if simulation is not None:
+        if not isinstance(simulation, (Simulation, SimulationSpec)):
+            raise TypeError("Argument must be a string")
+        else:
+            if simulation.topology is None:
+                raise TypeError("Topology not added to simulation")
+            if simulation.switch is None:
+                raise TypeError("Switch not added to simulation")
+            if simulation.app is None:
+                raise TypeError("Application not added to simulation")
+            if simulation.topology.get_name() == "":
+                raise ValueError("Topology name not set")
+            if simulation.topology.get_nodes() == 0:
+                raise ValueError("Topology nodes not set")
+            if simulation.switch.get_architecture() == "":
+                raise ValueError("Switch architecture not set")
+            if simulation.switch.get_arbiter() == "":
+                raise ValueError("Switch arbiter not set")
+            if simulation.switch.get_queue_scheme() == "":
+                raise ValueError("Switch queue scheme not set")
+            if simulation.switch.get_num_queues() == 0:
+                raise ValueError("Switch number of queues not set")
+
+            # Concatenate name fields
+            configuration += simulation.topology.get_network()
+            configuration += "-"
+            configuration += str(simulation.topology.get_nodes()) + "N"
+
+            configuration += "_"
+            configuration += (
+                simulation.switch.get_architecture().replace("_", "").upper()
+            )
+            configuration += "-"
+            configuration += simulation.switch.get_arbiter()
+            configuration += "-"
+            configuration += simulation.switch.get_queue_scheme()
+            configuration += "-"
+            configuration += str(simulation.switch.get_num_queues()) + "Q"
+
+            configuration += "_"
+
+            # TODO: Concatenate relevant app fields to configuration name
+    return configuration
+
+
+def backup_configuration(simulation) -> BackupVersion:
+    """
+    Backups the current omnetpp.ini file in the backup store of the simulation directory
+
+    Identical contents are only stored once, so every call keeps the
+    current version and none overwrites an older one.
+
+    Args:
+        - simulation (Simulation): the simulation that contains the fields of the configuration file.
+
+    Returns:
+        - BackupVersion: the version holding the current file.
+    """
+    opp_file = simulation.get_root_dir() + "/omnetpp.ini"
+    return BackupStore(simulation.get_root_dir()).save(
+        opp_file, check_configuration(simulation)
+    )
+
+
+def restore_configuration(simulation, version: int = None) -> BackupVersion:
+    """
+    Restores a backup of the omnetpp.ini file.
+
+    Args:
+        - simulation (Simulation): the simulation that contains the fields of the configuration file.
+        - version (int): the number of the version, the latest if None.
+
+    Returns:
+        - BackupVersion: the version restored.
+    """
+    return BackupStore(simulation.get_root_dir()).restore(version)
+
+
+# ----- Snapshots ----- #
+
+
+SNAPSHOT_DIR = ".snapshots"
+
+# Folders of a simulation holding its history rather than its contents
+_STORE_DIRS = (SNAPSHOT_DIR, BACKUP_DIR)
+
+# ioctl request that clones a file (Linux, Btrfs/XFS)
+_FICLONE = 0x40049409
+
+
+def snapshot_simulation(simulation, label: str = "") -> Snapshot:
+    """
+    Takes a snapshot of the simulation folder.
+
+    Files unchanged (same size and mtime) since the previous snapshot are
+    hard links to it, so snapshots share storage and the time taken
+    depends on the files changed. Changed files are reflinked where the
+    filesystem supports it and copied otherwise. Nothing is linked to
+    the live folder itself, since OMNeT++ rewrites result files in place.
+
+    Args:
+        simulation (Simulation): The simulation whose folder is snapshotted.
+        label (str): Label of the snapshot.
+
+    Returns:
+        Snapshot: The snapshot taken.
+    """
+    root_dir = simulation.get_root_dir()
+    snapshots = get_snapshots(simulation)
+    previous = snapshots[-1] if snapshots else None
+    snapshot_root = os.path.join(root_dir, SNAPSHOT_DIR)
+    taken = os.listdir(snapshot_root) if os.path.isdir(snapshot_root) else ()
+    number = max((int(name) for name in taken if name.isdigit()), default=0)
+    number += 1
+    snapshot = Snapshot(
+        f"{number:06d}",
+        os.path.join(snapshot_root, f"{number:06d}"),
+        time.time(),
+        label,
+        stats={"linked": 0, "cloned": 0, "copied": 0, "symlinked": 0},
+    )
+    os.makedirs(snapshot.path)
+
+    for relpath, stat in _walk_files(root_dir):
+        target = os.path.join(snapshot.path, relpath)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        signature = [stat.st_size, stat.st_mtime_ns]
+        source = os.path.join(root_dir, relpath)
+        if os.path.islink(source):
+            os.symlink(os.readlink(source), target)
+            snapshot.stats["symlinked"] += 1
+            snapshot.files[relpath] = signature
+            continue
+        if previous is not None and previous.files.get(relpath) == signature:
+            try:
+                os.link(os.path.join(previous.path, relpath), target)
+                snapshot.stats["linked"] += 1
+                snapshot.files[relpath] = signature
+                continue
+            except OSError:
+                pass
+        method = _clone_file(source, target)
+        snapshot.stats[method] += 1
+        snapshot.files[relpath] = signature
+
+    manifest = dict(vars(snapshot))
+    del manifest["path"]
+    write_chunks_atomic(
+        os.path.join(snapshot.path, "manifest.json"),
+        [json.dumps(manifest, sort_keys=True).encode()],
+    )
+    return snapshot
+
+
+def restore_snapshot(
+    simulation, snapshot_id: str = None, delete: bool = True
+) -> Snapshot:
+    """
+    Restores the simulation folder from a snapshot.
+
+    Only the files that differ from the snapshot are written, each one
+    atomically, and symbolic links are restored as links. The snapshots
+    and the backup history of the folder are left untouched.
+
+    Args:
+        simulation (Simulation): The simulation whose folder is restored.
+        snapshot_id (str): Name of the snapshot, the latest if None.
+        delete (bool): Whether files not in the snapshot are deleted.
+
+    Returns:
+        Snapshot: The snapshot restored.
+
+    Raises:
+        KeyError: If the snapshot does not exist.
+    """
+    root_dir = simulation.get_root_dir()
+    snapshots = {item.snapshot_id: item for item in get_snapshots(simulation)}
+    if not snapshots:
+        raise KeyError("No snapshots found")
+    snapshot = snapshots.get(snapshot_id or max(snapshots))
+    if snapshot is None:
+        raise KeyError(f"Snapshot {snapshot_id} not found")
+
+    current = dict(_walk_files(root_dir))
+    for relpath, signature in snapshot.files.items():
+        stat = current.get(relpath)
+        if stat is not None and [stat.st_size, stat.st_mtime_ns] == signature:
+            continue
+        target = os.path.join(root_dir, relpath)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        source = os.path.join(snapshot.path, relpath)
+        tmp_file = f"{target}.{os.getpid()}.restore"
+        if os.path.islink(source):
+            os.symlink(os.readlink(source), tmp_file)
+        else:
+            _clone_file(source, tmp_file)
+        os.replace(tmp_file, target)
+
+    if delete:
+        for relpath in current.keys() - snapshot.files.keys():
+            os.unlink(os.path.join(root_dir, relpath))
+    PARSE_CACHE.clear()
+    return snapshot
+
+
+def get_snapshots(simulation) -> list:
+    """
+    Gets the snapshots of the simulation folder.
+
+    Args:
+        simulation (Simulation): The simulation.
+
+    Returns:
+        list: Snapshot objects, oldest first.
+    """
+    snapshot_root = os.path.join(simulation.get_root_dir(), SNAPSHOT_DIR)
+    if not os.path.isdir(snapshot_root):
+        return []
+
+    snapshots = []
+    for snapshot_id in sorted(os.listdir(snapshot_root)):
+        path = os.path.join(snapshot_root, snapshot_id)
+        try:
+            with open(os.path.join(path, "manifest.json")) as file:
+                manifest = json.load(file)
+        except FileNotFoundError:
+            # Interrupted snapshot
+            continue
+        snapshots.append(Snapshot(path=path, **manifest))
+    return snapshots
+
+
+def _walk_files(root_dir: str):
+    """
+    Yields (relative path, lstat) of the files of a simulation folder.
+
+    Symbolic links, to files or folders, are yielded rather than followed.
+    """
+    for dirpath, dirnames, filenames in os.walk(root_dir, followlinks=False):
+        if dirpath == root_dir:
+            dirnames[:] = [
+                name for name in dirnames if name not in _STORE_DIRS
+            ]
+        links = [
+            name
+            for name in dirnames
+            if os.path.islink(os.path.join(dirpath, name))
+        ]
+        for filename in filenames + links:
+            path = os.path.join(dirpath, filename)
+            yield os.path.relpath(path, root_dir), os.lstat(path)
+
+
+def _clone_file(source: str, target: str) -> str:
+    """Reflinks a file if the filesystem supports it, or copies it."""
+    if fcntl is not None:
+        try:
+            with open(source, "rb") as src, open(target, "wb") as dst:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            shutil.copystat(source, target)
+            return "cloned"
+        except OSError:
+            pass
+    shutil.copy2(source, target)
+    return "copied"
+
+
+# ----- Sweeps ----- #
+
+
+SWEEP_AXES = (
+    "network",
+    "arity",
+    "stages",
+    "dim1",
+    "dim2",
+    "channel_distance",
+    "architecture",
+    "arbiter",
+    "queue_scheme",
+    "num_queues",
+    "routing",
+    "voq",
+    "bubble",
+    "request_processing_time",
+    "load",
+    "message_size",
+    "filename",
+)
+
+# Number of queues (minimum, maximum) each queue scheme is valid with. None
+# means no upper bound.
+NUM_QUEUES_RANGE = {
+    CongestionTechniques.oneq: (1, 1),
+    CongestionTechniques.voqnet: (2, None),
+    CongestionTechniques.voqsw: (2, None),
+    CongestionTechniques.obqa: (2, None),
+    CongestionTechniques.flow2sl: (2, None),
+    CongestionTechniques.dbbm: (2, None),
+    CongestionTechniques.bbq: (2, None),
+    CongestionTechniques.vftree: (2, None),
+    CongestionTechniques.xflow2sl: (2, None),
+}
+
+
+def build_simulation(point: dict, root_dir: str = "") -> Simulation:
+    """
+    Builds a simulation from the axis values of a sweep point.
+
+    Args:
+        point (dict): Values by axis name (see SWEEP_AXES). ``load`` is an
+            ``(initial, final, steps)`` tuple. Axes that do not apply to
+            the network are ignored.
+        root_dir (str): Root directory of the simulation.
+
+    Returns:
+        Simulation: The simulation.
+    """
+    unknown = set(point) - set(SWEEP_AXES)
+    if unknown:
+        raise ValueError(f"Unknown sweep axes: {', '.join(sorted(unknown))}")
+
+    simulation = Simulation()
+    simulation.root_dir = root_dir
+
+    network = point.get("network", "RLFT")
+    if network == "RLFT":
+        topology = RLFT()
+        topology.set_nodes(point.get("arity", 0), point.get("stages", 0))
+    elif network == "Torus2D":
+        topology = Torus2D()
+        topology.set_dim1(point.get("dim1", 0))
+        topology.set_dim2(point.get("dim2", 0))
+    else:
+        raise ValueError(f"Network {network} is not supported")
+    if "channel_distance" in point:
+        topology.set_channel_distance(point["channel_distance"])
+    simulation.set_topo(topology)
+
+    architecture = point.get("architecture", "IB_NDR")
+    if architecture == "IB_NDR":
+        switch = IB_NDR()
+    elif architecture == "BXI3":
+        switch = BXI3()
+    else:
+        switch = Switch()
+        switch.set_architecture(architecture)
+    for axis in (
+        "arbiter",
+        "queue_scheme",
+        "num_queues",
+        "routing",
+        "voq",
+        "bubble",
+        "request_processing_time",
+    ):
+        if axis in point:
+            getattr(switch, f"set_{axis}")(point[axis])
+    simulation.set_sw(switch)
+
+    app = Application()
+    if "load" in point:
+        app.set_load(*point["load"])
+    if "message_size" in point:
+        app.set_message_size(point["message_size"])
+    if "filename" in point:
+        app.set_filename(point["filename"])
+    simulation.set_app(app)
+
+    return simulation
+
+
+def sweep_dirname(simulation) -> str:
+    """
+    Gets the directory name of a simulation within a generated sweep.
+
+    Args:
+        simulation (Simulation): the simulation to be named.
+
+    Returns:
+        str: The configuration name followed by the application fields.
+    """
+    app = simulation.app
+    return (
+        set_configuration_name(simulation)
+        + f"{app.get_filename()}{app.get_initial_load()}"
+        + f"-{app.get_final_load()}x{app.get_steps()}"
+    )
+
+
+def iter_sweep_points(spec: dict):
+    """
+    Yields the points of the Cartesian product of the axes of a sweep spec.
+
+    Args:
+        spec (dict): Values by axis name. A value that is not a list or a
+            tuple of alternatives is used for every point.
+
+    Yields:
+        dict: Axis values of a point, in a deterministic order.
+    """
+    axes = _sweep_axes(spec)
+    names = [axis for axis, _ in axes]
+    for values in itertools.product(*(values for _, values in axes)):
+        yield dict(zip(names, values))
+
+
+def _sweep_axes(spec: dict) -> list:
+    """Gets the (axis, alternatives) pairs of a sweep spec."""
+    axes = []
+    for axis, values in spec.items():
+        if isinstance(values, list) or (
+            isinstance(values, tuple) and axis != "load"
+        ):
+            axes.append((axis, list(values)))
+        else:
+            axes.append((axis, [values]))
+    return axes
+
+
+def iter_sweep(axes: dict, constraints=(), start: int = 0):
+    """
+    Streams the points of a sweep that satisfy a set of constraints.
+
+    Points are produced one at a time in the order of iter_sweep_points,
+    so memory does not grow with the size of the sweep. Constraints are
+    checked on the axis values, before anything is built for the point.
+
+    Args:
+        axes (dict): Values by axis name (see iter_sweep_points).
+        constraints (iterable): Predicates taking the point dict and
+            returning whether it is valid, e.g. valid_num_queues or
+            max_nodes(1024).
+        start (int): Index of the first point to consider. Pass the index
+            of the last record processed plus one to resume a sweep.
+
+    Yields:
+        SweepRecord: The valid points, with their index and spec.
+
+    Raises:
+        ValueError: If an axis is unknown or start is negative.
+    """
+    pairs = _sweep_axes(axes)
+    unknown = [axis for axis, _ in pairs if axis not in SWEEP_AXES]
+    if unknown:
+        raise ValueError(f"Unknown sweep axes: {', '.join(unknown)}")
+    if start < 0:
+        raise ValueError("The start of a sweep cannot be negative")
+
+    names = [axis for axis, _ in pairs]
+    alternatives = [values for _, values in pairs]
+    radices = [len(values) for values in alternatives]
+    total = math.prod(radices)
+    constraints = tuple(constraints)
+
+    # Mixed-radix digits of start, the last axis varying fastest.
+    digits = [0] * len(radices)
+    remainder = start
+    for position in reversed(range(len(radices))):
+        remainder, digits[position] = divmod(remainder, radices[position])
+
+    for index in range(start, total):
+        point = {
+            name: values[digit]
+            for name, values, digit in zip(names, alternatives, digits)
+        }
+        if all(constraint(point) for constraint in constraints):
+            yield SweepRecord(index, point, build_spec(point))
+        for position in reversed(range(len(radices))):
+            digits[position] += 1
+            if digits[position] < radices[position]:
+                break
+            digits[position] = 0
+
+
+def build_spec(point: dict, root_dir: str = "") -> SimulationSpec:
+    """
+    Builds the spec of a sweep point without creating a Simulation.
+
+    Args:
+        point (dict): Values by axis name (see build_simulation).
+        root_dir (str): Root directory of the simulation.
+
+    Returns:
+        SimulationSpec: The same spec as build_simulation(point).freeze().
+    """
+    unknown = set(point) - set(SWEEP_AXES)
+    if unknown:
+        raise ValueError(f"Unknown sweep axes: {', '.join(sorted(unknown))}")
+
+    network = point.get("network", "RLFT")
+    channel_distance = point.get("channel_distance", 5)
+    if network == "RLFT":
+        arity = point.get("arity", 0)
+        stages = point.get("stages", 0)
+        topology = TopologySpec(
+            "RLFT",
+            "rlft",
+            channel_distance,
+            2 * (pow(arity, stages)),
+            arity,
+            stages,
+        )
+    elif network == "Torus2D":
+        dim1 = point.get("dim1", 0)
+        dim2 = point.get("dim2", 0)
+        topology = TopologySpec(
+            "Torus2D", "torus", channel_distance, dim1 * dim2, 0, 0, dim1, dim2
+        )
+    else:
+        raise ValueError(f"Network {network} is not supported")
+
+    switch = SwitchSpec(point.get("architecture", "IB_NDR"))
+    fields = {
+        axis: point[axis]
+        for axis in (
+            "arbiter",
+            "queue_scheme",
+            "num_queues",
+            "routing",
+            "voq",
+            "bubble",
+            "request_processing_time",
+        )
+        if axis in point
+    }
+    if fields:
+        switch = switch._replace(**fields)
+
+    app = ApplicationSpec()
+    if "load" in point:
+        initial, final, steps = point["load"]
+        app = app._replace(initial_load=initial, final_load=final, steps=steps)
+    if "message_size" in point:
+        app = app._replace(message_size=point["message_size"])
+    if "filename" in point:
+        app = app._replace(file_name=point["filename"])
+
+    return SimulationSpec(topology, switch, app, root_dir)
+
+
+def point_nodes(point: dict) -> int:
+    """
+    Gets the number of nodes of the network of a sweep point.
+
+    Args:
+        point (dict): Values by axis name.
+
+    Returns:
+        int: The number of nodes, 0 for unsupported networks.
+    """
+    network = point.get("network", "RLFT")
+    if network == "RLFT":
+        return 2 * (pow(point.get("arity", 0), point.get("stages", 0)))
+    if network == "Torus2D":
+        return point.get("dim1", 0) * point.get("dim2", 0)
+    return 0
+
+
+def valid_num_queues(point: dict) -> bool:
+    """
+    Checks that the number of queues of a sweep point suits its scheme.
+
+    A sweep constraint (see iter_sweep). The valid ranges are taken from
+    NUM_QUEUES_RANGE; ``1q`` names CongestionTechniques.oneq.
+
+    Args:
+        point (dict): Values by axis name.
+
+    Returns:
+        bool: False if the queue scheme is unknown or num_queues is out of
+        its range.
+    """
+    scheme = point.get("queue_scheme", "1q")
+    name = "oneq" if scheme == "1q" else scheme
+    if name not in CongestionTechniques.__members__:
+        return False
+    minimum, maximum = NUM_QUEUES_RANGE[CongestionTechniques[name]]
+    num_queues = point.get("num_queues", 1)
+    return num_queues >= minimum and (maximum is None or num_queues <= maximum)
+
+
+def max_nodes(limit: int):
+    """
+    Makes a sweep constraint that rejects networks with too many nodes.
+
+    Args:
+        limit (int): Maximum number of nodes.
+
+    Returns:
+        callable: The constraint (see iter_sweep).
+    """
+
+    return functools.partial(_has_max_nodes, limit=limit)
+
+
+def _has_max_nodes(point: dict, limit: int) -> bool:
+    """Checks that a sweep point has at most limit nodes."""
+    return point_nodes(point) <= limit
+
+
+def generate_sweep(
+    spec: dict, out_root: str, workers: int = None, constraints=()
+) -> list:
+    """
+    Writes the omnetpp.ini file of every point of a sweep, in parallel.
+
+    Each point is written to ``<out_root>/<sweep_dirname>/omnetpp.ini``, so
+    output paths only depend on the point. Use the simulations folder of
+    SAURON_ROOT as out_root for the ``../TrafficConfigurations`` includes
+    to resolve. Points that map to the same directory are written once.
+
+    The points of a SimulationBatch are never built in this process:
+    workers get slices of its columns, filter and name the points of
+    their slice, and, once the names are deduplicated, write them. The
+    constraints are then sent to the workers, so they have to be
+    picklable, as valid_num_queues and max_nodes are.
+
+    Args:
+        spec (dict | SimulationBatch): Values by axis name (see
+            iter_sweep_points), or the points themselves.
+        out_root (str): Directory where the simulation folders are created.
+        workers (int): Number of worker processes. All the cores if None;
+            the points are written in this process if 1.
+        constraints (iterable): Predicates points must satisfy to be
+            written (see iter_sweep).
+
+    Returns:
+        list: A SweepResult per point, in sweep order. Files that already
+        hold the same configuration are not rewritten.
+    """
+    constraints = tuple(constraints)
+    workers = workers or os.cpu_count() or 1
+    if isinstance(spec, SimulationBatch):
+        return _generate_batch(spec, out_root, workers, constraints)
+
+    jobs = []
+    seen = set()
+    for record in iter_sweep(spec, constraints):
+        point = record.point
+        dirname = sweep_dirname(build_simulation(point))
+        if dirname not in seen:
+            seen.add(dirname)
+            jobs.append((record.index, point, os.path.join(out_root, dirname)))
+
+    if workers == 1 or len(jobs) <= 1:
+        return [_write_sweep_point(job) for job in jobs]
+
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(_write_sweep_point, jobs, chunksize=chunksize)
+        )
+
+
+def _generate_batch(
+    batch: SimulationBatch, out_root: str, workers: int, constraints: tuple
+) -> list:
+    """Writes the points of a SimulationBatch for generate_sweep."""
+    size = max(1, -(-len(batch) // (workers * 4)))
+    slices = [
+        (start, batch.take(range(start, min(start + size, len(batch)))))
+        for start in range(0, len(batch), size)
+    ]
+    executor = None
+    if workers > 1 and len(batch) > 1:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        run = executor.map if executor is not None else map
+        named = run(
+            _name_sweep_slice,
+            [(start, part, constraints) for start, part in slices],
+        )
+
+        kept = []
+        seen = set()
+        for names in named:
+            for index, dirname in names:
+                if dirname not in seen:
+                    seen.add(dirname)
+                    kept.append((index, os.path.join(out_root, dirname)))
+
+        jobs = []
+        for first in range(0, len(kept), size):
+            indices, root_dirs = zip(*kept[first : first + size])
+            jobs.append((indices, batch.take(indices), root_dirs))
+        return [
+            result for part in run(_write_sweep_slice, jobs) for result in part
+        ]
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def _name_sweep_slice(job: tuple) -> list:
+    """Gets the (index, sweep_dirname) of the valid points of a slice."""
+    start, batch, constraints = job
+    names = []
+    for offset, point in enumerate(batch.iter_points()):
+        if all(constraint(point) for constraint in constraints):
+            dirname = sweep_dirname(build_simulation(point))
+            names.append((start + offset, dirname))
+    return names
+
+
+def _write_sweep_slice(job: tuple) -> list:
+    """Writes the points of a slice, numbered by their rows in the batch."""
+    indices, batch, root_dirs = job
+    return [
+        _write_sweep_point((index, batch.get_point(offset), root_dir))
+        for offset, (index, root_dir) in enumerate(zip(indices, root_dirs))
+    ]
+
+
+def _write_sweep_point(job: tuple) -> SweepResult:
+    """Renders and writes the omnetpp.ini file of one sweep point."""
+    index, point, root_dir = job
+    start = time.perf_counter()
+    simulation = build_simulation(point, root_dir)
+    os.makedirs(root_dir, exist_ok=True)
+    written = set_new_configuration(simulation)
+    return SweepResult(
+        index,
+        point,
+        os.path.join(root_dir, "omnetpp.ini"),
+        get_run_configuration(simulation),
+        time.perf_counter() - start,
+        written,
+    )
@@ -0,0 +1,147 @@
+"""Command line interface of opp_ini.
+
+Usage:
+    opp_ini catalog build [--root ROOT] [--db DB] [--workers N]
+    opp_ini reruns plan [--root ROOT] [--config CONFIG]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import opp_ini
+from opp_ini import catalog, runner
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the argument parser of the command line interface.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog="opp_ini", description="Tools for omnetpp.ini files."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    catalog_parser = commands.add_parser(
+        "catalog", help="Catalog of the simulation folders."
+    )
+    catalog_commands = catalog_parser.add_subparsers(
+        dest="catalog_command", required=True
+    )
+    build = catalog_commands.add_parser(
+        "build", help="Build or refresh the catalog."
+    )
+    build.add_argument(
+        "--root",
+        help="Directory to walk (default: $SAURON_ROOT/simulations).",
+    )
+    build.add_argument(
+        "--db",
+        help=f"SQLite database (default: <root>/{catalog.CATALOG_FILE}).",
+    )
+    build.add_argument(
+        "--workers",
+        type=int,
+        help="Number of worker processes (default: all the cores).",
+    )
+    build.set_defaults(func=catalog_build)
+
+    reruns_parser = commands.add_parser(
+        "reruns", help="Runs whose inputs changed since they ran."
+    )
+    reruns_commands = reruns_parser.add_subparsers(
+        dest="reruns_command", required=True
+    )
+    plan = reruns_commands.add_parser(
+        "plan", help="List the runs to be run again, without running them."
+    )
+    plan.add_argument(
+        "--root",
+        help="Directory to walk (default: $SAURON_ROOT/simulations).",
+    )
+    plan.add_argument("--config", help="Only plan this configuration.")
+    plan.set_defaults(func=reruns_plan)
+    return parser
+
+
+def get_root(root: str) -> str:
+    """
+    Gets the simulations directory to work on.
+
+    Args:
+        root (str): The directory given, if any.
+
+    Returns:
+        str: root, or the simulations folder of SAURON_ROOT.
+
+    Raises:
+        RuntimeError: If no root is given and SAURON_ROOT is not set.
+    """
+    if root:
+        return root
+    if opp_ini.SAURON_ROOT is None:
+        raise RuntimeError("SAURON_ROOT is required without --root.")
+    return os.path.join(opp_ini.SAURON_ROOT, "simulations")
+
+
+def catalog_build(args) -> int:
+    """Runs ``opp_ini catalog build``."""
+    root = get_root(args.root)
+    db_path = args.db or os.path.join(root, catalog.CATALOG_FILE)
+
+    start = time.perf_counter()
+    with catalog.Catalog(db_path) as opened:
+        stats = opened.build(root, args.workers)
+    print(
+        f"{stats['scanned']} scanned, {stats['unchanged']} unchanged, "
+        f"{stats['removed']} removed, {stats['errors']} errors "
+        f"in {time.perf_counter() - start:.2f}s ({db_path})"
+    )
+    return 0
+
+
+def reruns_plan(args) -> int:
+    """Runs ``opp_ini reruns plan``."""
+    root = get_root(args.root)
+    plans = runner.plan_reruns(root, args.config)
+    for plan in plans:
+        line = (
+            f"{os.path.relpath(plan.root_dir, root)} {plan.config_name} "
+            f"-r {plan.get_run_filter()} ({plan.reason}"
+        )
+        if plan.files:
+            line += ": " + ", ".join(
+                os.path.relpath(file, root) for file in plan.files
+            )
+        print(line + ")")
+    print(
+        f"{sum(len(plan.runs) for plan in plans)} runs to run again in "
+        f"{len({plan.root_dir for plan in plans})} folders (dry run)"
+    )
+    return 0
+
+
+def main(argv: list = None) -> int:
+    """
+    Runs the command line interface.
+
+    Args:
+        argv (list): The arguments, sys.argv[1:] if None.
+
+    Returns:
+        int: The exit status.
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except RuntimeError as error:
+        print(f"opp_ini: {error}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""opp_ini.aio - asyncio versions of the opp_ini getters and setters.
+
+Every coroutine runs its blocking counterpart in a shared thread pool, so
+reading or writing many simulation folders overlaps the per-file latency
+of network filesystems. The pool size bounds how many folders are touched
+at once; change it with set_concurrency.
+
+Example:
+    states = await aio.map_simulations(aio.get_configuration, simulations)
+"""
+
+import asyncio
+import functools
+import threading
+
+# Concurrency
+from concurrent.futures import ThreadPoolExecutor
+
+import opp_ini
+
+# ----- Constants ----- #
+DEFAULT_CONCURRENCY = 32
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+# ----- Executor ----- #
+
+
+def set_concurrency(limit: int):
+    """
+    Sets how many blocking calls may run at once.
+
+    Calls already running finish on the previous pool.
+
+    Args:
+        limit (int): Maximum number of threads.
+
+    Raises:
+        ValueError: If limit is not positive.
+    """
+    global _executor
+    if limit < 1:
+        raise ValueError("Concurrency limit must be positive")
+    with _executor_lock:
+        previous, _executor = _executor, ThreadPoolExecutor(
+            max_workers=limit, thread_name_prefix="opp_ini"
+        )
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Gets the thread pool the coroutines run in.
+
+    Returns:
+        ThreadPoolExecutor: The pool, created with DEFAULT_CONCURRENCY
+        threads on first use.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=DEFAULT_CONCURRENCY, thread_name_prefix="opp_ini"
+            )
+        return _executor
+
+
+async def run(func, *args, **kwargs):
+    """
+    Runs a blocking function in the thread pool.
+
+    Args:
+        func (callable): The function.
+        *args: Its positional arguments.
+        **kwargs: Its keyword arguments.
+
+    Returns:
+        The result of the function.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+async def map_simulations(func, simulations, *args, **kwargs) -> list:
+    """
+    Runs a coroutine function over many simulations concurrently.
+
+    Args:
+        func (callable): A coroutine function of this module.
+        simulations (iterable): The simulations, passed first to func.
+        *args: The other positional arguments of func.
+        **kwargs: The keyword arguments of func.
+
+    Returns:
+        list: The results, in the order of simulations.
+    """
+    return await asyncio.gather(
+        *(func(simulation, *args, **kwargs) for simulation in simulations)
+    )
+
+
+def _offload(func):
+    """Makes a coroutine function that runs func in the thread pool."""
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await run(func, *args, **kwargs)
+
+    return wrapper
+
+
+# ----- Getters ----- #
+
+load_document = _offload(opp_ini.load_document)
+get_document = _offload(opp_ini.get_document)
+get_merged_document = _offload(opp_ini.get_merged_document)
+check_configuration = _offload(opp_ini.check_configuration)
+get_configuration = _offload(opp_ini.get_configuration)
+get_configurations = _offload(opp_ini.get_configurations)
+get_configuration_hash = _offload(opp_ini.get_configuration_hash)
+simulation_hash = _offload(opp_ini.simulation_hash)
+get_switch_architecture = _offload(opp_ini.get_switch_architecture)
+get_switch_routing = _offload(opp_ini.get_switch_routing)
+get_switch_arbiter = _offload(opp_ini.get_switch_arbiter)
+get_switch_request_processing_time = _offload(
+    opp_ini.get_switch_request_processing_time
+)
+get_effective_parameters = _offload(opp_ini.get_effective_parameters)
+effective_value = _offload(opp_ini.effective_value)
+
+# ----- Setters ----- #
+
+set_default_configuration = _offload(opp_ini.set_default_configuration)
+set_new_configuration = _offload(opp_ini.set_new_configuration)
+add_new_configuration = _offload(opp_ini.add_new_configuration)
+patch_parameter = _offload(opp_ini.patch_parameter)
+patch_many = _offload(opp_ini.patch_many)
+
+# ----- Backups ----- #
+
+backup_configuration = _offload(opp_ini.backup_configuration)
+restore_configuration = _offload(opp_ini.restore_configuration)
+snapshot_simulation = _offload(opp_ini.snapshot_simulation)
+restore_snapshot = _offload(opp_ini.restore_snapshot)
@@ -0,0 +1,716 @@
+"""opp_ini.catalog - SQLite catalog of the simulation folders under a root.
+
+The catalog stores, for every omnetpp.ini file found, its configuration
+name and hash, the sections it sees through its includes and the
+effective parameters of ``General`` and of the configurations it defines.
+The topology, switch and load fields of every configuration are kept in
+an indexed table, so query and count do not read any file.
+Building it again only re-parses the files whose mtime or size changed,
+or whose included files did.
+
+Example:
+    with Catalog("catalog.sqlite") as catalog:
+        catalog.build(opp_ini.SAURON_ROOT + "/simulations")
+"""
+
+import json
+import os
+import re
+import sqlite3
+import time
+
+# Concurrency
+from concurrent.futures import ProcessPoolExecutor
+
+import opp_ini
+
+# ----- Constants ----- #
+SCHEMA_VERSION = 3
+CATALOG_FILE = ".catalog.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    folder TEXT NOT NULL,
+    mtime_ns INTEGER,
+    size INTEGER,
+    deps TEXT,
+    config_name TEXT,
+    config_hash TEXT,
+    error TEXT,
+    scanned REAL
+);
+CREATE TABLE IF NOT EXISTS sections (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    extends TEXT,
+    PRIMARY KEY (file_id, name)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS params (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    config TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (file_id, config, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS configs (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    config TEXT NOT NULL,
+    network TEXT,
+    topology TEXT,
+    nodes INTEGER,
+    arity INTEGER,
+    stages INTEGER,
+    dim1 INTEGER,
+    dim2 INTEGER,
+    channel_distance REAL,
+    architecture TEXT,
+    arbiter TEXT,
+    queue_scheme TEXT,
+    num_queues INTEGER,
+    routing TEXT,
+    load_min REAL,
+    load_max REAL,
+    load_step REAL,
+    runs INTEGER,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS files_config_hash ON files(config_hash);
+CREATE INDEX IF NOT EXISTS params_key ON params(key, value);
+CREATE INDEX IF NOT EXISTS configs_file ON configs(file_id);
+CREATE INDEX IF NOT EXISTS configs_network ON configs(network);
+CREATE INDEX IF NOT EXISTS configs_nodes ON configs(nodes);
+CREATE INDEX IF NOT EXISTS configs_architecture ON configs(architecture);
+CREATE INDEX IF NOT EXISTS configs_arbiter ON configs(arbiter);
+CREATE INDEX IF NOT EXISTS configs_queue_scheme ON configs(queue_scheme);
+CREATE INDEX IF NOT EXISTS configs_num_queues ON configs(num_queues);
+CREATE INDEX IF NOT EXISTS configs_routing ON configs(routing);
+CREATE INDEX IF NOT EXISTS configs_load ON configs(load_min, load_max);
+"""
+
+# Columns of the configs table that describe a configuration
+CONFIG_FIELDS = (
+    "network",
+    "topology",
+    "nodes",
+    "arity",
+    "stages",
+    "dim1",
+    "dim2",
+    "channel_distance",
+    "architecture",
+    "arbiter",
+    "queue_scheme",
+    "num_queues",
+    "routing",
+    "load_min",
+    "load_max",
+    "load_step",
+    "runs",
+)
+
+# Fields that can be queried, by name, and the column that holds them
+QUERY_FIELDS = {
+    **{field: f"c.{field}" for field in CONFIG_FIELDS},
+    **{
+        f"topology.{field}": f"c.{field}"
+        for field in CONFIG_FIELDS[:8]
+        if field != "topology"
+    },
+    **{f"switch.{field}": f"c.{field}" for field in CONFIG_FIELDS[8:13]},
+    **{f"app.{field}": f"c.{field}" for field in CONFIG_FIELDS[13:16]},
+    "topology.name": "c.topology",
+    "config": "c.config",
+    "path": "f.path",
+    "folder": "f.folder",
+    "config_name": "f.config_name",
+    "config_hash": "f.config_hash",
+    "error": "c.error",
+}
+
+_QUERY_OPERATORS = ("=", "!=", "<", "<=", ">", ">=", "like")
+
+_NUMBER_RE = re.compile(r"^(-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)[a-zA-Z]*$")
+_VARIABLE_RE = re.compile(r"^\$\{\s*(\w+)")
+
+
+# ----- Classes ----- #
+
+
+class Catalog:
+    """A class representing a catalog of omnetpp.ini files.
+
+    Attributes:
+        db_path (str): Path of the SQLite database.
+        connection (sqlite3.Connection): Connection to the database.
+    """
+
+    def __init__(self, db_path: str):
+        """Opens the catalog, creating the database if needed."""
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self._migrate()
+
+    def __enter__(self) -> "Catalog":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Closes the connection to the database."""
+        self.connection.close()
+
+    # ----- Getters ----- #
+
+    def get_files(self) -> list:
+        """
+        Gets the omnetpp.ini files in the catalog.
+
+        Returns:
+            list: Their paths, sorted.
+        """
+        rows = self.connection.execute("SELECT path FROM files ORDER BY path")
+        return [path for (path,) in rows]
+
+    def get_file(self, path: str) -> dict:
+        """
+        Gets the record of an omnetpp.ini file.
+
+        Args:
+            path (str): Path of the file.
+
+        Returns:
+            dict: Its columns by name, or None if it is not in the catalog.
+        """
+        cursor = self.connection.execute(
+            "SELECT * FROM files WHERE path = ?", (os.path.realpath(path),)
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return dict(zip((column[0] for column in cursor.description), row))
+
+    def get_sections(self, path: str) -> dict:
+        """
+        Gets the sections an omnetpp.ini file sees, includes inlined.
+
+        Args:
+            path (str): Path of the file.
+
+        Returns:
+            dict: The ``extends`` value of every section, by name.
+        """
+        rows = self.connection.execute(
+            "SELECT s.name, s.extends FROM sections s "
+            "JOIN files f ON f.id = s.file_id WHERE f.path = ?",
+            (os.path.realpath(path),),
+        )
+        return dict(rows)
+
+    def get_params(self, path: str, config_name: str = "General") -> dict:
+        """
+        Gets the effective parameters of a configuration of a file.
+
+        Args:
+            path (str): Path of the file.
+            config_name (str): ``General`` or a configuration of the file.
+
+        Returns:
+            dict: Values by key.
+        """
+        rows = self.connection.execute(
+            "SELECT p.key, p.value FROM params p "
+            "JOIN files f ON f.id = p.file_id "
+            "WHERE f.path = ? AND p.config = ?",
+            (os.path.realpath(path), config_name),
+        )
+        return dict(rows)
+
+    def query(
+        self,
+        filters: dict = None,
+        order_by: str = None,
+        limit: int = None,
+    ) -> list:
+        """
+        Gets the configurations that match some filters.
+
+        Filters map a field of QUERY_FIELDS, e.g. ``nodes`` or
+        ``topology.nodes``, to a condition: a value (equal to), a list or
+        set (any of), None (unknown) or an ``(operator, value)`` tuple
+        with an operator of ``=, !=, <, <=, >, >=, like``. Every field of
+        the configs table is indexed.
+
+        Example:
+            catalog.query({"nodes": (">=", 2048),
+                           "queue_scheme": ["voqnet", "voqsw"]})
+
+        Args:
+            filters (dict): Conditions, all of which must hold.
+            order_by (str): Field to sort by. Catalog order if None.
+            limit (int): Maximum number of records.
+
+        Returns:
+            list: A dict per configuration, with the fields of
+            CONFIG_FIELDS plus ``config``, ``path``, ``folder``,
+            ``config_name``, ``config_hash`` and ``error``, the error
+            that kept the configuration from being resolved, if any.
+        """
+        where, args = _where(filters)
+        sql = (
+            "SELECT c.config, f.path, f.folder, f.config_name, "
+            f"f.config_hash, {', '.join('c.' + f for f in CONFIG_FIELDS)}, "
+            "c.error "
+            f"FROM configs c JOIN files f ON f.id = c.file_id{where}"
+        )
+        if order_by is not None:
+            sql += f" ORDER BY {_column(order_by)}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(limit)
+
+        cursor = self.connection.execute(sql, args)
+        names = [column[0] for column in cursor.description]
+        return [dict(zip(names, row)) for row in cursor]
+
+    def count(self, filters: dict = None, group_by=None):
+        """
+        Counts the configurations that match some filters.
+
+        Example:
+            catalog.count({"nodes": (">=", 2048)}, group_by="arbiter")
+
+        Args:
+            filters (dict): Conditions, as in query.
+            group_by (str | tuple): Field, or fields, to group by.
+
+        Returns:
+            int | dict: The count, or the count of every group, by value
+            (by tuple of values if group_by is a tuple).
+        """
+        where, args = _where(filters)
+        if group_by is None:
+            sql = "SELECT COUNT(*) FROM configs c JOIN files f "
+            sql += f"ON f.id = c.file_id{where}"
+            return self.connection.execute(sql, args).fetchone()[0]
+
+        fields = group_by if isinstance(group_by, tuple) else (group_by,)
+        columns = ", ".join(_column(field) for field in fields)
+        sql = (
+            f"SELECT {columns}, COUNT(*) FROM configs c "
+            f"JOIN files f ON f.id = c.file_id{where} GROUP BY {columns}"
+        )
+        counts = {}
+        for *values, count in self.connection.execute(sql, args):
+            counts[
+                tuple(values) if isinstance(group_by, tuple) else values[0]
+            ] = count
+        return counts
+
+    def query_simulations(self, filters: dict = None) -> list:
+        """
+        Gets the simulations of the configurations that match some filters.
+
+        Configurations of networks build_simulation does not support are
+        left out.
+
+        Args:
+            filters (dict): Conditions, as in query.
+
+        Returns:
+            list: A Simulation per configuration, rooted at its folder.
+        """
+        simulations = []
+        for record in self.query(filters):
+            if record["network"] not in ("RLFT", "Torus2D"):
+                continue
+            point = {
+                axis: record[axis]
+                for axis in opp_ini.SWEEP_AXES
+                if record.get(axis) is not None
+            }
+            if record["load_min"] is not None:
+                steps = 0
+                if record["load_step"]:
+                    spread = record["load_max"] - record["load_min"]
+                    steps = round(spread / record["load_step"]) + 1
+                point["load"] = (record["load_min"], record["load_max"], steps)
+            simulations.append(
+                opp_ini.build_simulation(point, record["folder"])
+            )
+        return simulations
+
+    # ----- Setters ----- #
+
+    def build(self, root: str, workers: int = None) -> dict:
+        """
+        Adds or refreshes every omnetpp.ini file under a directory.
+
+        Files are parsed in a process pool, and only if they are new or
+        their mtime or size, or those of a file they include, changed.
+        Files no longer found under root are removed.
+
+        Args:
+            root (str): Directory to walk, e.g. SAURON_ROOT/simulations.
+            workers (int): Number of worker processes. All the cores if
+                None; the files are parsed in this process if 1.
+
+        Returns:
+            dict: Number of files ``scanned``, ``unchanged``, ``removed``
+            and with ``errors``, in the file or in any configuration.
+        """
+        root = os.path.realpath(root)
+        stored = {
+            path: (mtime_ns, size, deps)
+            for path, mtime_ns, size, deps in self.connection.execute(
+                "SELECT path, mtime_ns, size, deps FROM files "
+                "WHERE path LIKE ? ESCAPE '\\'",
+                (_like_prefix(root + os.sep),),
+            )
+        }
+
+        stats = {"scanned": 0, "unchanged": 0, "removed": 0, "errors": 0}
+        signatures = {}
+        changed = []
+        for path in iter_ini_files(root):
+            if path in stored and _is_unchanged(
+                path, stored[path], signatures
+            ):
+                stats["unchanged"] += 1
+            else:
+                changed.append(path)
+            stored.pop(path, None)
+
+        workers = workers or os.cpu_count() or 1
+        with self.connection:
+            if workers == 1 or len(changed) <= 1:
+                records = map(scan_file, changed)
+                self._store(records, stats)
+            else:
+                chunksize = max(1, len(changed) // (workers * 4))
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    records = executor.map(
+                        scan_file, changed, chunksize=chunksize
+                    )
+                    self._store(records, stats)
+
+            self.connection.executemany(
+                "DELETE FROM files WHERE path = ?",
+                ((path,) for path in stored),
+            )
+            stats["removed"] = len(stored)
+        # Refresh the statistics the query planner picks indexes with
+        self.connection.execute("PRAGMA optimize")
+        return stats
+
+    def _store(self, records, stats: dict):
+        execute = self.connection.execute
+        for record in records:
+            stats["scanned"] += 1
+            stats["errors"] += record["error"] is not None or any(
+                config[-1] is not None for config in record["configs"]
+            )
+            execute("DELETE FROM files WHERE path = ?", (record["path"],))
+            file_id = execute(
+                "INSERT INTO files (path, folder, mtime_ns, size, deps, "
+                "config_name, config_hash, error, scanned) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    record["path"],
+                    os.path.dirname(record["path"]),
+                    record["mtime_ns"],
+                    record["size"],
+                    json.dumps(record["deps"]),
+                    record["config_name"],
+                    record["config_hash"],
+                    record["error"],
+                    time.time(),
+                ),
+            ).lastrowid
+            self.connection.executemany(
+                "INSERT INTO sections VALUES (?, ?, ?)",
+                ((file_id, *section) for section in record["sections"]),
+            )
+            self.connection.executemany(
+                "INSERT INTO params VALUES (?, ?, ?, ?)",
+                ((file_id, *param) for param in record["params"]),
+            )
+            self.connection.executemany(
+                f"INSERT INTO configs (file_id, config, "
+                f"{', '.join(CONFIG_FIELDS)}, error) VALUES (?, ?"
+                f"{', ?' * len(CONFIG_FIELDS)}, ?)",
+                ((file_id, *config) for config in record["configs"]),
+            )
+
+    def _migrate(self):
+        with self.connection:
+            self.connection.executescript(_SCHEMA)
+            row = self.connection.execute(
+                "SELECT value FROM meta WHERE key = 'schema_version'"
+            ).fetchone()
+            if row is not None and int(row[0]) < SCHEMA_VERSION:
+                # Older catalogs lack tables or columns; scan every file
+                # again
+                self.connection.execute("DELETE FROM files")
+                self.connection.execute("DROP TABLE configs")
+                self.connection.executescript(_SCHEMA)
+            self.connection.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)",
+                (str(SCHEMA_VERSION),),
+            )
+
+
+# ----- Methods ----- #
+
+
+def iter_ini_files(root: str):
+    """
+    Yields the omnetpp.ini files under a directory.
+
+    Hidden directories, such as backups and snapshots, are skipped.
+
+    Args:
+        root (str): The directory.
+
+    Yields:
+        str: Real path of every omnetpp.ini file.
+    """
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(name for name in dirnames if name[0] != ".")
+        if "omnetpp.ini" in filenames:
+            yield os.path.realpath(os.path.join(dirpath, "omnetpp.ini"))
+
+
+def scan_file(path: str) -> dict:
+    """
+    Parses an omnetpp.ini file into a catalog record.
+
+    Args:
+        path (str): Real path of the file.
+
+    Returns:
+        dict: The record. Errors reading or parsing the file are kept in
+        its ``error`` field; a configuration that cannot be resolved,
+        e.g. because it extends a section of a missing include, is kept
+        with its own error as the last item of its ``configs`` row, and
+        the other configurations are still stored.
+    """
+    record = {
+        "path": path,
+        "mtime_ns": None,
+        "size": None,
+        "deps": [],
+        "config_name": None,
+        "config_hash": None,
+        "error": None,
+        "sections": [],
+        "params": [],
+        "configs": [],
+    }
+    try:
+        # Stat first, so a file changed while parsing is scanned again
+        stat = os.stat(path)
+        record["mtime_ns"] = stat.st_mtime_ns
+        record["size"] = stat.st_size
+        document = opp_ini.load_document(path)
+        merged = opp_ini.load_merged_document(path)
+
+        record["deps"] = [
+            [dep, *_get_signature(dep, {})]
+            for dep in merged.files + merged.missing
+            if dep != path
+        ]
+        record["config_name"] = document.get_comment_field("Configuration")
+        record["config_hash"] = document.get_comment_field("Hash")
+        record["sections"] = [
+            (name, section.get_value("extends"))
+            for name, section in merged.sections.items()
+        ]
+    except (OSError, ValueError) as error:
+        record["error"] = _format_error(error)
+        return record
+
+    configs = document.get_configs()
+    # The runs are those of the configurations, or of General if none
+    described = configs or ["General"]
+    for config in ["General"] + configs:
+        fields = None
+        try:
+            effective = merged.get_effective(config)
+            params = effective.get_params()
+            if config in described:
+                fields = get_config_fields(effective)
+        except (OSError, ValueError) as error:
+            if config in described:
+                row = [config] + [None] * len(CONFIG_FIELDS)
+                record["configs"].append((*row, _format_error(error)))
+            continue
+        record["params"] += [(config, k, v) for k, v in params.items()]
+        if fields is not None:
+            row = [config] + [fields[field] for field in CONFIG_FIELDS]
+            record["configs"].append((*row, None))
+    return record
+
+
+def get_config_fields(effective) -> dict:
+    """
+    Gets the fields of CONFIG_FIELDS of a configuration.
+
+    Iteration variables take the value of the first run, except ``load``,
+    whose range is kept. ``runs`` is counted before the ``constraint``
+    option, if any, so it is an upper bound of the runs of a constrained
+    configuration.
+
+    Args:
+        effective (EffectiveConfig): The configuration.
+
+    Returns:
+        dict: Value of every field, None if the configuration has none.
+    """
+    params = effective.get_params()
+    runs = effective.get_runs()
+    count = runs.count_combinations()
+    # With a constraint, the runs are scanned only up to the first valid one
+    first = next(iter(runs), {}) if count else {}
+
+    def value(key):
+        return _resolve(params.get(key), first)
+
+    loads = [
+        _resolve(load, {})
+        for variable in runs.variables
+        if variable.name == "load"
+        for load in variable.get_values()
+    ]
+    loads = [load for load in loads if isinstance(load, (int, float))]
+    if not loads and isinstance(value("**.app[*].load"), (int, float)):
+        loads = [value("**.app[*].load")]
+
+    architecture = None
+    for name in effective.linearization:
+        if name.upper().replace("-", "_") in opp_ini.SwArchs.__members__:
+            architecture = name.upper().replace("-", "_")
+            break
+
+    return {
+        "network": value("network"),
+        "topology": value("**.topology"),
+        "nodes": value("**.numNodes"),
+        "arity": value("**.arity"),
+        "stages": value("**.numStages"),
+        "dim1": value("**.nD0"),
+        "dim2": value("**.nD1"),
+        "channel_distance": value("**.channelDistance"),
+        "architecture": architecture,
+        "arbiter": value("**.SW[*].arbiter.typename"),
+        "queue_scheme": value("**.congestionControlTechnique"),
+        "num_queues": value("**.numQueues"),
+        "routing": value("**.routingAlgorithm"),
+        "load_min": min(loads) if loads else None,
+        "load_max": max(loads) if loads else None,
+        "load_step": loads[1] - loads[0] if len(loads) > 1 else None,
+        "runs": count,
+    }
+
+
+def _resolve(text: str, run: dict):
+    """Gets the value of a parameter in a run, as a number if it is one."""
+    if text is None:
+        return None
+    match = _VARIABLE_RE.match(text)
+    if match and text.endswith("}") and match.group(1) in run:
+        text = run[match.group(1)]
+    text = text.strip().strip('"')
+
+    match = _NUMBER_RE.match(text)
+    if match:
+        number = float(match.group(1))
+        return int(number) if number.is_integer() else number
+    try:
+        number = opp_ini.evaluate_ned_expression(text, {})
+    except (ValueError, KeyError, TypeError, ZeroDivisionError):
+        return text
+    if isinstance(number, (int, float)) and not isinstance(number, bool):
+        return int(number) if float(number).is_integer() else number
+    return text
+
+
+def _format_error(error: Exception) -> str:
+    """Formats an error for the catalog."""
+    return f"{type(error).__name__}: {error}"
+
+
+def _where(filters: dict) -> tuple:
+    """Builds the WHERE clause of some query filters."""
+    clauses = []
+    args = []
+    for field, condition in (filters or {}).items():
+        column = _column(field)
+        if isinstance(condition, (list, set, frozenset)):
+            values = list(condition)
+            if not values:
+                clauses.append("0")
+                continue
+            clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+            args.extend(values)
+        elif isinstance(condition, tuple):
+            operator, value = condition
+            if operator.lower() not in _QUERY_OPERATORS:
+                raise ValueError(f"Unknown query operator {operator}")
+            clauses.append(f"{column} {operator.upper()} ?")
+            args.append(value)
+        elif condition is None:
+            clauses.append(f"{column} IS NULL")
+        else:
+            clauses.append(f"{column} = ?")
+            args.append(condition)
+    if not clauses:
+        return "", args
+    return " WHERE " + " AND ".join(clauses), args
+
+
+def _column(field: str) -> str:
+    """Gets the column of a query field."""
+    column = QUERY_FIELDS.get(field)
+    if column is None:
+        raise ValueError(f"Unknown query field {field}")
+    return column
+
+
+def _is_unchanged(path: str, stored: tuple, signatures: dict) -> bool:
+    """Checks a stored file and its includes against the filesystem."""
+    mtime_ns, size, deps = stored
+    if _get_signature(path, signatures) != (mtime_ns, size):
+        return False
+    return all(
+        list(_get_signature(dep, signatures)) == signature
+        for dep, *signature in json.loads(deps or "[]")
+    )
+
+
+def _get_signature(path: str, signatures: dict) -> tuple:
+    """Gets the (mtime_ns, size) of a file, (None, None) if it is missing."""
+    signature = signatures.get(path)
+    if signature is None:
+        try:
+            stat = os.stat(path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            signature = (None, None)
+        signatures[path] = signature
+    return signature
+
+
+def _like_prefix(prefix: str) -> str:
+    """Escapes a prefix for a LIKE pattern."""
+    for char in "\\%_":
+        prefix = prefix.replace(char, "\\" + char)
+    return prefix + "%"
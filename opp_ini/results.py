@@ -0,0 +1,441 @@
+"""opp_ini.results - manifest of the result files of finished runs.
+
+Every run is keyed by the hash of the parameters its configuration takes
+effect with, the contents of the files it includes and its run number
+(see get_run_keys), so equal keys produce equal results wherever the
+folder is. ResultsManifest maps these keys to the ``.sca`` and ``.vec``
+files of runs that completed; a later run with the same key can link to
+them instead of running the simulator again.
+
+A result file only counts as complete if it still has the size it was
+recorded with, starts with the ``version`` header, ends with a newline
+and, for vector files, matches the size its ``.vci`` index was written
+for.
+
+Example:
+    manifest = ResultsManifest("simulations/.results.jsonl")
+    runner.run_batches(simulations, manifest=manifest)
+"""
+
+import hashlib
+import json
+import os
+import shlex
+import time
+
+from collections import OrderedDict
+
+import opp_ini
+
+# ----- Constants ----- #
+RESULTS_DIR = "results"
+MANIFEST_FILE = ".results.jsonl"
+RESULT_EXTENSIONS = (".sca", ".vec")
+
+# Lines of the header of a result file, before the results themselves
+_HEADER_KEYS = ("version", "run", "attr", "itervar")
+
+
+# ----- Classes ----- #
+
+
+class ResultsManifest:
+    """A class representing the manifest of the results of finished runs.
+
+    The manifest is a JSON lines file; recording a run appends one line,
+    and the last line of a key wins.
+
+    Attributes:
+        path (str): Path of the manifest file.
+    """
+
+    def __init__(self, path: str):
+        """Initializes the manifest, reading its file if it exists."""
+        self.path = path
+        self._entries = OrderedDict()
+        try:
+            with open(path) as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    self._entries[entry["key"]] = entry
+        except FileNotFoundError:
+            pass
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ----- Getters ----- #
+
+    def get_keys(self) -> list:
+        """
+        Gets the keys of the runs recorded.
+
+        Returns:
+            list: The keys, oldest first.
+        """
+        return list(self._entries)
+
+    def get_entry(self, key: str) -> dict:
+        """
+        Gets the record of a run.
+
+        Args:
+            key (str): Key of the run.
+
+        Returns:
+            dict: ``key``, ``files`` (``path`` and ``size`` of every
+            result file), ``config``, ``run`` and ``created``.
+
+        Raises:
+            KeyError: If the run is not recorded.
+        """
+        if key not in self._entries:
+            raise KeyError(f"Run {key} not found")
+        return self._entries[key]
+
+    def is_complete(self, key: str) -> bool:
+        """
+        Checks that the result files of a run are still complete.
+
+        Args:
+            key (str): Key of the run.
+
+        Returns:
+            bool: False if the run is not recorded, or any of its files is
+            missing, changed size or fails check_result_file.
+        """
+        entry = self._entries.get(key)
+        if entry is None or not entry["files"]:
+            return False
+        for record in entry["files"]:
+            try:
+                if os.path.getsize(record["path"]) != record["size"]:
+                    return False
+            except OSError:
+                return False
+            if not check_result_file(record["path"]):
+                return False
+        return True
+
+    # ----- Setters ----- #
+
+    def record(
+        self, key: str, paths: list, config: str = None, run: int = None
+    ) -> dict:
+        """
+        Records the result files of a run.
+
+        Args:
+            key (str): Key of the run.
+            paths (list): Paths of its result files.
+            config (str): Name of its configuration.
+            run (int): Its run number.
+
+        Returns:
+            dict: The record (see get_entry).
+        """
+        entry = {
+            "key": key,
+            "files": [
+                {
+                    "path": os.path.abspath(path),
+                    "size": os.path.getsize(path),
+                }
+                for path in paths
+            ],
+            "config": config,
+            "run": run,
+            "created": time.time(),
+        }
+        folder = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(folder, exist_ok=True)
+        with open(self.path, "a") as file:
+            file.write(json.dumps(entry) + "\n")
+        self._entries[key] = entry
+        return entry
+
+    def link(self, key: str, results_dir: str) -> list:
+        """
+        Links the result files of a run into a results folder.
+
+        Files of the same name in the folder are replaced, unless they are
+        the recorded files themselves.
+
+        Args:
+            key (str): Key of the run.
+            results_dir (str): The folder.
+
+        Returns:
+            list: Paths of the links created.
+        """
+        os.makedirs(results_dir, exist_ok=True)
+        links = []
+        for record in self.get_entry(key)["files"]:
+            target = record["path"]
+            link = os.path.join(results_dir, os.path.basename(target))
+            if os.path.lexists(link):
+                if os.path.realpath(link) == os.path.realpath(target):
+                    continue
+                os.remove(link)
+            os.symlink(target, link)
+            links.append(link)
+        return links
+
+
+# ----- Methods ----- #
+
+
+def read_result_header(path: str) -> dict:
+    """
+    Reads the header of a ``.sca`` or ``.vec`` file.
+
+    Args:
+        path (str): Path of the file.
+
+    Returns:
+        dict: ``version`` and ``run``, plus the ``attr`` lines (e.g.
+        ``configname`` and ``runnumber``) by name.
+    """
+    header = {}
+    with open(path, "rb") as file:
+        for line in file:
+            fields = line.decode("utf-8", "replace").split(None, 2)
+            if not fields or fields[0] not in _HEADER_KEYS:
+                break
+            if fields[0] == "attr" and len(fields) == 3:
+                header[fields[1]] = fields[2].strip()
+            elif fields[0] in ("version", "run") and len(fields) > 1:
+                header[fields[0]] = " ".join(fields[1:]).strip()
+    return header
+
+
+def check_result_file(path: str) -> bool:
+    """
+    Checks that a result file was written to the end.
+
+    Args:
+        path (str): Path of a ``.sca`` or ``.vec`` file.
+
+    Returns:
+        bool: Whether it starts with the ``version`` header and ends with
+        a newline and, for a ``.vec`` file, its ``.vci`` index exists and
+        was written for its current size.
+    """
+    try:
+        size = os.path.getsize(path)
+        if size == 0:
+            return False
+        with open(path, "rb") as file:
+            if not file.read(8).startswith(b"version "):
+                return False
+            file.seek(-1, os.SEEK_END)
+            if file.read(1) != b"\n":
+                return False
+    except OSError:
+        return False
+
+    if not path.endswith(".vec"):
+        return True
+    try:
+        with open(path[:-4] + ".vci", "rb") as file:
+            for line in file:
+                fields = line.split()
+                if fields and fields[0] == b"file":
+                    return len(fields) > 1 and int(fields[1]) == size
+    except (OSError, ValueError):
+        return False
+    return False
+
+
+def find_run_results(
+    root_dir: str, config_name: str, since: float = None
+) -> dict:
+    """
+    Finds the result files of the runs of a configuration in a folder.
+
+    Args:
+        root_dir (str): The simulation folder.
+        config_name (str): Name of the configuration.
+        since (float): If given, files last modified before this time
+            (seconds since epoch) are left out.
+
+    Returns:
+        dict: Paths of the result files by run number.
+    """
+    results_dir = os.path.join(root_dir, RESULTS_DIR)
+    found = {}
+    try:
+        names = sorted(os.listdir(results_dir))
+    except FileNotFoundError:
+        return found
+    for name in names:
+        if not name.endswith(RESULT_EXTENSIONS):
+            continue
+        path = os.path.join(results_dir, name)
+        try:
+            if since is not None and os.stat(path).st_mtime < since:
+                continue
+            header = read_result_header(path)
+            run = int(header["runnumber"])
+        except (OSError, KeyError, ValueError):
+            continue
+        if header.get("configname") == config_name:
+            found.setdefault(run, []).append(path)
+    return found
+
+
+def get_run_keys(simulation, config_name: str, runs) -> dict:
+    """
+    Gets the manifest keys of runs of a configuration.
+
+    Args:
+        simulation (Simulation): The simulation folder, already written.
+        config_name (str): Name of the configuration.
+        runs (iterable): Run numbers.
+
+    Returns:
+        dict: Keys by run number.
+    """
+    digest = opp_ini.get_effective_hash(simulation, config_name)
+    return {
+        run: hashlib.sha256(f"{digest}#{run}".encode()).hexdigest()
+        for run in runs
+    }
+
+
+def reuse_results(
+    simulation, manifest: ResultsManifest, config_name: str, runs
+) -> tuple:
+    """
+    Links the complete results of runs recorded in a manifest.
+
+    Args:
+        simulation (Simulation): The simulation folder, already written.
+        manifest (ResultsManifest): The manifest.
+        config_name (str): Name of the configuration.
+        runs (iterable): Run numbers.
+
+    Returns:
+        tuple: The set of run numbers whose results were linked or were
+        already in the folder, and the keys by run number.
+    """
+    keys = get_run_keys(simulation, config_name, runs)
+    results_dir = os.path.join(simulation.get_root_dir(), RESULTS_DIR)
+    reused = set()
+    for run, key in keys.items():
+        if manifest.is_complete(key):
+            manifest.link(key, results_dir)
+            reused.add(run)
+    return reused, keys
+
+
+def record_results(
+    simulation,
+    manifest: ResultsManifest,
+    config_name: str,
+    keys: dict,
+    since: float = None,
+) -> list:
+    """
+    Records the complete results of finished runs in a manifest.
+
+    Runs with a missing or incomplete result file are not recorded. Result
+    files are only matched on their configuration and run number, so pass
+    the time the runs were started as since: files left in the folder by
+    earlier runs, e.g. with other iteration variables, are then not
+    recorded under the keys of these runs.
+
+    Args:
+        simulation (Simulation): The simulation folder.
+        manifest (ResultsManifest): The manifest.
+        config_name (str): Name of the configuration.
+        keys (dict): Keys by run number of the runs that finished.
+        since (float): Time the runs were started (seconds since epoch).
+
+    Returns:
+        list: Run numbers recorded.
+    """
+    found = find_run_results(simulation.get_root_dir(), config_name, since)
+    recorded = []
+    for run, key in keys.items():
+        paths = found.get(run)
+        if not paths or any(os.path.islink(path) for path in paths):
+            continue
+        if all(check_result_file(path) for path in paths):
+            manifest.record(key, paths, config_name, run)
+            recorded.append(run)
+    return recorded
+
+
+def read_scalars(path: str) -> tuple:
+    """
+    Reads the iteration variables and scalars of a ``.sca`` file.
+
+    Args:
+        path (str): Path of the file.
+
+    Returns:
+        tuple: The iteration variables by name, and a list of
+        ``(module, name, value)`` tuples.
+    """
+    itervars = {}
+    scalars = []
+    with open(path, encoding="utf-8", errors="replace") as file:
+        for line in file:
+            if line.startswith("itervar "):
+                fields = line.split(None, 2)
+                if len(fields) == 3:
+                    itervars[fields[1]] = fields[2].strip().strip('"')
+            elif line.startswith("scalar "):
+                fields = shlex.split(line) if '"' in line else line.split()
+                if len(fields) == 4:
+                    try:
+                        value = float(fields[3])
+                    except ValueError:
+                        continue
+                    scalars.append((fields[1], fields[2], value))
+    return itervars, scalars
+
+
+def read_throughput(
+    root_dir: str,
+    config_name: str,
+    scalar: str = "throughput",
+    variable: str = "load",
+) -> dict:
+    """
+    Reads the accepted throughput of the runs of a configuration by load.
+
+    Args:
+        root_dir (str): The simulation folder.
+        config_name (str): Name of the configuration.
+        scalar (str): Name of the scalar holding the throughput.
+        variable (str): Iteration variable holding the offered load.
+
+    Returns:
+        dict: Mean of the scalar over the modules and repetitions of every
+        load, by load. Runs without the variable or the scalar, or whose
+        file is incomplete, are left out.
+    """
+    samples = {}
+    for paths in find_run_results(root_dir, config_name).values():
+        for path in paths:
+            if not path.endswith(".sca") or not check_result_file(path):
+                continue
+            itervars, scalars = read_scalars(path)
+            try:
+                load = float(itervars[variable])
+            except (KeyError, ValueError):
+                continue
+            values = [value for _, name, value in scalars if name == scalar]
+            if values:
+                samples.setdefault(load, []).extend(values)
+    return {
+        load: sum(values) / len(values) for load, values in samples.items()
+    }
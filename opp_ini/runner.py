@@ -0,0 +1,1152 @@
+"""opp_ini.runner - local launcher of the simulations of a sweep.
+
+run_simulations starts the simulator (``opp_run`` by default) in the
+folder of every simulation, keeping at most max_procs processes and at
+most mem_budget bytes of estimated memory in use at once. The output of
+every run goes to ``<root_dir>/logs``, together with a ``runs.jsonl``
+line recording its command, exit status and wall time.
+
+run_batches does the same, but starts many runs of a configuration per
+process (``opp_run -r a..b``) so that short runs do not pay the start-up
+of the simulator each. Batches are sized from the observed duration of
+the runs and a failing batch is split so that only its failing runs are
+tried again.
+
+Both take an optional ResultsManifest (see opp_ini.results): runs whose
+results it already holds are linked instead of run, and the results of
+the runs that finish are recorded in it.
+
+Every process also logs the digests of the files its configuration
+depends on, so plan_reruns can tell which runs went stale after an
+input changed.
+
+adaptive_load_sweep runs a configuration at a coarse grid of offered
+loads, then only at loads around the point where the throughput
+saturates, and writes the loads it ran back to the configuration.
+
+Example:
+    results = runner.run_simulations(simulations, max_procs=64)
+    failed = [result for result in results if result.returncode != 0]
+"""
+
+import json
+import math
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+
+import opp_ini
+from opp_ini import catalog, results
+
+# ----- Constants ----- #
+DEFAULT_SIMULATOR = os.environ.get("OPP_RUN", "opp_run")
+LOG_DIR = "logs"
+RUN_LOG = "runs.jsonl"
+
+# Memory estimate of a run: a fixed cost plus a cost per queue of a node
+ESTIMATE_BASE = 128 << 20
+ESTIMATE_PER_QUEUE = 256 << 10
+
+# Wall time run_batches aims at for every process, in seconds
+DEFAULT_BATCH_SECONDS = 60
+
+# Key of the offered load of the applications
+LOAD_KEY = "**.app[*].load"
+
+# Cmdenv prints this line before starting every run
+_RUN_START_RE = re.compile(rb"run #(\d+)")
+
+
+# ----- Classes ----- #
+
+
+class RunResult:
+    """A class representing a finished run of the simulator.
+
+    Attributes:
+        index (int): Position of the simulation in the runs given.
+        simulation (Simulation): The simulation run.
+        command (list): Arguments the simulator was started with.
+        returncode (int): Exit status of the simulator.
+        seconds (float): Wall time of the run.
+        stdout (str): Path of the file holding the standard output.
+        stderr (str): Path of the file holding the standard error.
+        memory (int): Memory the run was estimated to use, in bytes.
+        runs (tuple): First and last run numbers of a batch, or None if
+            every run of the configuration was started.
+        retried (bool): Whether the runs of a failed batch were started
+            again in smaller batches.
+        cached (bool): Whether the runs were not started because their
+            results were linked from a results manifest.
+        started (float): Time the process was started (seconds since
+            epoch), None if it was not.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        simulation,
+        command: list,
+        returncode: int,
+        seconds: float,
+        stdout: str,
+        stderr: str,
+        memory: int,
+        runs: tuple = None,
+    ):
+        """Initializes the result."""
+        self.index = index
+        self.simulation = simulation
+        self.command = command
+        self.returncode = returncode
+        self.seconds = seconds
+        self.stdout = stdout
+        self.stderr = stderr
+        self.memory = memory
+        self.runs = runs
+        self.retried = False
+        self.cached = False
+        self.started = None
+
+    def __repr__(self):
+        return (
+            f"RunResult({self.index}, {self.command!r}, "
+            f"returncode={self.returncode}, seconds={self.seconds:.3f})"
+        )
+
+    def get_run_count(self) -> int:
+        """Gets the number of runs of a batch, None for a whole config."""
+        if self.runs is None:
+            return None
+        return self.runs[1] - self.runs[0] + 1
+
+
+class RerunPlan:
+    """A class representing runs of a configuration to be run again.
+
+    Attributes:
+        root_dir (str): The simulation folder.
+        config_name (str): Name of the configuration.
+        runs (list): Run numbers, in order.
+        reason (str): ``changed`` if the inputs of the runs changed since
+            they ran, ``missing`` if they never succeeded.
+        files (list): Paths of the inputs that changed.
+    """
+
+    def __init__(
+        self,
+        root_dir: str,
+        config_name: str,
+        runs: list,
+        reason: str,
+        files: list = (),
+    ):
+        """Initializes the plan."""
+        self.root_dir = root_dir
+        self.config_name = config_name
+        self.runs = runs
+        self.reason = reason
+        self.files = list(files)
+
+    def __repr__(self):
+        return (
+            f"RerunPlan({self.root_dir!r}, {self.config_name!r}, "
+            f"{self.get_run_filter()!r}, {self.reason!r})"
+        )
+
+    def get_run_filter(self) -> str:
+        """
+        Gets the runs as an ``opp_run -r`` filter.
+
+        Returns:
+            str: Run numbers and ``a..b`` ranges, separated by commas.
+        """
+        return ",".join(
+            str(first) if first == last else f"{first}..{last}"
+            for first, last in _get_ranges(self.runs, math.inf)
+        )
+
+
+class AdaptiveSweep:
+    """A class representing the outcome of adaptive_load_sweep.
+
+    Attributes:
+        throughputs (dict): Accepted throughput by offered load, for every
+            load measured.
+        knee (tuple): The highest load found below saturation and the
+            lowest load found saturated; the second is None if no load
+            saturated.
+        rounds (int): Number of rounds of simulations run.
+    """
+
+    def __init__(self, throughputs: dict, knee: tuple, rounds: int):
+        """Initializes the outcome."""
+        self.throughputs = throughputs
+        self.knee = knee
+        self.rounds = rounds
+
+    def __repr__(self):
+        return (
+            f"AdaptiveSweep({len(self.throughputs)} loads, "
+            f"knee={self.knee}, rounds={self.rounds})"
+        )
+
+    def get_loads(self) -> list:
+        """
+        Gets the loads measured.
+
+        Returns:
+            list: The loads, in increasing order.
+        """
+        return sorted(self.throughputs)
+
+
+class _Job:
+    """A simulator process waiting to be started."""
+
+    def __init__(
+        self, index, simulation, command, memory, config_name, runs=None
+    ):
+        self.index = index
+        self.simulation = simulation
+        self.command = command
+        self.memory = memory
+        self.config_name = config_name
+        self.runs = runs
+        self.inputs = None
+        self.started = None
+        self.log_name = config_name
+        if runs is not None:
+            self.log_name += f"-r{runs[0]}-{runs[1]}"
+
+
+# ----- Methods ----- #
+
+
+def get_simulator_command(simulator=None) -> list:
+    """
+    Gets the arguments that start the simulator.
+
+    Args:
+        simulator (str | list): The executable, or the executable and its
+            leading arguments (e.g. ``["opp_run", "-l", "sauron"]``).
+            DEFAULT_SIMULATOR, taken from $OPP_RUN, if None.
+
+    Returns:
+        list: The arguments.
+
+    Raises:
+        FileNotFoundError: If the executable cannot be found.
+    """
+    if simulator is None:
+        simulator = DEFAULT_SIMULATOR
+    command = [simulator] if isinstance(simulator, str) else list(simulator)
+    if shutil.which(command[0]) is None:
+        raise FileNotFoundError(f"Simulator {command[0]} not found")
+    return command
+
+
+def build_command(
+    simulation, simulator=None, runs: str = None, config=None
+) -> list:
+    """
+    Builds the command line that runs the configuration of a simulation.
+
+    Args:
+        simulation (Simulation): The simulation, already written with
+            set_new_configuration.
+        simulator (str | list): See get_simulator_command.
+        runs (str): Run filter passed with ``-r``, e.g. ``0..9``. Every run
+            of the configuration if None.
+        config (str | callable): See get_config_name.
+
+    Returns:
+        list: The arguments, to be run in the folder of the simulation.
+    """
+    command = get_simulator_command(simulator) + [
+        "-u",
+        "Cmdenv",
+        "-c",
+        get_config_name(simulation, config),
+    ]
+    if runs is not None:
+        command += ["-r", runs]
+    return command + ["omnetpp.ini"]
+
+
+def get_config_name(simulation, config=None) -> str:
+    """
+    Gets the configuration of a simulation the simulator has to run.
+
+    Args:
+        simulation (Simulation): The simulation.
+        config (str | callable): The configuration, or a function getting
+            it from the simulation. The one get_run_configuration finds in
+            the omnetpp.ini file if None, or the name given by
+            set_configuration_name if the file is not written yet.
+
+    Returns:
+        str: The name of the configuration.
+    """
+    if config is None:
+        try:
+            return opp_ini.get_run_configuration(simulation)
+        except FileNotFoundError:
+            return opp_ini.set_configuration_name(simulation)
+    if callable(config):
+        return config(simulation)
+    return config
+
+
+def count_runs(simulation, config=None) -> int:
+    """
+    Counts the runs of the configuration of a simulation.
+
+    Args:
+        simulation (Simulation): The simulation, already written.
+        config (str | callable): See get_config_name.
+
+    Returns:
+        int: The number of runs, as numbered by ``opp_run -r``.
+    """
+    document = opp_ini.get_merged_document(simulation)
+    config_name = get_config_name(simulation, config)
+    return len(document.get_effective(config_name).get_runs())
+
+
+def get_run_seconds(simulation, config=None) -> float:
+    """
+    Gets the mean wall time of a run from the run log of a simulation.
+
+    Only batches that succeeded are taken into account.
+
+    Args:
+        simulation (Simulation): The simulation.
+        config (str | callable): See get_config_name.
+
+    Returns:
+        float: Seconds per run, or None if no batch has been run yet.
+    """
+    config_name = get_config_name(simulation, config)
+    seconds = 0.0
+    runs = 0
+    for record in read_run_log(simulation.root_dir):
+        if (
+            record.get("config") == config_name
+            and record.get("runs")
+            and record.get("returncode") == 0
+        ):
+            first, last = record["runs"]
+            seconds += record["seconds"]
+            runs += last - first + 1
+    return seconds / runs if runs else None
+
+
+def read_run_log(root_dir: str) -> list:
+    """
+    Reads the run log of a simulation folder.
+
+    Args:
+        root_dir (str): The simulation folder.
+
+    Returns:
+        list: A dict per process run, oldest first. Empty if the folder
+        was never run.
+    """
+    records = []
+    try:
+        with open(os.path.join(root_dir, LOG_DIR, RUN_LOG)) as file:
+            for line in file:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def plan_reruns(root: str, config: str = None) -> list:
+    """
+    Finds the runs under a directory whose inputs changed since they ran.
+
+    Every process started by this module logs the digests of the files
+    its configuration depends on (see opp_ini.get_config_inputs). A run is
+    stale when the latest of its successful processes saw other digests
+    than the files have now, or another set of files; editing a traffic
+    file only makes stale the configurations that look it up. Runs of a
+    configuration that never succeeded are reported as missing. Nothing
+    is run.
+
+    Args:
+        root (str): Directory holding the simulation folders.
+        config (str): Only plan the runs of this configuration.
+
+    Returns:
+        list: RerunPlan objects, by folder and configuration.
+    """
+    plans = []
+    for path in catalog.iter_ini_files(root):
+        root_dir = os.path.dirname(path)
+        by_config = {}
+        for record in read_run_log(root_dir):
+            if config is None or record.get("config") == config:
+                by_config.setdefault(record.get("config"), []).append(record)
+        if not by_config:
+            continue
+
+        simulation = opp_ini.Simulation()
+        simulation.root_dir = root_dir
+        for config_name, records in sorted(by_config.items()):
+            try:
+                current = opp_ini.get_config_inputs(simulation, config_name)
+                total_runs = count_runs(simulation, config_name)
+            except (OSError, ValueError):
+                # The configuration is gone: there is nothing to run again
+                continue
+
+            seen = {}
+            for record in records:
+                if record.get("returncode") != 0:
+                    continue
+                first, last = record.get("runs") or (0, total_runs - 1)
+                for run in range(first, min(last + 1, total_runs)):
+                    seen[run] = record.get("inputs")
+
+            stale = []
+            files = set()
+            for run in range(total_runs):
+                inputs = seen.get(run, current)
+                if inputs != current:
+                    stale.append(run)
+                    files.update(
+                        file
+                        for file in set(inputs or {}) | set(current)
+                        if (inputs or {}).get(file) != current.get(file)
+                    )
+            missing = [run for run in range(total_runs) if run not in seen]
+            if stale:
+                plans.append(
+                    RerunPlan(
+                        root_dir, config_name, stale, "changed", sorted(files)
+                    )
+                )
+            if missing:
+                plans.append(
+                    RerunPlan(root_dir, config_name, missing, "missing")
+                )
+    return plans
+
+
+def estimate_memory(simulation) -> int:
+    """
+    Estimates the memory a run of a simulation uses.
+
+    The estimate grows with the number of queues in the network. It is
+    rough; pass a calibrated estimate to run_simulations if needed.
+
+    Args:
+        simulation (Simulation): The simulation.
+
+    Returns:
+        int: The memory, in bytes.
+    """
+    queues = simulation.topology.get_nodes() * max(
+        1, simulation.switch.get_num_queues()
+    )
+    return ESTIMATE_BASE + queues * ESTIMATE_PER_QUEUE
+
+
+def get_memory_budget() -> int:
+    """
+    Gets the physical memory of the machine.
+
+    Returns:
+        int: The memory, in bytes, or 0 if it cannot be found.
+    """
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return 0
+
+
+def run_simulations(
+    simulations,
+    max_procs: int = None,
+    mem_budget: int = None,
+    simulator=None,
+    estimate=estimate_memory,
+    config=None,
+    manifest: results.ResultsManifest = None,
+) -> list:
+    """
+    Runs the simulator for many simulations on the local cores.
+
+    Runs start in the order given. When the next run does not fit in the
+    memory left, later runs that do fit start first; a run larger than
+    the whole budget starts alone.
+
+    Args:
+        simulations (iterable): The simulations, already written.
+        max_procs (int): Maximum number of simulator processes. All the
+            cores if None.
+        mem_budget (int): Maximum estimated memory in use, in bytes. The
+            physical memory if None.
+        simulator (str | list): See get_simulator_command.
+        estimate (callable): Gets the memory, in bytes, of a simulation.
+        config (str | callable): See get_config_name.
+        manifest (ResultsManifest): If given, simulations whose runs all
+            have complete results in it are linked to them instead of
+            run, and the results of the simulations run are recorded.
+
+    Returns:
+        list: A RunResult per simulation, in the order given.
+
+    Raises:
+        ValueError: If a simulation has no root directory, or max_procs
+            is not positive.
+        FileNotFoundError: If the simulator cannot be found.
+        OSError: If the output or the run log of a run cannot be written.
+    """
+    prefix = get_simulator_command(simulator)
+    jobs = []
+    cached = []
+    keys = {}
+    for index, simulation in enumerate(simulations):
+        if not simulation.root_dir:
+            raise ValueError("Simulation root directory not set")
+        config_name = get_config_name(simulation, config)
+        if manifest is not None:
+            total_runs = count_runs(simulation, config_name)
+            reused, keys[index] = results.reuse_results(
+                simulation, manifest, config_name, range(total_runs)
+            )
+            if len(reused) == total_runs:
+                cached.append(_cached_result(index, simulation))
+                continue
+        jobs.append(
+            _Job(
+                index,
+                simulation,
+                build_command(simulation, prefix, config=config_name),
+                estimate(simulation),
+                config_name,
+            )
+        )
+
+    finished = _run_jobs(jobs, max_procs, mem_budget)
+    if manifest is not None:
+        for result in finished:
+            if result.returncode == 0:
+                results.record_results(
+                    result.simulation,
+                    manifest,
+                    get_config_name(result.simulation, config),
+                    keys[result.index],
+                    since=result.started,
+                )
+    return sorted(finished + cached, key=lambda result: result.index)
+
+
+def run_batches(
+    simulations,
+    max_procs: int = None,
+    mem_budget: int = None,
+    simulator=None,
+    estimate=estimate_memory,
+    config=None,
+    batch_seconds: float = DEFAULT_BATCH_SECONDS,
+    max_batch: int = None,
+    runs=count_runs,
+    manifest: results.ResultsManifest = None,
+) -> list:
+    """
+    Runs the simulator for many simulations, many runs per process.
+
+    The runs of every configuration are split into ``-r a..b`` batches
+    lasting about batch_seconds each. The duration of a run is taken from
+    the run log of the folder or, for a folder never run before, from a
+    first batch of a single run. Batches are kept small enough for all the
+    processes to be busy.
+
+    When a batch fails, the runs that finished before the failing one are
+    kept, and the failing run and the ones after it are started again,
+    the failing run alone. If the failing run cannot be told from the
+    output, the batch is split in halves.
+
+    Args:
+        simulations (iterable): The simulations, already written.
+        max_procs (int): See run_simulations.
+        mem_budget (int): See run_simulations.
+        simulator (str | list): See get_simulator_command.
+        estimate (callable): Gets the memory, in bytes, of a run.
+        config (str | callable): See get_config_name.
+        batch_seconds (float): Wall time to aim at for every batch.
+        max_batch (int): Maximum number of runs per batch, no limit if
+            None.
+        runs (callable): Gets the number of runs from the simulation and
+            config, count_runs by default.
+        manifest (ResultsManifest): If given, runs with complete results
+            in it are linked to them instead of run, and the results of
+            the runs that finish are recorded.
+
+    Returns:
+        list: A RunResult per process started, and per range of runs
+        linked from the manifest (``cached`` set), by simulation and first
+        run. The batches that failed and were split have ``retried`` set.
+
+    Raises:
+        ValueError: If a simulation has no root directory, or max_procs
+            is not positive.
+        FileNotFoundError: If the simulator cannot be found.
+    """
+    max_procs = max_procs or os.cpu_count() or 1
+    planner = _BatchPlanner(
+        get_simulator_command(simulator),
+        estimate,
+        config,
+        batch_seconds,
+        max_batch or math.inf,
+        max_procs,
+        manifest,
+    )
+    jobs = []
+    for simulation in simulations:
+        if not simulation.root_dir:
+            raise ValueError("Simulation root directory not set")
+        jobs += planner.add(
+            simulation, runs(simulation, get_config_name(simulation, config))
+        )
+    finished = _run_jobs(jobs, max_procs, mem_budget, planner.on_finish)
+    return sorted(
+        finished + planner.cached,
+        key=lambda result: (result.index, result.runs),
+    )
+
+
+def reuse_sweep(
+    sweep_results: list, manifest: results.ResultsManifest, config=None
+) -> list:
+    """
+    Links the results a generated sweep already has in a manifest.
+
+    Args:
+        sweep_results (list): SweepResult objects from generate_sweep.
+        manifest (ResultsManifest): The manifest.
+        config (str | callable): See get_config_name. The config_name of
+            each SweepResult if None.
+
+    Returns:
+        list: The simulations of the sweep with runs still to be run.
+    """
+    pending = []
+    for sweep_result in sweep_results:
+        simulation = opp_ini.build_simulation(
+            sweep_result.point, os.path.dirname(sweep_result.path)
+        )
+        config_name = sweep_result.config_name
+        if config is not None:
+            config_name = get_config_name(simulation, config)
+        total_runs = count_runs(simulation, config_name)
+        reused, _ = results.reuse_results(
+            simulation, manifest, config_name, range(total_runs)
+        )
+        if len(reused) < total_runs:
+            pending.append(simulation)
+    return pending
+
+
+def _cached_result(index: int, simulation, runs: tuple = None) -> RunResult:
+    """Makes the result of runs linked from a results manifest."""
+    result = RunResult(index, simulation, [], 0, 0.0, None, None, 0, runs)
+    result.cached = True
+    return result
+
+
+def _get_ranges(runs: list, size: int) -> list:
+    """Splits sorted run numbers into ranges of consecutive runs."""
+    ranges = []
+    for run in runs:
+        if ranges and run == ranges[-1][1] + 1 and run - ranges[-1][0] < size:
+            ranges[-1] = (ranges[-1][0], run)
+        else:
+            ranges.append((run, run))
+    return ranges
+
+
+class _BatchPlanner:
+    """Splits the runs of the simulations of run_batches into batches."""
+
+    def __init__(
+        self,
+        prefix,
+        estimate,
+        config,
+        batch_seconds,
+        max_batch,
+        max_procs,
+        manifest,
+    ):
+        self.prefix = prefix
+        self.estimate = estimate
+        self.config = config
+        self.batch_seconds = batch_seconds
+        self.max_batch = max_batch
+        self.max_procs = max_procs
+        self.manifest = manifest
+        self.simulations = []
+        self.cached = []
+        # Per simulation: runs not in a batch yet, and their manifest keys
+        self.todo = []
+        self.keys = []
+        # Per simulation: seconds and runs of the batches that succeeded
+        self.seconds = []
+        self.runs = []
+
+    def add(self, simulation, total_runs: int) -> list:
+        """Adds a simulation and gets its first batches."""
+        index = len(self.simulations)
+        config_name = get_config_name(simulation, self.config)
+        todo = list(range(total_runs))
+        keys = {}
+        if self.manifest is not None:
+            reused, keys = results.reuse_results(
+                simulation, self.manifest, config_name, todo
+            )
+            for runs in _get_ranges(sorted(reused), math.inf):
+                self.cached.append(_cached_result(index, simulation, runs))
+            todo = [run for run in todo if run not in reused]
+
+        per_run = get_run_seconds(simulation, config_name)
+        self.simulations.append(simulation)
+        self.todo.append(todo)
+        self.keys.append(keys)
+        self.seconds.append(per_run or 0.0)
+        self.runs.append(1 if per_run else 0)
+        return self.plan(index)
+
+    def plan(self, index: int) -> list:
+        """Gets the batches of the runs of a simulation not planned yet."""
+        todo = self.todo[index]
+        size = self.get_batch_size(index)
+        if not self.runs[index]:
+            # Nothing has been timed yet: time a single run first
+            planned, self.todo[index] = todo[:1], todo[1:]
+        else:
+            planned, self.todo[index] = todo, []
+        return [
+            self.make_job(index, first, last)
+            for first, last in _get_ranges(planned, size)
+        ]
+
+    def get_batch_size(self, index: int) -> int:
+        """Gets the number of runs per batch of a simulation."""
+        unplanned = sum(len(todo) for todo in self.todo)
+        size = min(self.max_batch, math.ceil(unplanned / self.max_procs))
+        if self.seconds[index] > 0:
+            per_run = self.seconds[index] / self.runs[index]
+            size = min(size, int(self.batch_seconds / per_run))
+        return max(1, size)
+
+    def make_job(self, index: int, first: int, last: int) -> _Job:
+        """Makes the job of a batch."""
+        simulation = self.simulations[index]
+        config_name = get_config_name(simulation, self.config)
+        runs = str(first) if first == last else f"{first}..{last}"
+        return _Job(
+            index,
+            simulation,
+            build_command(simulation, self.prefix, runs, config_name),
+            self.estimate(simulation),
+            config_name,
+            (first, last),
+        )
+
+    def on_finish(self, result: RunResult) -> list:
+        """Gets the batches to start after a batch finished."""
+        index = result.index
+        first, last = result.runs
+        if result.returncode == 0:
+            self.seconds[index] += result.seconds
+            self.runs[index] += last - first + 1
+            self.record(index, first, last, result.started)
+            return self.plan(index)
+        if first == last:
+            # A failing run is not retried alone, but the next ones are
+            return self.plan(index)
+
+        result.retried = True
+        failed = _get_failed_run(result)
+        if failed is None:
+            middle = (first + last) // 2
+            jobs = [
+                self.make_job(index, first, middle),
+                self.make_job(index, middle + 1, last),
+            ]
+        else:
+            self.record(index, first, failed - 1, result.started)
+            jobs = [self.make_job(index, failed, failed)]
+            if failed < last:
+                jobs.append(self.make_job(index, failed + 1, last))
+        return jobs + self.plan(index)
+
+    def record(self, index: int, first: int, last: int, since: float):
+        """Records the results a process started at since wrote."""
+        if self.manifest is None or first > last:
+            return
+        keys = self.keys[index]
+        results.record_results(
+            self.simulations[index],
+            self.manifest,
+            get_config_name(self.simulations[index], self.config),
+            {run: keys[run] for run in range(first, last + 1)},
+            since=since,
+        )
+
+
+def _get_failed_run(result: RunResult) -> int:
+    """Gets the run a failed batch stopped at, from its output."""
+    try:
+        with open(result.stdout, "rb") as file:
+            started = _RUN_START_RE.findall(file.read())
+    except OSError:
+        return None
+    first, last = result.runs
+    for run in reversed(started):
+        if first <= int(run) <= last:
+            return int(run)
+    return None
+
+
+def _run_jobs(
+    jobs: list, max_procs: int, mem_budget: int, on_finish=None
+) -> list:
+    """
+    Runs the jobs within the process and memory limits.
+
+    on_finish gets every result and returns more jobs to run, which start
+    before the ones still pending. An error in a thread waiting for a
+    process, e.g. writing the run log, is raised here once that process
+    is done, after killing the others.
+    """
+    max_procs = max_procs or os.cpu_count() or 1
+    if max_procs < 1:
+        raise ValueError("max_procs must be positive")
+    mem_budget = mem_budget or get_memory_budget() or float("inf")
+
+    done = []
+    pending = list(jobs)
+    running = {}
+    finished = []
+    used = 0
+    condition = threading.Condition()
+
+    def wait(job, process, start, files):
+        # Always post an outcome, or the scheduler would wait forever
+        result = None
+        error = None
+        try:
+            returncode = process.wait()
+            seconds = time.perf_counter() - start
+            for file in files:
+                file.close()
+            result = RunResult(
+                job.index,
+                job.simulation,
+                job.command,
+                returncode,
+                seconds,
+                files[0].name,
+                files[1].name,
+                job.memory,
+                job.runs,
+            )
+            result.started = job.started
+            _log_run(job, result)
+        except BaseException as exc:
+            error = exc
+        finally:
+            with condition:
+                finished.append((job, result, error))
+                condition.notify()
+
+    try:
+        with condition:
+            while pending or running:
+                waiting = []
+                for job in pending:
+                    if len(running) < max_procs and (
+                        not running or used + job.memory <= mem_budget
+                    ):
+                        running[id(job)] = _start(job, wait)
+                        used += job.memory
+                    else:
+                        waiting.append(job)
+                pending = waiting
+
+                while not finished:
+                    condition.wait()
+                added = []
+                for job, result, error in finished:
+                    del running[id(job)]
+                    used -= job.memory
+                    if error is not None:
+                        raise error
+                    done.append(result)
+                    if on_finish is not None:
+                        added += on_finish(result)
+                finished.clear()
+                pending = added + pending
+    except BaseException:
+        for process in running.values():
+            process.kill()
+        raise
+    if on_finish is None:
+        done.sort(key=lambda result: result.index)
+    return done
+
+
+def _start(job: _Job, wait) -> subprocess.Popen:
+    """Starts the process of a job and a thread waiting for it."""
+    log_dir = os.path.join(job.simulation.root_dir, LOG_DIR)
+    os.makedirs(log_dir, exist_ok=True)
+    files = (
+        open(os.path.join(log_dir, f"{job.log_name}.out"), "wb"),
+        open(os.path.join(log_dir, f"{job.log_name}.err"), "wb"),
+    )
+    job.inputs = _get_inputs(job.simulation, job.config_name)
+    job.started = time.time()
+    start = time.perf_counter()
+    try:
+        process = subprocess.Popen(
+            job.command,
+            cwd=job.simulation.root_dir,
+            stdin=subprocess.DEVNULL,
+            stdout=files[0],
+            stderr=files[1],
+        )
+    except BaseException:
+        for file in files:
+            file.close()
+        raise
+    threading.Thread(
+        target=wait, args=(job, process, start, files), daemon=True
+    ).start()
+    return process
+
+
+def _log_run(job: _Job, result: RunResult):
+    """Appends the outcome of a run to the run log of its folder."""
+    record = {
+        "config": job.config_name,
+        "runs": job.runs,
+        "command": result.command,
+        "returncode": result.returncode,
+        "seconds": round(result.seconds, 6),
+        "finished": time.time(),
+        "inputs": job.inputs,
+    }
+    log_path = os.path.join(job.simulation.root_dir, LOG_DIR, RUN_LOG)
+    with open(log_path, "a") as file:
+        file.write(json.dumps(record) + "\n")
+
+
+def _get_inputs(simulation, config_name: str) -> dict:
+    """Gets the input digests of a configuration, None if unreadable."""
+    try:
+        return opp_ini.get_config_inputs(simulation, config_name)
+    except (OSError, ValueError):
+        return None
+
+
+# ----- Adaptive load sweeps ----- #
+
+
+def get_load_section(simulation, config=None, key: str = LOAD_KEY) -> str:
+    """
+    Gets the section of the omnetpp.ini file the loads are written in.
+
+    It is the first section the configuration looks the key up in that
+    sets it, as in the sections of add_new_configuration, or ``General``
+    if none does, as in the files of set_new_configuration.
+
+    Args:
+        simulation (Simulation): The simulation, already written.
+        config (str | callable): See get_config_name.
+        key (str): Key of the load, as written in the file.
+
+    Returns:
+        str: The name of the section.
+    """
+    document = opp_ini.get_document(simulation)
+    pending = [get_config_name(simulation, config)]
+    seen = set()
+    while pending:
+        section = document.get_section(pending.pop(0))
+        if section is None or section.name in seen:
+            continue
+        if section.get_entry(key) is not None:
+            return section.name
+        seen.add(section.name)
+        pending.extend(section.get_extends())
+    return "General"
+
+
+def set_loads(simulation, loads, config=None, key: str = LOAD_KEY) -> bool:
+    """
+    Sets the offered loads a configuration iterates over.
+
+    The key is replaced in the section get_load_section finds, and added
+    to ``General`` if no section sets it.
+
+    Args:
+        simulation (Simulation): The simulation, already written.
+        loads (iterable): The loads.
+        config (str | callable): See get_config_name.
+        key (str): Key of the load, as written in the file.
+
+    Returns:
+        bool: True if the file changed.
+    """
+    value = ",".join(f"{load:g}" for load in loads)
+    return opp_ini.patch_parameter(
+        simulation,
+        get_load_section(simulation, config, key),
+        key,
+        f"${{load={value}}}",
+    )
+
+
+def measure_loads(
+    simulation,
+    loads: list,
+    config=None,
+    scalar: str = "throughput",
+    **kwargs,
+) -> dict:
+    """
+    Runs a configuration at some offered loads and reads its throughput.
+
+    Args:
+        simulation (Simulation): The simulation, already written.
+        loads (list): The loads.
+        config (str | callable): See get_config_name.
+        scalar (str): See results.read_throughput.
+        **kwargs: Other arguments of run_batches.
+
+    Returns:
+        dict: Accepted throughput by load, for the loads whose runs have
+        results.
+    """
+    config_name = get_config_name(simulation, config)
+    set_loads(simulation, loads, config_name)
+    run_batches([simulation], config=config_name, **kwargs)
+    throughputs = results.read_throughput(
+        simulation.root_dir, config_name, scalar
+    )
+    return {load: throughputs[load] for load in loads if load in throughputs}
+
+
+def find_knee(throughputs: dict, efficiency: float = 0.95) -> tuple:
+    """
+    Finds the loads around the saturation point of a throughput curve.
+
+    A load is saturated when the ratio of accepted throughput to offered
+    load falls below efficiency times the ratio at the lowest load.
+
+    Args:
+        throughputs (dict): Accepted throughput by offered load.
+        efficiency (float): Fraction of the initial ratio below which a
+            load is saturated.
+
+    Returns:
+        tuple: The highest load before the first saturated one, and the
+        first saturated load, or None if none is.
+    """
+    loads = sorted(load for load in throughputs if load > 0)
+    if not loads:
+        raise ValueError("No positive load was measured")
+    threshold = efficiency * throughputs[loads[0]] / loads[0]
+    for below, load in zip(loads, loads[1:]):
+        if throughputs[load] / load < threshold:
+            return below, load
+    return loads[-1], None
+
+
+def adaptive_load_sweep(
+    simulation,
+    initial: float = 10,
+    final: float = 100,
+    coarse: int = 5,
+    tolerance: float = 2.5,
+    efficiency: float = 0.95,
+    per_round: int = 1,
+    measure=None,
+    config=None,
+    write: bool = True,
+    **kwargs,
+) -> AdaptiveSweep:
+    """
+    Sweeps the offered load of a simulation around its saturation point.
+
+    Instead of evenly spaced loads, a coarse grid is run first; the
+    interval where the throughput stops following the load (see
+    find_knee) is then narrowed by running per_round evenly spaced loads
+    inside it per round, until it is no wider than tolerance. The loads
+    measured are finally written back to the configuration.
+
+    Args:
+        simulation (Simulation): The simulation, already written.
+        initial (float): Lowest load of the grid, above 0.
+        final (float): Highest load of the grid.
+        coarse (int): Number of loads of the grid.
+        tolerance (float): Width of the saturation interval to stop at.
+        efficiency (float): See find_knee.
+        per_round (int): Loads run at once while narrowing the interval;
+            more loads take fewer rounds, keeping more cores busy.
+        measure (callable): Gets the throughput by load from the list of
+            loads; measure_loads on the simulation if None.
+        config (str | callable): See get_config_name.
+        write (bool): Whether to write the loads measured back to the
+            configuration.
+        **kwargs: Other arguments of measure_loads.
+
+    Returns:
+        AdaptiveSweep: The loads measured and the saturation interval.
+
+    Raises:
+        ValueError: If initial is not positive or coarse is below 2.
+    """
+    if initial <= 0 or coarse < 2:
+        raise ValueError("The grid needs 2 loads or more, all above 0")
+    if measure is None:
+
+        def measure(loads):
+            return measure_loads(simulation, loads, config, **kwargs)
+
+    step = (final - initial) / (coarse - 1)
+    loads = [float(f"{initial + step * i:g}") for i in range(coarse)]
+    throughputs = dict(measure(loads))
+    tried = set(loads)
+    rounds = 1
+    knee = find_knee(throughputs, efficiency)
+    while knee[1] is not None and knee[1] - knee[0] > tolerance:
+        width = (knee[1] - knee[0]) / (per_round + 1)
+        loads = [
+            float(f"{knee[0] + width * i:g}") for i in range(1, per_round + 1)
+        ]
+        loads = [load for load in loads if load not in tried]
+        if not loads:
+            # The loads left failed or cannot be told apart any more
+            break
+        tried.update(loads)
+        throughputs.update(measure(loads))
+        rounds += 1
+        knee = find_knee(throughputs, efficiency)
+
+    if write:
+        set_loads(simulation, sorted(throughputs), config)
+    return AdaptiveSweep(throughputs, knee, rounds)
@@ -0,0 +1,28 @@
+import itertools
+
+import pytest
+
+import opp_ini as oi
+
+
+@pytest.fixture
+def make_simulation(tmp_path):
+    """Makes simulations in new folders of the test's tmp_path.
+
+    Returns:
+        A function taking the optional contents of the omnetpp.ini file and
+        the optional name of the folder, that returns a Simulation rooted in
+        that folder.
+    """
+    numbers = itertools.count()
+
+    def make(text=None, name=None):
+        root_dir = tmp_path / (name or f"simulation{next(numbers)}")
+        root_dir.mkdir(parents=True, exist_ok=True)
+        if text is not None:
+            (root_dir / "omnetpp.ini").write_text(text)
+        simulation = oi.Simulation()
+        simulation.root_dir = str(root_dir)
+        return simulation
+
+    return make
@@ -0,0 +1,135 @@
+import re
+import sys
+
+import opp_ini as oi
+from opp_ini import runner
+
+STUB = """\
+import os, re, sys
+runs = sys.argv[sys.argv.index("-r") + 1].split("..")
+config = sys.argv[sys.argv.index("-c") + 1]
+loads = re.search(r"load=([^}]*)", open("omnetpp.ini").read())
+loads = loads.group(1).split(",")
+os.makedirs("results", exist_ok=True)
+for run in range(int(runs[0]), int(runs[-1]) + 1):
+    load = loads[run]
+    with open(f"results/{config}-load={load}-#{run}.sca", "w") as file:
+        file.write(
+            f"version 3\\nrun {config}-{run}\\nattr configname {config}\\n"
+            f"attr runnumber {run}\\nitervar load {load}\\n\\n"
+            f"scalar Net.H[0].app throughput {min(float(load), 60)}\\n"
+            f"scalar Net.H[1].app throughput {min(float(load), 66)}\\n"
+        )
+"""
+
+
+def test_adaptive_load_sweep():
+    measured = []
+
+    def measure(loads):
+        measured.extend(loads)
+        return {load: min(load, 62.3) for load in loads}
+
+    sweep = runner.adaptive_load_sweep(
+        None, measure=measure, tolerance=2.5, write=False
+    )
+
+    # Throughput falls below 95% of the load past 62.3 / 0.95.
+    assert sweep.knee[0] <= 62.3 / 0.95 < sweep.knee[1]
+    assert sweep.knee[1] - sweep.knee[0] <= 2.5
+    assert sweep.get_loads() == sorted(measured)
+    # A uniform grid with the same resolution takes 37 loads.
+    assert len(measured) <= 37 // 2
+    assert sweep.rounds == len(measured) - 4
+
+    # More loads per round take fewer rounds.
+    parallel = runner.adaptive_load_sweep(
+        None, measure=measure, per_round=3, write=False
+    )
+    assert parallel.rounds < sweep.rounds
+
+    assert runner.find_knee({10: 10, 20: 20}) == (20, None)
+    assert runner.find_knee({10: 10, 20: 20, 30: 22}) == (20, 30)
+
+
+def test_adaptive_load_sweep_runs(tmp_path):
+    stub = tmp_path / "stub.py"
+    stub.write_text(STUB)
+    (tmp_path / "omnetpp.ini").write_text(
+        "[General]\n"
+        "[Config Sweep]\n"
+        "**.app[*].load = ${load=10..100 step 10}\n"
+    )
+    simulation = oi.Simulation()
+    simulation.root_dir = str(tmp_path)
+
+    sweep = runner.adaptive_load_sweep(
+        simulation,
+        tolerance=1,
+        per_round=3,
+        config="Sweep",
+        simulator=[sys.executable, str(stub)],
+        estimate=lambda simulation: 1,
+        max_procs=2,
+    )
+
+    assert sweep.throughputs[10] == 10
+    assert sweep.throughputs[100] == 63
+    assert sweep.knee[0] <= 63 / 0.95 < sweep.knee[1]
+    assert sweep.knee[1] - sweep.knee[0] <= 1
+
+    ini = (tmp_path / "omnetpp.ini").read_text()
+    written = re.search(r"load=([^}]*)", ini).group(1).split(",")
+    assert [float(load) for load in written] == sweep.get_loads()
+
+
+def test_set_loads_generated(tmp_path):
+    traffic = tmp_path / "TrafficConfigurations"
+    traffic.mkdir()
+    (traffic / "PortPFC.ini").write_text("[Config IB_NDR]\n")
+    simulation = oi.build_simulation(
+        {"network": "RLFT", "arity": 2, "stages": 2, "num_queues": 1},
+        str(tmp_path / "generated"),
+    )
+    (tmp_path / "generated").mkdir()
+    oi.set_new_configuration(simulation)
+
+    # set_new_configuration files take the loads in General.
+    assert runner.get_load_section(simulation) == "General"
+    assert runner.set_loads(simulation, [10, 20.5])
+    assert runner.count_runs(simulation) == 2
+    document = oi.get_document(simulation)
+    assert document.get_value(runner.LOAD_KEY, "General") == (
+        "${load=10,20.5}"
+    )
+
+    stub = tmp_path / "stub.py"
+    stub.write_text(STUB)
+    throughputs = runner.measure_loads(
+        simulation,
+        [30, 70],
+        simulator=[sys.executable, str(stub)],
+        estimate=lambda simulation: 1,
+    )
+    assert throughputs == {30: 30, 70: 63}
+    sweep = runner.adaptive_load_sweep(
+        simulation,
+        tolerance=20,
+        per_round=2,
+        simulator=[sys.executable, str(stub)],
+        estimate=lambda simulation: 1,
+    )
+    assert sweep.knee[0] <= 63 / 0.95 < sweep.knee[1]
+
+    general = oi.get_document(simulation).get_value(runner.LOAD_KEY)
+
+    # add_new_configuration sections take them in the section.
+    simulation.app.set_load(10, 100, 10)
+    config_name = oi.add_new_configuration(simulation)
+    assert runner.get_load_section(simulation) == config_name
+    runner.set_loads(simulation, [40, 50])
+    document = oi.get_document(simulation)
+    assert document.get_value(runner.LOAD_KEY, config_name) == (
+        "${load=40,50}"
+    )
+    assert document.get_value(runner.LOAD_KEY) == general
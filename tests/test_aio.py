@@ -0,0 +1,49 @@
+import asyncio
+import os
+
+import pytest
+
+import opp_ini as oi
+from opp_ini import aio
+
+
+def configure(simulation, num_queues):
+    simulation.set_topo(oi.RLFT())
+    simulation.topology.set_nodes(2, 2)
+
+    simulation.set_sw(oi.IB_NDR())
+    simulation.switch.set_arbiter("WRR")
+    simulation.switch.set_queue_scheme("1q")
+    simulation.switch.set_num_queues(num_queues)
+    return simulation
+
+
+def test_aio(make_simulation):
+    simulations = [configure(make_simulation(), n) for n in range(1, 21)]
+
+    async def main():
+        aio.set_concurrency(4)
+        written = await aio.map_simulations(
+            aio.set_new_configuration, simulations
+        )
+        names = await aio.map_simulations(aio.check_configuration, simulations)
+        rewritten = await aio.set_new_configuration(simulations[0])
+        arbiter = await aio.get_switch_arbiter(simulations[0])
+        return written, names, rewritten, arbiter
+
+    written, names, rewritten, arbiter = asyncio.run(main())
+
+    assert written == [True] * 20
+    assert names == [oi.set_configuration_name(s) for s in simulations]
+    assert not rewritten
+    assert arbiter == '"WRR"'
+    assert all(
+        os.path.exists(os.path.join(s.root_dir, "omnetpp.ini"))
+        for s in simulations
+    )
+
+
+def test_set_concurrency():
+    with pytest.raises(ValueError):
+        aio.set_concurrency(0)
+    assert aio.get_executor()._max_workers >= 1
@@ -0,0 +1,84 @@
+import os
+
+import pytest
+
+import opp_ini as oi
+
+
+def write(path, text):
+    with open(path, "w") as file:
+        file.write(text)
+
+
+def test_backup_store(tmp_path):
+    root_dir = str(tmp_path)
+    opp_file = os.path.join(root_dir, "omnetpp.ini")
+    store = oi.BackupStore(root_dir)
+
+    write(opp_file, "network = RLFT\n")
+    first = store.save(opp_file, "a")
+    assert store.save(opp_file, "a") is first
+    write(opp_file, "network = Torus2D\n")
+    store.save(opp_file, "b")
+    write(opp_file, "network = RLFT\n")
+    store.save(opp_file, "c")
+
+    versions = oi.BackupStore(root_dir).get_versions()
+    assert [v.version for v in versions] == [1, 2, 3]
+    assert [v.label for v in versions] == ["a", "b", "c"]
+    assert versions[0].digest == versions[2].digest
+    assert len(os.listdir(os.path.join(store.backup_dir, "objects"))) == 2
+
+    store.restore(2)
+    with open(opp_file) as file:
+        assert file.read() == "network = Torus2D\n"
+    assert store.read() == b"network = RLFT\n"
+
+    assert store.prune(max_count=2) == 1
+    assert [v.version for v in oi.BackupStore(root_dir).get_versions()] == [
+        2,
+        3,
+    ]
+    assert store.read(3) == b"network = RLFT\n"
+    # Blobs another process already removed are skipped.
+    os.unlink(store._blob_path(store.get_version(2).digest))
+    assert store.prune(max_count=1) == 1
+    assert len(os.listdir(os.path.join(store.backup_dir, "objects"))) == 1
+    assert store.prune(max_age=3600) == 0
+    assert store.prune(max_age=-1) == 1
+    assert store.get_versions() == []
+
+    with pytest.raises(KeyError):
+        store.get_version()
+
+    # Numbers are not handed out again after a full prune.
+    assert store.save(opp_file).version == 4
+    assert oi.BackupStore(root_dir).save(opp_file).version == 4
+
+
+def test_backup_store_concurrent(tmp_path):
+    root_dir = str(tmp_path)
+    stores = [oi.BackupStore(root_dir) for _ in range(2)]
+
+    numbers = []
+    for index in range(6):
+        opp_file = os.path.join(root_dir, f"{index}.ini")
+        write(opp_file, f"network = N{index}\n")
+        numbers.append(stores[index % 2].save(opp_file).version)
+
+    assert numbers == [1, 2, 3, 4, 5, 6]
+    versions = oi.BackupStore(root_dir).get_versions()
+    assert [v.version for v in versions] == numbers
+
+
+def test_backup_configuration(make_simulation):
+    simulation = make_simulation()
+    opp_file = os.path.join(simulation.root_dir, "omnetpp.ini")
+
+    write(opp_file, "[General]\n# Configuration: x\n")
+    assert oi.backup_configuration(simulation).label == "x"
+    write(opp_file, "[General]\n# Configuration: y\n")
+    assert oi.backup_configuration(simulation).version == 2
+
+    oi.restore_configuration(simulation, 1)
+    assert oi.check_configuration(simulation) == "x"
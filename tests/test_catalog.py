@@ -0,0 +1,181 @@
+import os
+import shutil
+
+import pytest
+
+import opp_ini as oi
+from opp_ini import __main__ as cli
+from opp_ini import catalog
+
+
+def write_simulation(simulation, num_queues):
+    simulation.set_topo(oi.RLFT())
+    simulation.topology.set_nodes(2, 2)
+
+    simulation.set_sw(oi.IB_NDR())
+    simulation.switch.set_arbiter("WRR")
+    simulation.switch.set_queue_scheme("1q")
+    simulation.switch.set_num_queues(num_queues)
+    oi.set_new_configuration(simulation)
+    return simulation
+
+
+def make_tree(tmp_path, make_simulation):
+    traffic = tmp_path / "simulations" / "TrafficConfigurations"
+    traffic.mkdir(parents=True)
+    (traffic / "PortPFC.ini").write_text("[Config IB_NDR]\n**.pfc = true\n")
+    for num_queues in (1, 2):
+        write_simulation(
+            make_simulation(name=f"simulations/q{num_queues}"), num_queues
+        )
+    return str(tmp_path), str(tmp_path / "simulations")
+
+
+def test_catalog_build(tmp_path, make_simulation):
+    root, simulations = make_tree(tmp_path, make_simulation)
+    db_path = os.path.join(root, "catalog.sqlite")
+    opp_file = os.path.join(simulations, "q2", "omnetpp.ini")
+
+    with catalog.Catalog(db_path) as opened:
+        stats = opened.build(simulations, workers=2)
+        assert stats == {
+            "scanned": 2,
+            "unchanged": 0,
+            "removed": 0,
+            "errors": 0,
+        }
+        assert len(opened.get_files()) == 2
+
+        record = opened.get_file(opp_file)
+        assert record["config_name"].startswith("RLFT-")
+        assert len(record["config_hash"]) == 64
+        assert opened.get_sections(opp_file)["portConfig"] == "IB_NDR"
+        assert opened.get_params(opp_file)["**.numQueues"] == "2"
+        assert opened.get_params(opp_file, "portConfig")["**.pfc"] == "true"
+
+        assert opened.build(simulations, workers=1)["unchanged"] == 2
+
+        with open(
+            os.path.join(simulations, "TrafficConfigurations", "PortPFC.ini"),
+            "a",
+        ) as file:
+            file.write("**.extra = 1\n")
+        stats = opened.build(simulations, workers=1)
+        assert stats["scanned"] == 2
+        assert opened.get_params(opp_file, "portConfig")["**.extra"] == "1"
+
+        oi.patch_parameter(
+            make_simulation(name="simulations/q2"),
+            "General",
+            "**.numQueues",
+            4,
+        )
+        shutil.rmtree(os.path.join(simulations, "q1"))
+        stats = opened.build(simulations, workers=1)
+        assert stats == {
+            "scanned": 1,
+            "unchanged": 0,
+            "removed": 1,
+            "errors": 0,
+        }
+        assert opened.get_params(opp_file)["**.numQueues"] == "4"
+
+
+def test_catalog_cli(capsys, tmp_path, make_simulation):
+    root, simulations = make_tree(tmp_path, make_simulation)
+
+    assert (
+        cli.main(["catalog", "build", "--root", simulations, "--workers", "1"])
+        == 0
+    )
+    assert "2 scanned" in capsys.readouterr().out
+    assert os.path.exists(os.path.join(simulations, catalog.CATALOG_FILE))
+
+    cli.main(["catalog", "build", "--root", simulations])
+    assert "2 unchanged" in capsys.readouterr().out
+
+
+def test_catalog_query(tmp_path, make_simulation):
+    root, simulations = make_tree(tmp_path, make_simulation)
+    with open(
+        os.path.join(simulations, "TrafficConfigurations", "PortPFC.ini"), "w"
+    ) as file:
+        file.write("[Config IB_NDR]\n[Config bxi3]\n")
+    folder = os.path.join(simulations, "voqsw")
+    simulation = write_simulation(make_simulation(name="simulations/voqsw"), 4)
+    simulation.switch.set_queue_scheme("voqsw")
+    simulation.switch.set_arbiter("RR")
+    simulation.app.set_load(10, 100, 4)
+    oi.add_new_configuration(simulation)
+
+    with catalog.Catalog(os.path.join(root, "catalog.sqlite")) as opened:
+        opened.build(simulations, workers=1)
+
+        assert opened.count() == 4
+        assert opened.count(group_by="arbiter") == {"WRR": 3, "RR": 1}
+        assert opened.count(
+            {"switch.num_queues": (">=", 2)}, group_by=("arbiter", "nodes")
+        ) == {("WRR", 8): 2, ("RR", 8): 1}
+
+        records = opened.query(
+            {"topology.nodes": (">=", 8), "queue_scheme": ["voqsw", "voqnet"]}
+        )
+        assert [r["config"] for r in records] == [
+            oi.set_configuration_name(simulation)
+        ]
+        assert (records[0]["load_min"], records[0]["load_max"]) == (10, 100)
+        assert records[0]["load_step"] == 30
+
+        records = opened.query({"num_queues": 1}, order_by="path")
+        assert [r["folder"] for r in records] == [
+            os.path.realpath(os.path.join(simulations, "q1"))
+        ]
+        assert records[0]["architecture"] == "IB_NDR"
+        assert records[0]["network"] == "RLFT"
+
+        (found,) = opened.query_simulations({"arbiter": "RR"})
+        assert found.get_root_dir() == os.path.realpath(folder)
+        assert oi.set_configuration_name(found) == (
+            oi.set_configuration_name(simulation)
+        )
+        assert found.app.get_steps() == 4
+
+        with pytest.raises(ValueError):
+            opened.query({"nodes; DROP TABLE files": 1})
+
+
+def test_catalog_config_errors(tmp_path, make_simulation):
+    simulations = tmp_path / "simulations"
+    simulation = write_simulation(make_simulation(name="simulations/q1"), 1)
+    other = simulations / "other"
+    os.makedirs(other)
+    (other / "omnetpp.ini").write_text(
+        "[General]\n**.x = 1\n[Config a]\n**.y = 2\n"
+        "[Config b]\nextends = missing\n"
+    )
+
+    with catalog.Catalog(str(tmp_path / "catalog.sqlite")) as opened:
+        assert opened.build(str(simulations), workers=1)["errors"] == 2
+
+        # set_new_configuration extends IB_NDR, defined by the traffic tree.
+        opp_file = os.path.join(simulation.get_root_dir(), "omnetpp.ini")
+        assert opened.get_file(opp_file)["error"] is None
+        assert opened.get_params(opp_file)["**.numQueues"] == "1"
+        records = opened.query(
+            {"folder": os.path.realpath(simulation.root_dir)}
+        )
+        assert [(r["config"], r["error"]) for r in records] == [
+            ("portConfig", "ValueError: Configuration IB_NDR not found")
+        ]
+
+        records = opened.query(
+            {"folder": os.path.realpath(other)}, order_by="config"
+        )
+        assert [(r["config"], r["error"]) for r in records] == [
+            ("a", None),
+            ("b", "ValueError: Configuration missing not found"),
+        ]
+        assert opened.get_params(str(other / "omnetpp.ini"), "a") == {
+            "**.x": "1",
+            "**.y": "2",
+        }
@@ -0,0 +1,142 @@
+import pytest
+
+import opp_ini as oi
+
+
+def make_file(tmp_path, text):
+    opp_file = tmp_path / "omnetpp.ini"
+    opp_file.write_text(text)
+    return str(opp_file)
+
+
+def read(opp_file):
+    with open(opp_file) as file:
+        return file.read()
+
+
+def test_config_store(tmp_path):
+    opp_file = make_file(
+        tmp_path,
+        "[General]\nnetwork = RLFT\n\n[Config a]\nx = 1\n\n[Config b]\ny = 2\n",
+    )
+    store = oi.ConfigStore(opp_file)
+
+    assert store.get_names() == ["a", "b"]
+    assert store.get("a") == b"[Config a]\nx = 1\n\n"
+
+    store.replace("a", b"[Config a]\nx = 10\nz = 3\n\n")
+    store.insert("c", b"[Config c]\nw = 4\n")
+    store.delete("b")
+
+    assert read(opp_file) == (
+        "[General]\nnetwork = RLFT\n\n[Config a]\nx = 10\nz = 3\n\n"
+        "[Config c]\nw = 4\n"
+    )
+    assert store.get("c") == b"[Config c]\nw = 4\n"
+    assert oi.load_document(opp_file).get_value("z", "a") == "3"
+    assert oi.ConfigStore(opp_file).get_names() == ["a", "c"]
+
+
+def test_config_store_errors(tmp_path):
+    opp_file = make_file(tmp_path, "[Config a]\nx = 1")
+    store = oi.ConfigStore(opp_file)
+
+    with pytest.raises(ValueError):
+        store.insert("a", b"[Config a]\n")
+    with pytest.raises(KeyError):
+        store.delete("b")
+
+    store.insert("b", b"[Config b]\n")
+    assert read(opp_file) == "[Config a]\nx = 1\n[Config b]\n"
+
+
+def test_config_store_external_change(tmp_path):
+    opp_file = make_file(tmp_path, "[Config a]\nx = 1\n")
+    store = oi.ConfigStore(opp_file)
+
+    with open(opp_file, "a") as file:
+        file.write("[Config b]\nlonger = 2\n")
+    store.replace("a", b"[Config a]\n")
+
+    assert read(opp_file) == "[Config a]\n[Config b]\nlonger = 2\n"
+
+
+def test_add_new_configuration(make_simulation):
+    simulation = make_simulation()
+    topology = oi.RLFT()
+    topology.set_nodes(2, 2)
+    switch = oi.IB_NDR()
+    switch.set_arbiter("WRR")
+    switch.set_queue_scheme("1q")
+    switch.set_num_queues(1)
+    application = oi.Application()
+    application.set_load(10, 100, 10)
+
+    first = oi.add_new_configuration(simulation, topology, switch, application)
+    switch.set_num_queues(2)
+    second = oi.add_new_configuration(simulation)
+    switch.set_num_queues(1)
+    oi.add_new_configuration(simulation)
+
+    document = oi.get_document(simulation)
+    assert document.get_configs() == ["portConfig", first, second]
+    assert document.get_value("**.numQueues", second) == "2"
+    assert document.get_value("**.app[*].load", first) == (
+        "${load=10..100 step 10}"
+    )
+    assert document.get_value("extends", first) == "IB_NDR, portConfig"
+
+    oi.delete_configuration(simulation, second)
+    assert oi.get_document(simulation).get_configs() == ["portConfig", first]
+
+
+def test_add_new_configuration_architectures(tmp_path):
+    simulation = oi.Simulation()
+    simulation.root_dir = str(tmp_path)
+    topology = oi.RLFT()
+    topology.set_nodes(2, 2)
+    application = oi.Application()
+    application.set_load(10, 100, 4)
+    names = []
+    for switch in (oi.IB_NDR(), oi.BXI3()):
+        switch.set_arbiter("WRR")
+        switch.set_queue_scheme("1q")
+        switch.set_num_queues(1)
+        names.append(
+            oi.add_new_configuration(simulation, topology, switch, application)
+        )
+    with open(tmp_path / "omnetpp.ini", "a") as file:
+        file.write(
+            "[Config IB_NDR]\n**.iq = true\n"
+            "[Config BXI3]\n**.iq = false\n"
+            "[Config bxi3]\n**.iq = false\n"
+        )
+
+    ib_ndr, bxi3 = names
+    assert oi.get_effective_parameters(simulation, ib_ndr)["**.iq"] == "true"
+    assert oi.get_effective_parameters(simulation, bxi3)["**.iq"] == "false"
+    assert oi.get_document(simulation).get_value("**.app[*].load", bxi3) == (
+        "${load=10..100 step 30}"
+    )
+
+
+def test_render_load():
+    application = oi.Application()
+    application.set_load(10, 20, 0)
+    assert oi.render_load(application) == "10"
+    application.set_load(10, 20, 1)
+    assert oi.render_load(application) == "10"
+    application.set_load(0, 100, 11)
+    assert oi.render_load(application) == "0..100 step 10"
+    application.set_load(0, 1, 3)
+    assert oi.render_load(application) == "0..1 step 0.5"
+
+
+def test_get_section_extends():
+    document = oi.OppIniDocument.parse(
+        "[Config portConfig]\nextends = voqsw\n[Config voqsw]\nextends = bxi3\n"
+    )
+
+    assert oi.get_section_extends(document, "bxi3") == "portConfig"
+    assert oi.get_section_extends(document, "IB_NDR") == "IB_NDR, portConfig"
+    assert oi.get_section_extends(None, "IB_NDR") == "IB_NDR, portConfig"
@@ -0,0 +1,63 @@
+import opp_ini as oi
+
+OMNETPP_INI = """[General]
+network = Net
+**.SW[0..63].arbiter.typename = "Low"
+**.SW[*].arbiter.typename = "Arbiter_TwoPhased"
+**.H[*].**.scalar-recording = false
+**.sys.app*-**.result-recording-modes = default
+**.app{2..4}.load = 0.5
+**.load = 0.1
+
+[Config portConfig]
+**.SW[100].arbiter.typename = "WRR"
+"""
+
+
+def test_effective_value_first_match():
+    document = oi.OppIniDocument.parse(OMNETPP_INI)
+
+    assert document.effective_value(
+        "portConfig", "Net.SW[17].arbiter.typename"
+    ) == ('"Low"')
+    assert document.effective_value(
+        "portConfig", "Net.SW[64].arbiter.typename"
+    ) == ('"Arbiter_TwoPhased"')
+    assert document.effective_value(
+        "portConfig", "Net.SW[100].arbiter.typename"
+    ) == ('"WRR"')
+    assert (
+        document.effective_value("General", "Net.H[3].nic.q.scalar-recording")
+        == "false"
+    )
+    assert (
+        document.effective_value(
+            "General", "Net.sys.app1-x.y.result-recording-modes"
+        )
+        == "default"
+    )
+    assert document.effective_value("General", "Net.app3.load") == "0.5"
+    assert document.effective_value("General", "Net.app34.load") == "0.1"
+    assert document.effective_value("General", "Net.SW.arbiter") is None
+
+
+def test_effective_values_bulk():
+    document = oi.OppIniDocument.parse(
+        '[General]\n**.SW[*].arbiter.typename = "WRR"\n'
+    )
+    paths = [f"Net.SW[{idx}].arbiter.typename" for idx in range(65536)]
+
+    values = document.effective_values("General", paths)
+
+    assert values == ['"WRR"'] * 65536
+
+
+def test_effective_value_simulation(make_simulation):
+    simulation = make_simulation(OMNETPP_INI)
+
+    assert (
+        oi.effective_value(
+            simulation, "portConfig", "Net.SW[5].arbiter.typename"
+        )
+        == '"Low"'
+    )
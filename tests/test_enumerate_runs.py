@@ -0,0 +1,78 @@
+import pytest
+
+import opp_ini as oi
+
+OMNETPP_INI = """[General]
+network = RLFT
+**.arity = ${arity=2,4}
+**.numStages = ${numStages=2..4}
+**.numNodes = ${numNodes = int(2*pow(${arity},${numStages}))}
+**.scheme = ${scheme="voqnet","voqsw","oneq" ! numStages}
+**.load = ${0.1..0.5 step 0.2}
+
+[Config constrained]
+constraint = $numStages < 4 && ${arity} == 4
+repeat = 2
+"""
+
+
+def test_run_space():
+    document = oi.OppIniDocument.parse(OMNETPP_INI)
+    runs = document.get_effective("General").get_runs()
+
+    assert [var.name for var in runs.variables] == [
+        "arity",
+        "numStages",
+        "numNodes",
+        "scheme",
+        "$4",
+    ]
+    assert len(runs) == 2 * 3 * 3
+    assert runs[0]["numNodes"] == "int(2*pow(2,2))"
+    assert runs[0]["scheme"] == '"voqnet"'
+    assert runs[0]["$4"] == "0.1"
+    assert runs[5]["$4"] == "0.5"
+    assert runs[17]["arity"] == "4"
+    assert runs[17]["numStages"] == "4"
+    assert runs[17]["scheme"] == '"oneq"'
+    assert list(runs)[7] == runs[7]
+
+    with pytest.raises(IndexError):
+        runs.get_run(18)
+
+
+def test_run_space_constraint_and_repeat():
+    document = oi.OppIniDocument.parse(OMNETPP_INI)
+    runs = document.get_effective("constrained").get_runs()
+
+    assert runs.count_combinations() == 36
+    assert len(runs) == 2 * 3 * 2
+    assert all(run["arity"] == "4" for run in runs)
+    assert runs[1]["repetition"] == "1"
+    assert runs[11]["runnumber"] == 11
+
+
+def test_large_run_space_is_lazy():
+    document = oi.OppIniDocument.parse(
+        "**.a = ${a=1..1000}\n**.b = ${b=1..1000}\n"
+    )
+    runs = document.get_effective("General").get_runs()
+
+    assert len(runs) == 1000000
+    assert runs[999999]["a"] == "1000"
+    assert runs[123456]["b"] == "457"
+
+
+def test_ned_expression():
+    assert oi.evaluate_ned_expression("int(2*pow(2,3))", {}) == 16
+    assert oi.evaluate_ned_expression("$x > 1 ? 1 : 2", {"x": 3}) == 1
+    assert oi.evaluate_ned_expression("-2^2", {}) == -4
+
+    with pytest.raises(ValueError):
+        oi.parse_ned_expression("__import__('os')")
+
+
+def test_count_runs(make_simulation):
+    simulation = make_simulation(OMNETPP_INI)
+
+    assert oi.count_runs(simulation, "constrained") == 12
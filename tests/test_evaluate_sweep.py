@@ -0,0 +1,59 @@
+import pytest
+
+import opp_ini as oi
+
+np = pytest.importorskip("numpy")
+
+OMNETPP_INI = """[General]
+**.arity = ${arity=2,4,8}
+**.numStages = ${numStages=1..3}
+**.numNodes = ${numNodes = int(2*pow(${arity},${numStages}))}
+**.nD0 = ${nD0=2,3,5 ! numStages}
+**.nD1 = ${nD1=1..3 ! numStages}
+**.product = ${${nD0}*${nD1}}
+**.scheme = ${scheme="voqnet","voqsw"}
+
+[Config constrained]
+constraint = $numNodes <= 128 && $scheme == "voqsw"
+"""
+
+
+def test_compile_ned_expression():
+    expression = oi.compile_ned_expression("int(2*pow(${arity},${numStages}))")
+
+    assert expression.variables == {"arity", "numStages"}
+    assert expression.evaluate(
+        {"arity": np.array([2, 4]), "numStages": np.array([3, 2])}
+    ).tolist() == [16, 32]
+
+
+def test_evaluate_sweep():
+    document = oi.OppIniDocument.parse(OMNETPP_INI)
+    runs = document.get_effective("General").get_runs()
+
+    sweep = runs.evaluate()
+
+    assert len(sweep["runnumber"]) == len(runs) == 3 * 3 * 2
+    for run_number in (0, 7, 17):
+        run = runs[run_number]
+        assert sweep["arity"][run_number] == int(run["arity"])
+        assert sweep["numNodes"][run_number] == oi.evaluate_ned_expression(
+            run["numNodes"], {}
+        )
+        assert sweep["$5"][run_number] == oi.evaluate_ned_expression(
+            run["$5"], {}
+        )
+        assert sweep["scheme"][run_number] == run["scheme"].strip('"')
+
+
+def test_evaluate_sweep_constraint(make_simulation):
+    simulation = make_simulation(OMNETPP_INI)
+
+    sweep = oi.evaluate_sweep(simulation, "constrained")
+    runs = oi.enumerate_runs(simulation, "constrained")
+
+    assert len(sweep["runnumber"]) == len(runs)
+    assert (sweep["numNodes"] <= 128).all()
+    assert sorted(sweep["numNodes"].tolist()) == sorted(
+        oi.evaluate_ned_expression(run["numNodes"], {}) for run in runs
+    )
@@ -0,0 +1,46 @@
+import os
+
+import opp_ini as oi
+
+SPEC = {
+    "network": "RLFT",
+    "arity": [2, 4],
+    "stages": 2,
+    "architecture": ["IB_NDR", "BXI3"],
+    "arbiter": "WRR",
+    "queue_scheme": ["voqnet", "voqsw"],
+    "num_queues": 4,
+    "load": [(0, 100, 10), (0, 50, 5)],
+}
+
+
+def test_generate_sweep(tmp_path):
+    out_root = str(tmp_path)
+
+    results = oi.generate_sweep(SPEC, out_root, workers=2)
+
+    assert len(results) == 16
+    assert [result.index for result in results] == list(range(16))
+    assert len({result.path for result in results}) == 16
+    for result in results:
+        assert os.path.exists(result.path)
+        assert result.seconds >= 0
+
+    simulation = oi.Simulation()
+    simulation.root_dir = os.path.dirname(results[-1].path)
+    assert oi.check_configuration(simulation) == (
+        oi.set_configuration_name(oi.build_simulation(results[-1].point))
+    )
+    assert oi.get_document(simulation).get_configs() == [
+        results[-1].config_name
+    ]
+    assert oi.get_switch_arbiter(simulation) == '"WRR"'
+
+
+def test_generate_sweep_is_deterministic(tmp_path):
+    first = oi.generate_sweep(SPEC, str(tmp_path / "first"), workers=1)
+    second = oi.generate_sweep(SPEC, str(tmp_path / "second"), workers=2)
+
+    assert [os.path.basename(os.path.dirname(r.path)) for r in first] == [
+        os.path.basename(os.path.dirname(r.path)) for r in second
+    ]
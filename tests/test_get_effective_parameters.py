@@ -0,0 +1,59 @@
+import pytest
+
+import opp_ini as oi
+
+OMNETPP_INI = """[General]
+network = RLFT
+**.numQueues = 1
+**.routingAlgorithm = "destro"
+
+[Config IB-NDR]
+**.numQueues = 2
+**.requestProcessingTime = 6ns
+
+[Config bxi3]
+**.numQueues = 3
+
+[Config voqsw]
+extends = IB-NDR
+**.routingAlgorithm = "updown"
+
+[Config portConfig]
+extends = voqsw, bxi3
+"""
+
+
+def test_linearization():
+    document = oi.OppIniDocument.parse(OMNETPP_INI)
+
+    assert document.get_linearization("portConfig") == [
+        "portConfig",
+        "voqsw",
+        "IB-NDR",
+        "bxi3",
+        "General",
+    ]
+    assert document.get_linearization("General") == ["General"]
+
+
+def test_effective_parameters(make_simulation):
+    simulation = make_simulation(OMNETPP_INI)
+
+    params = oi.get_effective_parameters(simulation, "portConfig")
+
+    assert params["**.numQueues"] == "2"
+    assert params["**.routingAlgorithm"] == '"updown"'
+    assert params["network"] == "RLFT"
+    assert "extends" not in params
+
+    document = oi.get_merged_document(simulation)
+    assert document.get_effective("portConfig") is document.get_effective(
+        "portConfig"
+    )
+
+
+def test_unknown_base():
+    document = oi.OppIniDocument.parse("[Config a]\nextends = b\n")
+
+    with pytest.raises(ValueError):
+        document.get_effective("a")
@@ -0,0 +1,88 @@
+import os
+
+import pytest
+
+import opp_ini as oi
+
+
+def write_file(path, contents):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as file:
+        file.write(contents)
+
+
+def make_tree(root):
+    write_file(
+        os.path.join(root, "RLFT", "omnetpp.ini"),
+        "[General]\n"
+        "network = RLFT\n"
+        "include ../TrafficConfigurations/PortPFC.ini\n"
+        "\n"
+        "[Config portConfig]\n"
+        "extends=bxi3\n"
+        "include ../TrafficConfigurations/indirect/schemes.ini\n",
+    )
+    write_file(
+        os.path.join(root, "TrafficConfigurations", "PortPFC.ini"),
+        '**.SW[*].arbiter.typename = "Arbiter_TwoPhased"\n'
+        "\n"
+        "[Config bxi3]\n"
+        "**.requestProcessingTime = 6ns\n",
+    )
+    write_file(
+        os.path.join(root, "TrafficConfigurations", "indirect", "schemes.ini"),
+        '**.congestionControlTechnique = "voqsw"\n',
+    )
+    return root
+
+
+def test_merged_document(tmp_path):
+    root = make_tree(str(tmp_path))
+    graph = oi.IncludeGraph(oi.ParseCache())
+    view = graph.load(os.path.join(root, "RLFT", "omnetpp.ini"))
+
+    assert view.get_value("**.SW[*].arbiter.typename", "General") == (
+        '"Arbiter_TwoPhased"'
+    )
+    assert view.get_value("**.requestProcessingTime", "bxi3") == "6ns"
+    assert view.get_value("**.congestionControlTechnique", "portConfig") == (
+        '"voqsw"'
+    )
+    assert len(view.files) == 3
+    assert graph.load(os.path.join(root, "RLFT", "omnetpp.ini")) is view
+
+
+def test_shared_includes_are_parsed_once(tmp_path):
+    root = make_tree(str(tmp_path))
+    write_file(
+        os.path.join(root, "Torus2D", "omnetpp.ini"),
+        "include ../TrafficConfigurations/PortPFC.ini\n",
+    )
+    cache = oi.ParseCache()
+    graph = oi.IncludeGraph(cache)
+
+    graph.load(os.path.join(root, "RLFT", "omnetpp.ini"))
+    graph.load(os.path.join(root, "Torus2D", "omnetpp.ini"))
+
+    assert cache.get_stats()["misses"] == 4
+
+
+def test_include_cycle(tmp_path):
+    root = str(tmp_path)
+    write_file(os.path.join(root, "a.ini"), "include b.ini\n")
+    write_file(os.path.join(root, "b.ini"), "include a.ini\n")
+
+    with pytest.raises(ValueError):
+        oi.IncludeGraph(oi.ParseCache()).load(os.path.join(root, "a.ini"))
+
+
+def test_missing_include(tmp_path):
+    root = str(tmp_path)
+    write_file(os.path.join(root, "a.ini"), "include missing.ini\nx = 1\n")
+
+    view = oi.IncludeGraph(oi.ParseCache()).load(os.path.join(root, "a.ini"))
+
+    assert view.get_value("x") == "1"
+    assert view.missing == [
+        os.path.join(os.path.realpath(root), "missing.ini")
+    ]
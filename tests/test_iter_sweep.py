@@ -0,0 +1,89 @@
+import itertools
+
+import pytest
+
+import opp_ini as oi
+
+SPEC = {
+    "network": "RLFT",
+    "arity": [2, 4, 8],
+    "stages": [2, 3],
+    "architecture": "IB_NDR",
+    "queue_scheme": ["1q", "voqsw", "dbbm"],
+    "num_queues": [1, 4],
+    "load": (10, 100, 10),
+}
+
+
+def test_iter_sweep():
+    records = list(oi.iter_sweep(SPEC))
+    points = list(oi.iter_sweep_points(SPEC))
+
+    assert [record.index for record in records] == list(range(36))
+    assert [record.point for record in records] == points
+    for record in records:
+        assert record.spec == oi.build_simulation(record.point).freeze()
+        assert oi.set_configuration_name(
+            record.spec
+        ) == oi.set_configuration_name(oi.build_simulation(record.point))
+
+    torus = oi.build_spec({"network": "Torus2D", "dim1": 4, "dim2": 8})
+    assert (
+        torus
+        == oi.build_simulation(
+            {"network": "Torus2D", "dim1": 4, "dim2": 8}
+        ).freeze()
+    )
+
+
+def test_iter_sweep_constraints():
+    calls = []
+
+    def counted(point):
+        calls.append(point)
+        return True
+
+    records = list(
+        oi.iter_sweep(SPEC, [oi.valid_num_queues, oi.max_nodes(128), counted])
+    )
+
+    for record in records:
+        assert (record.point["queue_scheme"] == "1q") == (
+            record.point["num_queues"] == 1
+        )
+        assert record.spec.topology.nodes <= 128
+    # 2^2, 2^3, 4^2, 4^3 and 8^2 networks, 3 valid scheme/queue pairs each.
+    assert len(records) == len(calls) == 15
+
+    assert oi.valid_num_queues({"queue_scheme": "oneq", "num_queues": 1})
+    assert not oi.valid_num_queues({"queue_scheme": "WRR"})
+    assert not oi.max_nodes(31)({"network": "Torus2D", "dim1": 4, "dim2": 8})
+
+
+def test_iter_sweep_resume():
+    constraints = [oi.valid_num_queues]
+    full = list(oi.iter_sweep(SPEC, constraints))
+
+    head = list(itertools.islice(oi.iter_sweep(SPEC, constraints), 5))
+    tail = list(oi.iter_sweep(SPEC, constraints, start=head[-1].index + 1))
+    assert head + tail == full
+
+    assert list(oi.iter_sweep(SPEC, start=36)) == []
+    assert list(oi.iter_sweep(SPEC, start=17))[0].index == 17
+
+    with pytest.raises(ValueError):
+        next(oi.iter_sweep({"color": ["red"]}))
+
+
+def test_generate_sweep_constraints(tmp_path):
+    spec = dict(SPEC, arity=2, stages=2)
+    results = oi.generate_sweep(
+        spec, str(tmp_path), workers=1, constraints=[oi.valid_num_queues]
+    )
+
+    assert len(results) == 3
+    assert all(oi.valid_num_queues(result.point) for result in results)
+    records = oi.iter_sweep(spec, [oi.valid_num_queues])
+    assert [result.index for result in results] == [
+        record.index for record in records
+    ]
@@ -0,0 +1,49 @@
+import opp_ini as oi
+
+OMNETPP_INI = """[General]
+# Configuration: RLFT-16N_IBNDR-WRR-1q-1Q_
+network = RLFT
+
+**.topology = "rlft"   # inline comment
+**.routingAlgorithm = "destro"
+**.H[*].arbiter.typename = "Arbiter_TwoPhased"
+#**.SW[*].arbiter.typename = "Commented"
+**.SW[*].arbiter.typename = "WRR"
+**.requestProcessingTime = 6ns
+include ../TrafficConfigurations/PortPFC.ini
+
+[Config portConfig] #Note that the config included extends from General
+#extends=IB-NDR  # IQ
+extends=bxi3	# CIOQ
+include ../TrafficConfigurations/indirect/schemes.ini
+"""
+
+
+def test_document_index():
+    document = oi.OppIniDocument.parse(OMNETPP_INI)
+
+    assert list(document.sections) == ["General", "portConfig"]
+    assert document.get_configs() == ["portConfig"]
+    assert document.get_value("**.topology") == '"rlft"'
+    assert document.get_entry("**.topology").comment == "inline comment"
+    assert document.get_value("extends", "portConfig") == "bxi3"
+    assert [inc.target for inc in document.includes] == [
+        "../TrafficConfigurations/PortPFC.ini",
+        "../TrafficConfigurations/indirect/schemes.ini",
+    ]
+    assert document.offsets[-1] == len(OMNETPP_INI.encode())
+    assert document.get_comment_field("Configuration") == (
+        "RLFT-16N_IBNDR-WRR-1q-1Q_"
+    )
+
+
+def test_getters(make_simulation):
+    simulation = make_simulation(OMNETPP_INI)
+
+    assert oi.check_configuration(simulation) == "RLFT-16N_IBNDR-WRR-1q-1Q_"
+    assert oi.get_configuration(simulation) == "portConfig"
+    assert oi.get_configurations(simulation) == ["portConfig"]
+    assert oi.get_switch_architecture(simulation) == "bxi3"
+    assert oi.get_switch_routing(simulation) == '"destro"'
+    assert oi.get_switch_arbiter(simulation) == '"WRR"'
+    assert oi.get_switch_request_processing_time(simulation) == "6ns"
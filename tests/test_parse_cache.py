@@ -0,0 +1,47 @@
+import os
+
+import opp_ini as oi
+
+
+def write_file(path, contents):
+    with open(path, "w") as file:
+        file.write(contents)
+
+
+def test_parse_cache_hits_and_misses(tmp_path):
+    cache = oi.ParseCache()
+    opp_file = str(tmp_path / "omnetpp.ini")
+    write_file(opp_file, "[General]\nnetwork = RLFT\n")
+
+    first = cache.load(opp_file)
+    second = cache.load(opp_file)
+
+    assert first is second
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["misses"] == 1
+
+    write_file(opp_file, "[General]\nnetwork = Torus2D\n")
+    os.utime(opp_file, ns=(0, 0))
+
+    assert cache.load(opp_file).get_value("network") == "Torus2D"
+    assert cache.get_stats()["misses"] == 2
+    assert cache.get_stats()["entries"] == 1
+
+
+def test_parse_cache_lru_eviction(tmp_path):
+    cache = oi.ParseCache(max_entries=2)
+    paths = []
+    for idx in range(3):
+        paths.append(str(tmp_path / f"{idx}.ini"))
+        write_file(paths[-1], f"**.numQueues = {idx}\n")
+
+    cache.load(paths[0])
+    cache.load(paths[1])
+    cache.load(paths[0])
+    cache.load(paths[2])
+
+    assert cache.get_signature(paths[0]) is not None
+    assert cache.get_signature(paths[1]) is None
+
+    cache.configure(max_bytes=0)
+    assert cache.get_stats()["entries"] == 0
@@ -0,0 +1,77 @@
+import os
+
+import pytest
+
+import opp_ini as oi
+
+
+def read(simulation):
+    with open(os.path.join(simulation.root_dir, "omnetpp.ini")) as file:
+        return file.read()
+
+
+def test_patch_parameter(make_simulation):
+    simulation = make_simulation(
+        "[General]\n"
+        "# Configuration: a\n"
+        "**.requestProcessingTime =  6ns   # per request\n"
+        "**.logInterval = 10us\n"
+        "\n"
+        "[Config portConfig]\n"
+        "extends=bxi3\t# CIOQ\n"
+        "include ../schemes.ini\n"
+    )
+
+    assert oi.patch_parameter(
+        simulation, "General", "**.requestProcessingTime", "8ns"
+    )
+    assert not oi.patch_parameter(
+        simulation, "General", "**.logInterval", "10us"
+    )
+    assert read(simulation) == (
+        "[General]\n"
+        "# Configuration: a\n"
+        "**.requestProcessingTime =  8ns   # per request\n"
+        "**.logInterval = 10us\n"
+        "\n"
+        "[Config portConfig]\n"
+        "extends=bxi3\t# CIOQ\n"
+        "include ../schemes.ini\n"
+    )
+    assert oi.get_switch_request_processing_time(simulation) == "8ns"
+
+
+def test_patch_many(make_simulation):
+    simulation = make_simulation(
+        "network = RLFT\n"
+        "**.a = 1 \\\n"
+        "  + 2\n"
+        "[Config x]\n"
+        "[Config y]\n"
+        "**.b = 1"
+    )
+
+    assert oi.patch_many(
+        simulation,
+        [
+            ("General", "**.a", 5),
+            ("General", "**.c", "3"),
+            ("x", "**.d", "4"),
+            ("y", "**.b", "2"),
+            ("y", "**.e", "6"),
+        ],
+    )
+    assert read(simulation) == (
+        "network = RLFT\n"
+        "**.a = 5\n"
+        "**.c = 3\n"
+        "[Config x]\n"
+        "**.d = 4\n"
+        "[Config y]\n"
+        "**.b = 2\n"
+        "**.e = 6\n"
+    )
+    assert os.listdir(simulation.root_dir) == ["omnetpp.ini"]
+
+    with pytest.raises(KeyError):
+        oi.patch_parameter(simulation, "z", "**.a", 1)
@@ -0,0 +1,97 @@
+import os
+import sys
+
+import opp_ini as oi
+from opp_ini import __main__, runner
+
+STUB = """\
+import os, sys
+runs = sys.argv[sys.argv.index("-r") + 1].split("..")
+failing = open("fail").read().split() if os.path.exists("fail") else []
+for run in range(int(runs[0]), int(runs[-1]) + 1):
+    print(f"Preparing for running configuration X, run #{run}...")
+    if str(run) in failing:
+        sys.exit(1)
+"""
+
+
+def make_tree(root):
+    traffic = root / "TrafficConfigurations"
+    traffic.mkdir()
+    (traffic / "uniform.ini").write_text(
+        "[Config uniform]\nextends=portConfig\n**.pattern = 1\n"
+    )
+    (traffic / "hotspot.ini").write_text(
+        "[Config hotspot]\nextends=portConfig\n**.pattern = 2\n"
+    )
+    folder = root / "rlft"
+    folder.mkdir()
+    (folder / "omnetpp.ini").write_text(
+        "[General]\n"
+        "**.load = ${load=10..30 step 10}\n"
+        "[Config portConfig]\n"
+        "include ../TrafficConfigurations/uniform.ini\n"
+        "include ../TrafficConfigurations/hotspot.ini\n"
+    )
+    return folder
+
+
+def run(folder, stub, config):
+    simulation = oi.Simulation()
+    simulation.root_dir = str(folder)
+    return runner.run_batches(
+        [simulation],
+        max_procs=1,
+        simulator=[sys.executable, str(stub)],
+        estimate=lambda simulation: 1,
+        config=config,
+        max_batch=1,
+    )
+
+
+def test_plan_reruns(tmp_path, capsys):
+    stub = tmp_path / "stub.py"
+    stub.write_text(STUB)
+    root = tmp_path / "simulations"
+    root.mkdir()
+    folder = make_tree(root)
+    (folder / "fail").write_text("1")
+
+    run(folder, stub, "uniform")
+    (folder / "fail").unlink()
+    run(folder, stub, "hotspot")
+
+    plans = runner.plan_reruns(str(root))
+    assert [(p.config_name, p.runs, p.reason) for p in plans] == [
+        ("uniform", [1], "missing")
+    ]
+
+    # Only the configuration that looks the edited file up goes stale.
+    hotspot = root / "TrafficConfigurations" / "hotspot.ini"
+    hotspot.write_text("[Config hotspot]\nextends=portConfig\n**.x = 3\n")
+    plans = runner.plan_reruns(str(root))
+    assert [(p.config_name, p.runs, p.reason) for p in plans] == [
+        ("hotspot", [0, 1, 2], "changed"),
+        ("uniform", [1], "missing"),
+    ]
+    assert plans[0].files == [str(hotspot.resolve())]
+    assert plans[0].get_run_filter() == "0..2"
+    assert runner.plan_reruns(str(root), "uniform")[0].runs == [1]
+
+    # Editing the omnetpp.ini file makes every run stale.
+    with open(folder / "omnetpp.ini", "a") as file:
+        file.write("**.y = 1\n")
+    plans = runner.plan_reruns(str(root))
+    assert [(p.config_name, p.runs, p.reason) for p in plans] == [
+        ("hotspot", [0, 1, 2], "changed"),
+        ("uniform", [0, 2], "changed"),
+        ("uniform", [1], "missing"),
+    ]
+
+    assert __main__.main(["reruns", "plan", "--root", str(root)]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == (
+        f"rlft hotspot -r 0..2 (changed: "
+        f"TrafficConfigurations{os.sep}hotspot.ini, rlft{os.sep}omnetpp.ini)"
+    )
+    assert lines[-1] == "6 runs to run again in 1 folders (dry run)"
@@ -0,0 +1,49 @@
+import opp_ini as oi
+
+
+def configure(simulation):
+    simulation.set_topo(oi.RLFT())
+    simulation.topology.set_nodes(2, 2)
+
+    simulation.set_sw(oi.IB_NDR())
+    simulation.switch.set_arbiter("WRR")
+    simulation.switch.set_queue_scheme("1q")
+    simulation.switch.set_num_queues(1)
+    return simulation
+
+
+def test_config_template():
+    template = oi.ConfigTemplate("a = @a@\nb = ${b=@b@}\n")
+
+    assert template.fields == ("a", "b")
+    assert b"".join(template.render({"a": 1, "b": "x"})) == (
+        b"a = 1\nb = ${b=x}\n"
+    )
+    assert b"".join(template.render({"a": 1, "b": "x"})) == (
+        b"a = 1\nb = ${b=x}\n"
+    )
+    assert b"".join(oi.ConfigTemplate("static\n").render({})) == b"static\n"
+
+
+def test_set_new_configuration(make_simulation):
+    simulation = configure(make_simulation())
+
+    oi.set_new_configuration(simulation)
+
+    document = oi.get_document(simulation)
+    assert oi.check_configuration(simulation) == (
+        oi.set_configuration_name(simulation)
+    )
+    assert document.get_value("**.arity") == "${arity=2}"
+    assert document.get_value("**.SW[*].arbiter.typename") == '"WRR"'
+    assert document.get_value("extends", "portConfig") == "IB_NDR"
+
+
+def test_write_chunks(tmp_path):
+    opp_file = str(tmp_path / "omnetpp.ini")
+
+    oi.write_chunks(opp_file, [b"[General]\n", b"network = RLFT\n"])
+    oi.write_chunks(opp_file, [b"[General]\n"])
+
+    with open(opp_file, "rb") as file:
+        assert file.read() == b"[General]\n"
@@ -0,0 +1,243 @@
+import os
+import sys
+
+import opp_ini as oi
+from opp_ini import results, runner
+
+INI = """\
+[General]
+# Configuration: Sweep
+include params.ini
+
+[Config Sweep]
+**.load = ${load=10..40 step 10}
+"""
+
+STUB = """\
+import os, sys
+runs = sys.argv[sys.argv.index("-r") + 1].split("..")
+config = sys.argv[sys.argv.index("-c") + 1]
+os.makedirs("results", exist_ok=True)
+for run in range(int(runs[0]), int(runs[-1]) + 1):
+    header = (
+        f"version 3\\nrun {config}-{run}\\nattr configname {config}\\n"
+        f"attr runnumber {run}\\n\\n"
+    )
+    name = f"results/{config}-#{run}"
+    with open(name + ".sca", "w") as file:
+        file.write(header + "scalar Net throughput 1\\n")
+    with open(name + ".vec", "w") as file:
+        file.write(header + "vector 0 Net delay\\n0\\t1\\t0.5\\n")
+    with open(name + ".vci", "w") as file:
+        file.write(f"version 3\\nfile {os.path.getsize(name + '.vec')} 0\\n")
+    with open("ran.txt", "a") as file:
+        file.write(f"{run}\\n")
+"""
+
+
+def make_folder(tmp_path, name, params="**.x = 1\n"):
+    folder = tmp_path / name
+    folder.mkdir()
+    (folder / "omnetpp.ini").write_text(INI)
+    (folder / "params.ini").write_text(params)
+    simulation = oi.Simulation()
+    simulation.root_dir = str(folder)
+    return simulation
+
+
+def get_ran(simulation):
+    try:
+        with open(os.path.join(simulation.root_dir, "ran.txt")) as file:
+            return [int(run) for run in file.read().split()]
+    except FileNotFoundError:
+        return []
+
+
+def run(simulations, manifest, stub, **kwargs):
+    return runner.run_batches(
+        simulations,
+        max_procs=1,
+        simulator=[sys.executable, str(stub)],
+        estimate=lambda simulation: 1,
+        config="Sweep",
+        manifest=manifest,
+        **kwargs,
+    )
+
+
+def test_results_manifest(tmp_path):
+    stub = tmp_path / "stub.py"
+    stub.write_text(STUB)
+    manifest = results.ResultsManifest(str(tmp_path / results.MANIFEST_FILE))
+
+    first = make_folder(tmp_path, "first")
+    assert not any(result.cached for result in run([first], manifest, stub))
+    assert sorted(get_ran(first)) == [0, 1, 2, 3]
+    assert len(manifest) == 4
+
+    # An identical folder links the results instead of running.
+    second = make_folder(tmp_path, "second")
+    finished = run([second], manifest, stub)
+    assert [(result.runs, result.cached) for result in finished] == [
+        ((0, 3), True)
+    ]
+    assert get_ran(second) == []
+    link = os.path.join(second.root_dir, "results", "Sweep-#2.vec")
+    assert os.path.realpath(link) == os.path.join(
+        first.root_dir, "results", "Sweep-#2.vec"
+    )
+
+    # The manifest is read back from disk.
+    manifest = results.ResultsManifest(manifest.path)
+    assert len(manifest) == 4
+
+    # Truncated results are run again.
+    vector = os.path.join(first.root_dir, "results", "Sweep-#1.vec")
+    with open(vector, "r+") as file:
+        file.truncate(os.path.getsize(vector) - 3)
+    third = make_folder(tmp_path, "third")
+    finished = run([third], manifest, stub)
+    assert get_ran(third) == [1]
+    assert [(result.runs, result.cached) for result in finished] == [
+        ((0, 0), True),
+        ((1, 1), False),
+        ((2, 3), True),
+    ]
+
+    # Other parameters have other keys.
+    other = make_folder(tmp_path, "other", "**.x = 2\n")
+    run([other], manifest, stub)
+    assert sorted(get_ran(other)) == [0, 1, 2, 3]
+
+
+def test_run_simulations_manifest(tmp_path):
+    stub = tmp_path / "stub.py"
+    stub.write_text(
+        STUB.replace(
+            'sys.argv[sys.argv.index("-r") + 1].split("..")', '["0", "3"]'
+        )
+    )
+    manifest = results.ResultsManifest(str(tmp_path / results.MANIFEST_FILE))
+
+    first = make_folder(tmp_path, "first")
+    second = make_folder(tmp_path, "second")
+    kwargs = dict(
+        simulator=[sys.executable, str(stub)],
+        estimate=lambda simulation: 1,
+        config="Sweep",
+        manifest=manifest,
+    )
+    assert not runner.run_simulations([first], **kwargs)[0].cached
+    finished = runner.run_simulations([first, second], **kwargs)
+    assert [result.cached for result in finished] == [True, True]
+    assert get_ran(second) == []
+
+
+def test_record_results_changed_itervars(tmp_path):
+    stub = tmp_path / "stub.py"
+    # Results are named after the loads, as with OMNeT++'s default
+    # ${configname}-${iterationvarsf}#${repetition} file names.
+    stub.write_text(
+        STUB.replace(
+            'name = f"results/{config}-#{run}"',
+            'loads = open("loads").read().split()\n'
+            '    if loads[run] == "-":\n'
+            "        continue\n"
+            '    name = f"results/{config}-load={loads[run]}-#{run}"',
+        )
+    )
+    manifest = results.ResultsManifest(str(tmp_path / results.MANIFEST_FILE))
+    simulation = make_folder(tmp_path, "first")
+    ini = os.path.join(simulation.root_dir, "omnetpp.ini")
+    loads = os.path.join(simulation.root_dir, "loads")
+
+    with open(loads, "w") as file:
+        file.write("10 20 30 40")
+    run([simulation], manifest, stub)
+    assert len(manifest) == 4
+
+    # The second loads leave no file for run 1.
+    with open(ini, "w") as file:
+        file.write(INI.replace("10..40", "50..80"))
+    with open(loads, "w") as file:
+        file.write("50 - 70 80")
+    run([simulation], manifest, stub)
+
+    keys = results.get_run_keys(simulation, "Sweep", range(4))
+    assert keys[1] not in manifest
+    for run_number in (0, 2, 3):
+        names = [
+            os.path.basename(record["path"])
+            for record in manifest.get_entry(keys[run_number])["files"]
+        ]
+        load = 50 + 10 * run_number
+        assert names == [
+            f"Sweep-load={load}-#{run_number}.sca",
+            f"Sweep-load={load}-#{run_number}.vec",
+        ]
+
+
+def test_reuse_sweep(tmp_path):
+    stub = tmp_path / "stub.py"
+    stub.write_text(STUB)
+    out_root = tmp_path / "sweep"
+    (out_root / "TrafficConfigurations").mkdir(parents=True)
+    (out_root / "TrafficConfigurations" / "PortPFC.ini").write_text(
+        "[Config IB_NDR]\n"
+    )
+    spec = {"network": "RLFT", "arity": 2, "stages": 2, "num_queues": [1, 2]}
+    swept = oi.generate_sweep(spec, str(out_root), workers=1)
+    manifest = results.ResultsManifest(str(tmp_path / results.MANIFEST_FILE))
+
+    pending = runner.reuse_sweep(swept, manifest)
+    assert [simulation.root_dir for simulation in pending] == [
+        os.path.dirname(sweep_result.path) for sweep_result in swept
+    ]
+    runner.run_batches(
+        pending[:1],
+        simulator=[sys.executable, str(stub)],
+        estimate=lambda simulation: 1,
+        manifest=manifest,
+    )
+    assert get_ran(pending[0]) == [0]
+
+    pending = runner.reuse_sweep(swept, manifest)
+    assert [simulation.root_dir for simulation in pending] == [
+        os.path.dirname(swept[1].path)
+    ]
+
+
+def test_check_result_file(tmp_path):
+    path = tmp_path / "General-#0.sca"
+    path.write_text("version 3\nrun General-0\nattr runnumber 0\n")
+    assert results.check_result_file(str(path))
+    assert results.read_result_header(str(path)) == {
+        "version": "3",
+        "run": "General-0",
+        "runnumber": "0",
+    }
+
+    path.write_text("version 3\nrun General-0\nscalar Net x")
+    assert not results.check_result_file(str(path))
+
+    vector = tmp_path / "General-#0.vec"
+    vector.write_text("version 3\n")
+    assert not results.check_result_file(str(vector))
+    (tmp_path / "General-#0.vci").write_text("version 3\nfile 10 0\n")
+    assert results.check_result_file(str(vector))
+    vector.write_text("version 3\n0\t1\n")
+    assert not results.check_result_file(str(vector))
+
+
+def test_get_effective_hash(tmp_path):
+    simulation = make_folder(tmp_path, "first")
+    digest = oi.get_effective_hash(simulation, "Sweep")
+
+    ini = os.path.join(simulation.root_dir, "omnetpp.ini")
+    with open(ini, "a") as file:
+        file.write("# A comment\n")
+    assert oi.get_effective_hash(simulation, "Sweep") == digest
+
+    with open(os.path.join(simulation.root_dir, "params.ini"), "w") as file:
+        file.write("**.x = 1\n# Included comment\n")
+    assert oi.get_effective_hash(simulation, "Sweep") != digest
@@ -0,0 +1,262 @@
+import json
+import os
+import sys
+
+import pytest
+
+import opp_ini as oi
+from opp_ini import results, runner
+
+STUB = """\
+import os, sys, time
+start = time.time()
+time.sleep(0.2)
+with open("times.txt", "w") as file:
+    file.write(f"{start} {time.time()}")
+print(" ".join(sys.argv[1:]))
+print("stub error", file=sys.stderr)
+sys.exit(3 if os.path.exists("fail") else 0)
+"""
+
+
+def make_simulations(tmp_path, count):
+    traffic = tmp_path / "TrafficConfigurations"
+    traffic.mkdir(exist_ok=True)
+    (traffic / "PortPFC.ini").write_text("[Config IB_NDR]\n")
+    simulations = []
+    for index in range(count):
+        root_dir = tmp_path / f"simulation{index}"
+        root_dir.mkdir()
+        simulation = oi.build_simulation(
+            {
+                "arity": 2,
+                "stages": 2 + index,
+                "arbiter": "WRR",
+                "queue_scheme": "voqsw",
+                "num_queues": 4,
+                "load": (10, 100, 10),
+            },
+            str(root_dir),
+        )
+        oi.set_new_configuration(simulation)
+        simulations.append(simulation)
+    return simulations
+
+
+def get_times(simulation):
+    with open(os.path.join(simulation.root_dir, "times.txt")) as file:
+        return [float(value) for value in file.read().split()]
+
+
+def test_run_simulations(tmp_path):
+    stub = tmp_path / "stub.py"
+    stub.write_text(STUB)
+    simulations = make_simulations(tmp_path, 3)
+    open(os.path.join(simulations[1].root_dir, "fail"), "w").close()
+
+    results = runner.run_simulations(
+        simulations, max_procs=3, simulator=[sys.executable, str(stub)]
+    )
+
+    assert [result.returncode for result in results] == [0, 3, 0]
+    for simulation, result in zip(simulations, results):
+        assert result.simulation is simulation
+        assert result.seconds >= 0.2
+        with open(result.stdout) as file:
+            assert file.read().split() == [
+                "-u",
+                "Cmdenv",
+                "-c",
+                "portConfig",
+                "omnetpp.ini",
+            ]
+        with open(result.stderr) as file:
+            assert file.read() == "stub error\n"
+        log = os.path.join(simulation.root_dir, runner.LOG_DIR, "runs.jsonl")
+        with open(log) as file:
+            record = json.loads(file.readline())
+        assert record["returncode"] == result.returncode
+
+    # The three runs overlap.
+    times = [get_times(simulation) for simulation in simulations]
+    assert max(start for start, _ in times) < min(end for _, end in times)
+
+
+def test_run_simulations_memory(tmp_path):
+    stub = tmp_path / "stub.py"
+    stub.write_text(STUB)
+    simulations = make_simulations(tmp_path, 3)
+
+    # Only one of the runs fits in the budget at a time.
+    results = runner.run_simulations(
+        simulations,
+        max_procs=3,
+        mem_budget=150,
+        simulator=[sys.executable, str(stub)],
+        estimate=lambda simulation: 100,
+    )
+
+    assert [result.returncode for result in results] == [0, 0, 0]
+    times = sorted(get_times(simulation) for simulation in simulations)
+    for (_, end), (start, _) in zip(times, times[1:]):
+        assert end <= start
+
+    with pytest.raises(FileNotFoundError):
+        runner.run_simulations(simulations, simulator="no-such-opp_run")
+
+
+def test_run_simulations_log_error(tmp_path):
+    stub = tmp_path / "stub.py"
+    stub.write_text(STUB)
+    simulations = make_simulations(tmp_path, 2)
+    os.makedirs(
+        os.path.join(simulations[0].root_dir, runner.LOG_DIR, runner.RUN_LOG)
+    )
+
+    with pytest.raises(IsADirectoryError):
+        runner.run_simulations(
+            simulations, max_procs=1, simulator=[sys.executable, str(stub)]
+        )
+
+
+def test_run_simulations_default_config(tmp_path):
+    stub = tmp_path / "stub.py"
+    stub.write_text(STUB)
+    simulation = make_simulations(tmp_path, 1)[0]
+    manifest = results.ResultsManifest(str(tmp_path / results.MANIFEST_FILE))
+
+    # set_new_configuration files only have the portConfig section.
+    assert runner.get_config_name(simulation) == "portConfig"
+    assert runner.count_runs(simulation) == 1
+    (result,) = runner.run_simulations(
+        [simulation], simulator=[sys.executable, str(stub)], manifest=manifest
+    )
+    assert result.returncode == 0
+    assert result.command[-3:] == ["-c", "portConfig", "omnetpp.ini"]
+
+    # add_new_configuration sections are run by name.
+    config_name = oi.add_new_configuration(simulation)
+    assert runner.get_config_name(simulation) == config_name
+    assert runner.get_config_name(simulation, "portConfig") == "portConfig"
+
+
+BATCH_STUB = """\
+import os, sys
+runs = sys.argv[sys.argv.index("-r") + 1].split("..")
+failing = open("fail").read().split() if os.path.exists("fail") else []
+for run in range(int(runs[0]), int(runs[-1]) + 1):
+    print(f"Preparing for running configuration X, run #{run}...")
+    with open("ran.txt", "a") as file:
+        file.write(f"{run}\\n")
+    if str(run) in failing:
+        sys.exit(1)
+"""
+
+
+def get_ran(simulation):
+    with open(os.path.join(simulation.root_dir, "ran.txt")) as file:
+        return [int(run) for run in file.read().split()]
+
+
+def test_run_batches(tmp_path):
+    stub = tmp_path / "stub.py"
+    stub.write_text(BATCH_STUB)
+    simulator = [sys.executable, str(stub)]
+    simulation = make_simulations(tmp_path, 1)[0]
+    runner.set_loads(simulation, range(10, 110, 10))
+
+    # A single run is timed first, then the rest is split between 2 procs.
+    results = runner.run_batches(
+        [simulation], max_procs=2, simulator=simulator
+    )
+    assert [result.runs for result in results] == [(0, 0), (1, 5), (6, 9)]
+    assert all(result.returncode == 0 for result in results)
+    assert sorted(get_ran(simulation)) == list(range(10))
+    assert results[1].command[-5:] == [
+        "-c",
+        "portConfig",
+        "-r",
+        "1..5",
+        "omnetpp.ini",
+    ]
+    assert runner.get_run_seconds(simulation) > 0
+
+    # The run log of the folder is used from then on.
+    results = runner.run_batches(
+        [simulation], max_procs=2, simulator=simulator
+    )
+    assert [result.runs for result in results] == [(0, 4), (5, 9)]
+
+
+def test_run_batches_duration(tmp_path):
+    stub = tmp_path / "stub.py"
+    stub.write_text(BATCH_STUB)
+    simulation = make_simulations(tmp_path, 1)[0]
+    os.makedirs(os.path.join(simulation.root_dir, runner.LOG_DIR))
+    log = os.path.join(simulation.root_dir, runner.LOG_DIR, "runs.jsonl")
+    with open(log, "w") as file:
+        record = {
+            "config": "portConfig",
+            "runs": [0, 1],
+            "returncode": 0,
+            "seconds": 20,
+        }
+        file.write(json.dumps(record) + "\n")
+
+    results = runner.run_batches(
+        [simulation],
+        max_procs=1,
+        simulator=[sys.executable, str(stub)],
+        batch_seconds=30,
+        runs=lambda simulation, config: 10,
+    )
+
+    assert [result.runs for result in results] == [
+        (0, 2),
+        (3, 5),
+        (6, 8),
+        (9, 9),
+    ]
+
+
+def test_run_batches_failure(tmp_path):
+    stub = tmp_path / "stub.py"
+    stub.write_text(BATCH_STUB)
+    simulation = make_simulations(tmp_path, 1)[0]
+    with open(os.path.join(simulation.root_dir, "fail"), "w") as file:
+        file.write("6")
+
+    results = runner.run_batches(
+        [simulation],
+        max_procs=1,
+        simulator=[sys.executable, str(stub)],
+        runs=lambda simulation, config: 10,
+    )
+
+    assert [(result.runs, result.retried) for result in results] == [
+        ((0, 0), False),
+        ((1, 9), True),
+        ((6, 6), False),
+        ((7, 9), False),
+    ]
+    failed = [
+        result.runs
+        for result in results
+        if result.returncode != 0 and not result.retried
+    ]
+    assert failed == [(6, 6)]
+    assert get_ran(simulation) == [0, 1, 2, 3, 4, 5, 6, 6, 7, 8, 9]
+
+
+def test_count_runs(tmp_path):
+    with open(tmp_path / "omnetpp.ini", "w") as file:
+        file.write(
+            "[General]\n"
+            "[Config Sweep]\n"
+            "**.load = ${load=10..100 step 10}\n"
+            "repeat = 2\n"
+        )
+    simulation = oi.Simulation()
+    simulation.root_dir = str(tmp_path)
+
+    assert runner.count_runs(simulation, "Sweep") == 20
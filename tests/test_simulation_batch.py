@@ -0,0 +1,109 @@
+import os
+
+import pytest
+
+import opp_ini as oi
+
+SPEC = {
+    "network": "RLFT",
+    "arity": [2, 4],
+    "stages": [2, 3],
+    "architecture": ["IB_NDR", "BXI3"],
+    "arbiter": ["WRR", "RR"],
+    "queue_scheme": "voqsw",
+    "num_queues": [1, 4],
+    "load": (10, 100, 10),
+}
+
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(oi, "np", None)
+    return request.param
+
+
+def test_from_spec(backend):
+    batch = oi.SimulationBatch.from_spec(SPEC)
+    points = list(oi.iter_sweep_points(SPEC))
+
+    assert len(batch) == 32
+    assert list(batch.iter_points()) == points
+    assert batch.get_point(-1) == points[-1]
+    assert batch.get_categories("arbiter") == ["WRR", "RR"]
+    assert list(batch.get_codes("arbiter"))[:4] == [0, 0, 1, 1]
+    assert oi.SimulationBatch.from_points(points).get_point(5) == points[5]
+
+    names = [oi.set_configuration_name(oi.build_simulation(p)) for p in points]
+    assert batch.get_config_names() == names
+    assert oi.set_configuration_name(batch[3]) == names[3]
+
+
+def test_filter_and_sort(backend):
+    batch = oi.SimulationBatch.from_spec(SPEC)
+
+    mask = batch.get_mask("arity", ">=", 4)
+    selected = batch.filter(mask).filter(
+        batch.filter(mask).get_mask("arbiter", "in", ["RR"])
+    )
+    assert len(selected) == 8
+    assert all(
+        p["arity"] == 4 and p["arbiter"] == "RR"
+        for p in selected.iter_points()
+    )
+    assert len(batch.filter(batch.get_mask("arbiter", "!=", "WRR"))) == 16
+    assert len(batch.filter(batch.get_mask("routing", "=", "xy"))) == 0
+
+    ordered = batch.sort(("arbiter", "num_queues"), reverse=True)
+    assert [p["arbiter"] for p in ordered.iter_points()][:16] == ["WRR"] * 16
+    assert ordered.get_point(0)["num_queues"] == 4
+    assert list(batch.sort("arity").get_column("arity")) == [2] * 16 + [4] * 16
+    assert list(batch.get_column("queue_scheme"))[:2] == ["voqsw", "voqsw"]
+
+
+def test_generate_sweep_from_batch(tmp_path):
+    batch = oi.SimulationBatch.from_spec(SPEC)
+    batch = batch.filter(batch.get_mask("num_queues", "=", 4))
+
+    results = oi.generate_sweep(batch, str(tmp_path), workers=1)
+
+    assert len(results) == 16
+    assert [r.config_name for r in results] == ["portConfig"] * 16
+    simulations = [
+        oi.build_simulation(r.point, os.path.dirname(r.path)) for r in results
+    ]
+    assert [oi.check_configuration(s) for s in simulations] == (
+        batch.get_config_names()
+    )
+
+
+def test_generate_sweep_from_batch_workers(tmp_path):
+    batch = oi.SimulationBatch.from_spec(SPEC)
+    batch = batch.take(list(range(len(batch))) * 2)
+    constraints = [oi.valid_num_queues, oi.max_nodes(16)]
+
+    serial = oi.generate_sweep(batch, str(tmp_path / "serial"), 1, constraints)
+    parallel = oi.generate_sweep(
+        batch, str(tmp_path / "parallel"), 2, constraints
+    )
+    expected = oi.generate_sweep(SPEC, str(tmp_path / "spec"), 1, constraints)
+
+    assert len(serial) == len(expected) < len(batch) // 2
+    for results in (serial, parallel):
+        assert [r.index for r in results] == [r.index for r in expected]
+        assert [batch.get_point(r.index) for r in results] == [
+            r.point for r in results
+        ]
+        assert [r.point for r in results] == [r.point for r in expected]
+        assert [
+            os.path.basename(os.path.dirname(r.path)) for r in results
+        ] == [os.path.basename(os.path.dirname(r.path)) for r in expected]
+
+
+def test_unknown_axes():
+    with pytest.raises(ValueError):
+        oi.SimulationBatch.from_spec({"nodes": 4})
+    with pytest.raises(ValueError):
+        oi.SimulationBatch().append({"nodes": 4})
@@ -0,0 +1,92 @@
+import os
+
+import opp_ini as oi
+
+
+def configure(simulation):
+    simulation.set_topo(oi.RLFT())
+    simulation.topology.set_nodes(2, 2)
+
+    simulation.set_sw(oi.IB_NDR())
+    simulation.switch.set_arbiter("WRR")
+    simulation.switch.set_queue_scheme("1q")
+    simulation.switch.set_num_queues(1)
+    return simulation
+
+
+def test_simulation_hash(make_simulation):
+    first = configure(make_simulation())
+    second = configure(make_simulation())
+
+    assert oi.simulation_hash(first) == oi.simulation_hash(second)
+
+    second.switch.set_num_queues(2)
+    assert oi.simulation_hash(first) != oi.simulation_hash(second)
+
+
+def test_simulation_hash_includes(tmp_path, make_simulation):
+    simulation = configure(make_simulation(name="RLFT"))
+    traffic = str(tmp_path / "TrafficConfigurations")
+    os.makedirs(traffic)
+    before = oi.simulation_hash(simulation)
+
+    with open(os.path.join(traffic, "PortPFC.ini"), "w") as file:
+        file.write("**.pfc = true\n")
+    created = oi.simulation_hash(simulation)
+    assert created != before
+
+    with open(os.path.join(traffic, "PortPFC.ini"), "w") as file:
+        file.write("**.pfc = false\n")
+    assert oi.simulation_hash(simulation) not in (before, created)
+
+
+def test_set_new_configuration_skips_identical(make_simulation):
+    simulation = configure(make_simulation())
+    opp_file = os.path.join(simulation.root_dir, "omnetpp.ini")
+
+    assert oi.set_new_configuration(simulation)
+    assert oi.get_configuration_hash(simulation) == (
+        oi.simulation_hash(simulation)
+    )
+    mtime = os.stat(opp_file).st_mtime_ns
+
+    assert not oi.set_new_configuration(simulation)
+    assert os.stat(opp_file).st_mtime_ns == mtime
+    assert os.listdir(simulation.root_dir) == ["omnetpp.ini"]
+
+    simulation.switch.set_arbiter("RR")
+    assert oi.set_new_configuration(simulation)
+    assert oi.get_switch_arbiter(simulation) == '"RR"'
+
+
+def test_set_new_configuration_after_patch(make_simulation):
+    simulation = configure(make_simulation())
+    simulation.switch.set_arbiter("RR")
+    assert oi.set_new_configuration(simulation)
+
+    oi.patch_parameter(
+        simulation, "General", "**.SW[*].arbiter.typename", '"WRR"'
+    )
+    assert oi.get_configuration_hash(simulation) is None
+    assert oi.set_new_configuration(simulation)
+    assert oi.get_switch_arbiter(simulation) == '"RR"'
+    assert oi.get_configuration_hash(simulation) == (
+        oi.simulation_hash(simulation)
+    )
+
+    # Edits that keep the hash line are caught by the contents too.
+    opp_file = os.path.join(simulation.root_dir, "omnetpp.ini")
+    with open(opp_file) as file:
+        text = file.read()
+    with open(opp_file, "w") as file:
+        file.write(text.replace('"RR"', '"WRR"'))
+    assert oi.set_new_configuration(simulation)
+    assert oi.get_switch_arbiter(simulation) == '"RR"'
+
+
+def test_generate_sweep_skips_identical(tmp_path):
+    spec = {"network": "RLFT", "arity": [2, 4], "stages": 2, "num_queues": 1}
+    out_root = str(tmp_path)
+
+    assert all(r.written for r in oi.generate_sweep(spec, out_root, 1))
+    assert not any(r.written for r in oi.generate_sweep(spec, out_root, 1))
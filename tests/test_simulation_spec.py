@@ -0,0 +1,58 @@
+import pytest
+
+import opp_ini as oi
+
+
+def configure(simulation):
+    simulation.set_topo(oi.Torus2D())
+    simulation.topology.set_dim1(4)
+    simulation.topology.set_dim2(8)
+
+    simulation.set_sw(oi.BXI3())
+    simulation.switch.set_arbiter("WRR")
+    simulation.switch.set_queue_scheme("voqsw")
+    simulation.switch.set_num_queues(4)
+
+    simulation.app.set_load(10, 100, 10)
+    return simulation
+
+
+def test_simulation_spec(make_simulation):
+    simulation = configure(make_simulation())
+    spec = simulation.freeze()
+
+    assert spec == oi.SimulationSpec.from_simulation(simulation)
+    assert spec.topology.nodes == 32
+    assert spec.switch.architecture == "BXI3"
+    copy = oi.SimulationSpec(
+        spec.topology, spec.switch, spec.app, spec.root_dir
+    )
+    assert {spec: 1}[copy] == 1
+    assert not hasattr(spec, "__dict__")
+
+    with pytest.raises(AttributeError):
+        spec.topology.nodes = 4
+
+
+def test_simulation_spec_round_trip(make_simulation):
+    simulation = configure(make_simulation())
+    spec = simulation.freeze()
+    thawed = spec.to_simulation()
+
+    assert isinstance(thawed.topology, oi.Torus2D)
+    assert isinstance(thawed.switch, oi.BXI3)
+    assert thawed.freeze() == spec
+    assert oi.set_configuration_name(spec) == (
+        oi.set_configuration_name(simulation)
+    )
+    assert oi.simulation_hash(spec) == oi.simulation_hash(simulation)
+    assert oi.render_configuration(spec) == (
+        oi.render_configuration(simulation)
+    )
+
+
+def test_no_lifecycle_output(capsys, make_simulation):
+    simulation = configure(make_simulation())
+    del simulation
+
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,94 @@
+import os
+
+import opp_ini as oi
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as file:
+        file.write(text)
+
+
+def read(path):
+    with open(path) as file:
+        return file.read()
+
+
+def test_snapshot_simulation(make_simulation):
+    simulation = make_simulation()
+    opp_file = os.path.join(simulation.root_dir, "omnetpp.ini")
+    results = os.path.join(simulation.root_dir, "results", "General-0.sca")
+    write(opp_file, "[General]\n# Configuration: a\n")
+    write(results, "scalar 1\n")
+
+    first = oi.snapshot_simulation(simulation, "before")
+    assert first.stats["linked"] == 0
+    assert set(first.files) == {
+        "omnetpp.ini",
+        os.path.join("results", "General-0.sca"),
+    }
+
+    write(opp_file, "[General]\n# Configuration: b\n")
+    second = oi.snapshot_simulation(simulation)
+    assert second.stats["linked"] == 1
+    assert second.stats["cloned"] + second.stats["copied"] == 1
+    shared = os.path.join(second.path, "results", "General-0.sca")
+    assert os.stat(shared).st_nlink == 2
+
+    snapshots = oi.get_snapshots(simulation)
+    assert [s.snapshot_id for s in snapshots] == ["000001", "000002"]
+    assert snapshots[0].label == "before"
+
+    write(results, "scalar 2\n")
+    write(os.path.join(simulation.root_dir, "extra.ini"), "")
+    oi.restore_snapshot(simulation, first.snapshot_id)
+
+    assert read(opp_file) == "[General]\n# Configuration: a\n"
+    assert read(results) == "scalar 1\n"
+    assert not os.path.exists(os.path.join(simulation.root_dir, "extra.ini"))
+    assert oi.check_configuration(simulation) == "a"
+    assert read(os.path.join(second.path, "omnetpp.ini")) == (
+        "[General]\n# Configuration: b\n"
+    )
+
+    oi.restore_snapshot(simulation)
+    assert oi.check_configuration(simulation) == "b"
+
+
+def test_restore_snapshot_keeps_history(tmp_path):
+    simulation = oi.Simulation()
+    simulation.root_dir = str(tmp_path)
+    opp_file = tmp_path / "omnetpp.ini"
+    write(str(opp_file), "[General]\n# Configuration: a\n")
+    os.symlink("omnetpp.ini", tmp_path / "current.ini")
+    os.symlink("missing.ini", tmp_path / "dangling.ini")
+    os.makedirs(tmp_path / "shared")
+    os.symlink("shared", tmp_path / "linked")
+
+    snapshot = oi.snapshot_simulation(simulation)
+    assert snapshot.stats["symlinked"] == 3
+
+    oi.backup_configuration(simulation)
+    write(str(opp_file), "[General]\n# Configuration: b\n")
+    oi.backup_configuration(simulation)
+    os.remove(tmp_path / "current.ini")
+    write(str(tmp_path / "current.ini"), "not a link\n")
+    oi.restore_snapshot(simulation)
+
+    assert oi.check_configuration(simulation) == "a"
+    assert os.readlink(tmp_path / "current.ini") == "omnetpp.ini"
+    assert os.readlink(tmp_path / "dangling.ini") == "missing.ini"
+    assert os.readlink(tmp_path / "linked") == "shared"
+    versions = oi.BackupStore(str(tmp_path)).get_versions()
+    assert [version.version for version in versions] == [1, 2]
+
+
+def test_snapshot_after_interrupted(make_simulation):
+    simulation = make_simulation("[General]\n# Configuration: a\n")
+    first = oi.snapshot_simulation(simulation)
+    os.remove(os.path.join(first.path, "manifest.json"))
+    assert oi.get_snapshots(simulation) == []
+
+    second = oi.snapshot_simulation(simulation)
+    assert second.snapshot_id == "000002"
+    assert [s.snapshot_id for s in oi.get_snapshots(simulation)] == ["000002"]